@@ -1,6 +1,12 @@
 import math
 import numpy as np
-from src.rendering.matrix import vec3, normalize, length, lookAt, perspective, radians, cross
+from src.rendering.matrix import perspective, mat4
+from src.rendering._fastmath import fill_lookat
+
+# Default camera placement, restored by Camera.reset()
+_DEFAULT_POS = np.array([0.0, 2.0, 5.0], dtype=np.float32)
+_DEFAULT_TGT = np.array([0.0, 0.0, 0.0], dtype=np.float32)
+_DEFAULT_UP = np.array([0.0, 1.0, 0.0], dtype=np.float32)
 
 class Camera:
     """
@@ -8,16 +14,18 @@ class Camera:
     """
     def __init__(self):
         # Camera position in world space
-        self._position = np.array([0.0, 2.0, 5.0], dtype=np.float32)
+        self._position = _DEFAULT_POS.copy()
         
         # Camera target point
-        self._target = np.array([0.0, 0.0, 0.0], dtype=np.float32)
+        self._target = _DEFAULT_TGT.copy()
         
         # Up vector
-        self._up = np.array([0.0, 1.0, 0.0], dtype=np.float32)
+        self._up = _DEFAULT_UP.copy()
+        self._up_is_y = True  # Enables the closed-form orbit view update
         
-        # Field of view in degrees
+        # Field of view in degrees (and cached in radians for perspective())
         self._fov = 45.0
+        self._fov_radians = math.radians(self._fov)
         
         # Aspect ratio (width/height)
         self._aspect_ratio = 16.0 / 9.0
@@ -34,9 +42,14 @@ class Camera:
         self._movement_speed = 0.1
         self._rotation_speed = 0.2
         
+        # Scratch buffer reused by rotate() and pan() to avoid per-event allocations
+        self._pos_scratch = np.empty(3, dtype=np.float32)
+        
         # View matrices
-        self._view_matrix = self._calculate_view_matrix()
-        self._projection_matrix = self._calculate_projection_matrix()
+        self._view_matrix = mat4()
+        self._projection_key = None  # (fov, aspect, near, far) of the current projection
+        self._update_view()
+        self._update_projection()
     
     @property
     def position(self):
@@ -44,8 +57,8 @@ class Camera:
     
     @position.setter
     def position(self, position):
-        self._position = np.array(position, dtype=np.float32)
-        self._update_matrices()
+        self._position[:] = position
+        self._update_view()
     
     @property
     def target(self):
@@ -53,8 +66,8 @@ class Camera:
     
     @target.setter
     def target(self, target):
-        self._target = np.array(target, dtype=np.float32)
-        self._update_matrices()
+        self._target[:] = target
+        self._update_view()
     
     @property
     def up(self):
@@ -62,8 +75,9 @@ class Camera:
     
     @up.setter
     def up(self, up):
-        self._up = np.array(up, dtype=np.float32)
-        self._update_matrices()
+        self._up[:] = up
+        self._up_is_y = bool(self._up[0] == 0.0 and self._up[1] > 0.0 and self._up[2] == 0.0)
+        self._update_view()
     
     @property
     def fov(self):
@@ -72,7 +86,8 @@ class Camera:
     @fov.setter
     def fov(self, fov):
         self._fov = max(1.0, min(120.0, fov))  # Clamp between 1 and 120 degrees
-        self._update_matrices()
+        self._fov_radians = math.radians(self._fov)
+        self._update_projection()
     
     @property
     def aspect_ratio(self):
@@ -81,7 +96,7 @@ class Camera:
     @aspect_ratio.setter
     def aspect_ratio(self, aspect_ratio):
         self._aspect_ratio = max(0.1, aspect_ratio)  # Ensure positive aspect ratio
-        self._update_matrices()
+        self._update_projection()
     
     @property
     def view_matrix(self):
@@ -93,12 +108,20 @@ class Camera:
     
     def reset(self):
         """Reset camera to default position and orientation"""
-        self._position = np.array([0.0, 2.0, 5.0], dtype=np.float32)
-        self._target = np.array([0.0, 0.0, 0.0], dtype=np.float32)
-        self._up = np.array([0.0, 1.0, 0.0], dtype=np.float32)
+        # Already at the defaults (e.g. right after loading): nothing to rebuild
+        if (self._yaw == -90.0 and self._pitch == 0.0
+                and np.array_equal(self._position, _DEFAULT_POS)
+                and np.array_equal(self._target, _DEFAULT_TGT)
+                and np.array_equal(self._up, _DEFAULT_UP)):
+            return
+        
+        self._position[:] = _DEFAULT_POS
+        self._target[:] = _DEFAULT_TGT
+        self._up[:] = _DEFAULT_UP
+        self._up_is_y = True
         self._yaw = -90.0
         self._pitch = 0.0
-        self._update_matrices()
+        self._update_view()
     
     def rotate(self, yaw_offset, pitch_offset):
         """
@@ -108,24 +131,41 @@ class Camera:
             yaw_offset: Change in horizontal angle (degrees)
             pitch_offset: Change in vertical angle (degrees)
         """
+        if yaw_offset == 0.0 and pitch_offset == 0.0:
+            return
+        
         self._yaw += yaw_offset * self._rotation_speed
         self._pitch += pitch_offset * self._rotation_speed
         
         # Clamp pitch to avoid flipping
         self._pitch = max(-89.0, min(89.0, self._pitch))
         
+        # Current distance to the target
+        position = self._position
+        target = self._target
+        dx = float(position[0] - target[0])
+        dy = float(position[1] - target[1])
+        dz = float(position[2] - target[2])
+        radius = math.sqrt(dx * dx + dy * dy + dz * dz)
+        
         # Convert spherical to Cartesian coordinates
-        radius = np.linalg.norm(self._position - self._target)
         pitch_rad = math.radians(self._pitch)
         yaw_rad = math.radians(self._yaw)
+        cp, sp = math.cos(pitch_rad), math.sin(pitch_rad)
+        cy, sy = math.cos(yaw_rad), math.sin(yaw_rad)
         
-        x = radius * math.cos(pitch_rad) * math.cos(yaw_rad)
-        y = radius * math.sin(pitch_rad)
-        z = radius * math.cos(pitch_rad) * math.sin(yaw_rad)
+        offset = self._pos_scratch
+        offset[0] = radius * cp * cy
+        offset[1] = radius * sp
+        offset[2] = radius * cp * sy
         
         # Update position relative to target
-        self._position = self._target + np.array([x, y, z], dtype=np.float32)
-        self._update_matrices()
+        np.add(target, offset, out=position)
+        
+        if self._up_is_y:
+            self._orbit_view(cp, sp, cy, sy)
+        else:
+            self._update_view()
     
     def pan(self, offset_x, offset_y):
         """
@@ -135,21 +175,25 @@ class Camera:
             offset_x: Horizontal movement
             offset_y: Vertical movement
         """
-        # Calculate right and up vectors in world space
-        forward = normalize(self._target - self._position)
-        right = normalize(cross(forward, self._up))
-        up = normalize(cross(right, forward))
+        if offset_x == 0.0 and offset_y == 0.0:
+            return
         
-        # Scale by movement speed
-        right_offset = right * offset_x * self._movement_speed
-        up_offset = up * offset_y * self._movement_speed
+        # The rows of the view rotation are the camera's right and up vectors
+        # in world space, so the basis does not need to be recomputed here
+        view = self._view_matrix
+        right_amount = offset_x * self._movement_speed
+        up_amount = offset_y * self._movement_speed
         
         # Move both position and target
-        offset = right_offset + up_offset
+        offset = self._pos_scratch
+        offset[:] = view[0, :3] * right_amount + view[1, :3] * up_amount
         self._position += offset
         self._target += offset
         
-        self._update_matrices()
+        # The view direction is unchanged; in camera space the eye moved by
+        # (right_amount, up_amount, 0), so only the translation shifts
+        view[0, 3] -= right_amount
+        view[1, 3] -= up_amount
     
     def zoom(self, amount):
         """
@@ -158,19 +202,28 @@ class Camera:
         Args:
             amount: Zoom amount (positive = zoom in, negative = zoom out)
         """
-        direction = normalize(self._target - self._position)
+        if amount == 0.0:
+            return
         
-        # Move along the view direction
-        offset = direction * amount * self._movement_speed * 5.0
+        position = self._position
+        target = self._target
+        dx = float(target[0] - position[0])
+        dy = float(target[1] - position[1])
+        dz = float(target[2] - position[2])
+        current = math.sqrt(dx * dx + dy * dy + dz * dz)
+        if current < 1e-10:
+            return
         
-        # Calculate new position
-        new_position = self._position + offset
+        # Move along the view direction (as a fraction of the current distance)
+        step = amount * self._movement_speed * 5.0 / current
         
         # Only update if we're not too close or too far
-        distance = np.linalg.norm(new_position - self._target)
+        distance = current * abs(1.0 - step)
         if 0.5 < distance < 100.0:
-            self._position = new_position
-            self._update_matrices()
+            position[0] += dx * step
+            position[1] += dy * step
+            position[2] += dz * step
+            self._update_view()
     
     def orbit(self, delta_x, delta_y):
         """
@@ -182,19 +235,40 @@ class Camera:
         """
         self.rotate(delta_x, delta_y)
     
-    def _update_matrices(self):
-        """Update view and projection matrices"""
-        self._view_matrix = self._calculate_view_matrix()
-        self._projection_matrix = self._calculate_projection_matrix()
+    def _update_view(self):
+        """Update the view matrix (position, target or up changed)"""
+        fill_lookat(self._view_matrix, self._position, self._target, self._up)
     
-    def _calculate_view_matrix(self):
-        """Calculate the view matrix"""
-        return lookAt(self._position, self._target, self._up)
+    def _orbit_view(self, cp, sp, cy, sy):
+        """
+        Write the view matrix for an orbit position in closed form
+        
+        Equivalent to lookAt() for a world Y up vector, using the pitch/yaw
+        cosines and sines already computed by rotate().
+        """
+        view = self._view_matrix
+        rot = view[:3, :3]
+        rot[0] = (sy, 0.0, -cy)               # side
+        rot[1] = (-cy * sp, cp, -sy * sp)     # up
+        rot[2] = (cp * cy, sp, cp * sy)       # -forward
+        view[:3, 3] = -rot.dot(self._position)
+    
+    def _update_projection(self):
+        """Update the projection matrix (fov or aspect ratio changed)"""
+        # Resize events often repeat the current size; keep the matrix then
+        key = (self._fov_radians, self._aspect_ratio, self._near, self._far)
+        if key == self._projection_key:
+            return
+        self._projection_key = key
+        
+        # Shared with the renderer and picking, so replaced rather than modified
+        self._projection_matrix = self._calculate_projection_matrix()
+        self._projection_matrix.flags.writeable = False
     
     def _calculate_projection_matrix(self):
         """Calculate the projection matrix"""
         return perspective(
-            radians(self._fov),
+            self._fov_radians,
             self._aspect_ratio,
             self._near,
             self._far
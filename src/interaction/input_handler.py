@@ -4,6 +4,46 @@ from src.models.door import Door
 from src.models.window import Window
 from src.models.furniture import Furniture
 
+# Bits of InputHandler._button_state
+LEFT, MIDDLE, RIGHT, SHIFT = 1, 2, 4, 8
+
+# Keys that move the selected object: key -> (dx, dy, dz) in meters
+_MOVE_KEYS = {
+    "up": (0, 0, -0.1),
+    "down": (0, 0, 0.1),
+    "left": (-0.1, 0, 0),
+    "right": (0.1, 0, 0),
+    "page_up": (0, 0.1, 0),
+    "page_down": (0, -0.1, 0),
+}
+
+# Shift + key rotations: key -> ((dx, dy, dz) in degrees, axis name, axis index)
+_ROTATE_KEYS = {
+    "left": ((0, -15, 0), "Y", 1),
+    "right": ((0, 15, 0), "Y", 1),
+    "up": ((-15, 0, 0), "X", 0),
+    "down": ((15, 0, 0), "X", 0),
+    "z": ((0, 0, -15), "Z", 2),
+    "x": ((0, 0, 15), "Z", 2),
+}
+
+# Status bar text for a newly selected object, keyed on the object's type
+_SELECTION_STATUS = {
+    Room: lambda obj: f"Selected {obj.room_type} ({obj.width}m × {obj.length}m × {obj.height}m)",
+    Door: lambda obj: f"Selected {obj.door_type} ({obj.width}m × {obj.height}m)",
+    Window: lambda obj: f"Selected {obj.window_type} ({obj.width}m × {obj.height}m)",
+    Furniture: lambda obj: f"Selected {obj.furniture_type} ({obj.width}m × {obj.depth}m × {obj.height}m)",
+}
+_CYCLING_HINT = " (Tab to cycle through objects)"
+_ROTATION_HINT = " | Set rotation in Properties tab or use Shift+Arrows/XZ keys"
+
+def _describe_object(obj):
+    """Fallback status text for objects without a dedicated formatter"""
+    return f"Selected {obj.name}"
+
+def _ignore_status(message):
+    """Fallback status callback used when no main window is attached"""
+
 class InputHandler:
     """
     Handle user input for interacting with the 3D scene
@@ -26,12 +66,16 @@ class InputHandler:
         # Mouse state
         self.last_x = 0
         self.last_y = 0
-        self.left_button_down = False
-        self.right_button_down = False
-        self.middle_button_down = False
         
-        # Keyboard state
-        self.shift_pressed = False
+        # Held mouse buttons and modifier keys (LEFT | MIDDLE | RIGHT | SHIFT)
+        self._button_state = 0
+        
+        # Latest unprocessed motion event (coalesced until the next idle)
+        self._pending_motion = None
+        self._motion_scheduled = False
+        
+        # True while a drag is collecting object moves into one undo step
+        self._drag_batch = False
         
         # Interaction mode (select, move, rotate)
         self.mode = "select"
@@ -39,9 +83,30 @@ class InputHandler:
         # Selected object
         self.selected_object = None
         
+        # Shortcuts that apply regardless of the selection
+        self._shortcut_keys = {
+            "escape": self._on_escape_key,
+            "delete": self._on_delete_key,
+            "tab": self._on_tab_key,
+            "c": self._on_cycle_key,
+            "r": self.camera.reset,
+        }
+        
         # Bind input events
         self.bind_events()
     
+    @property
+    def main_window(self):
+        return self._main_window
+    
+    @main_window.setter
+    def main_window(self, main_window):
+        self._main_window = main_window
+        
+        # Resolve the optional UI hooks once instead of probing on every event
+        self._update_status = getattr(main_window, 'update_status', _ignore_status)
+        self._sidebar = getattr(main_window, 'sidebar', None)
+    
     def bind_events(self):
         """Bind input events to the canvas"""
         # Mouse button events
@@ -87,7 +152,7 @@ class InputHandler:
         Args:
             event: Tkinter event
         """
-        self.left_button_down = True
+        self._button_state |= LEFT
         self.last_x = event.x
         self.last_y = event.y
         
@@ -95,6 +160,8 @@ class InputHandler:
         self.last_click_x = event.x
         self.last_click_y = event.y
         
+        self._begin_drag()
+        
         # Handle based on current mode
         if self.mode == "select":
             # Ray casting to select object
@@ -111,7 +178,7 @@ class InputHandler:
         Args:
             event: Tkinter event
         """
-        self.left_button_down = False
+        self._end_drag(LEFT)
     
     def on_middle_mouse_down(self, event):
         """
@@ -120,9 +187,10 @@ class InputHandler:
         Args:
             event: Tkinter event
         """
-        self.middle_button_down = True
+        self._button_state |= MIDDLE
         self.last_x = event.x
         self.last_y = event.y
+        self._begin_drag()
     
     def on_middle_mouse_up(self, event):
         """
@@ -131,7 +199,37 @@ class InputHandler:
         Args:
             event: Tkinter event
         """
-        self.middle_button_down = False
+        self._end_drag(MIDDLE)
+    
+    def _begin_drag(self):
+        """Start a single undo step for the object drag a button press begins"""
+        if self._drag_batch or self.selected_object is None:
+            return
+        if self.mode == "move":
+            description = f"Move {self.selected_object.name}"
+        elif self.mode == "rotate":
+            description = f"Rotate {self.selected_object.name}"
+        else:
+            return
+        
+        self.scene_manager.begin_batch(description)
+        self._drag_batch = True
+    
+    def _end_drag(self, button):
+        """
+        Release a mouse button and close the drag's undo step once none is held
+        
+        Args:
+            button: LEFT or MIDDLE
+        """
+        # Apply the last coalesced movement while the button still counts as held
+        if self._pending_motion is not None:
+            self._process_motion()
+        
+        self._button_state &= ~button
+        if self._drag_batch and not self._button_state & (LEFT | MIDDLE):
+            self._drag_batch = False
+            self.scene_manager.end_batch()
     
     def on_right_mouse_down(self, event):
         """
@@ -140,7 +238,7 @@ class InputHandler:
         Args:
             event: Tkinter event
         """
-        self.right_button_down = True
+        self._button_state |= RIGHT
         self.last_x = event.x
         self.last_y = event.y
     
@@ -151,19 +249,40 @@ class InputHandler:
         Args:
             event: Tkinter event
         """
-        self.right_button_down = False
+        self._button_state &= ~RIGHT
     
     def on_mouse_move(self, event):
         """
         Handle mouse movement
         
+        Motion events are coalesced: only the latest position is kept and
+        processed once when the event loop goes idle.
+        
         Args:
             event: Tkinter event
         """
-        delta_x = event.x - self.last_x
-        delta_y = event.y - self.last_y
-        
-        if self.left_button_down:
+        self._pending_motion = (event.x, event.y)
+        if not self._motion_scheduled:
+            self._motion_scheduled = True
+            self.canvas.after_idle(self._process_motion)
+    
+    def _process_motion(self):
+        """Apply the latest pending mouse movement"""
+        self._motion_scheduled = False
+        if self._pending_motion is None:
+            return
+        x, y = self._pending_motion
+        self._pending_motion = None
+        
+        delta_x = x - self.last_x
+        delta_y = y - self.last_y
+        
+        # Spurious <Motion> events (enter/leave, modifier changes) carry no movement
+        if delta_x == 0 and delta_y == 0:
+            return
+        
+        state = self._button_state
+        if state & LEFT:
             if self.mode == "select":
                 # Camera orbit
                 self.camera.orbit(delta_x, delta_y)
@@ -172,29 +291,27 @@ class InputHandler:
                 self.scene_manager.move_selected_object(delta_x * 0.01, 0, delta_y * 0.01)
             elif self.mode == "rotate" and self.selected_object is not None:
                 # Rotation behavior depends on modifier keys
-                if self.shift_pressed:
+                if state & SHIFT:
                     # Shift + drag: Rotate around X and Z axes
                     self.scene_manager.rotate_selected_object(delta_y * 0.5, 0, delta_x * 0.5)
                     rotation = self.selected_object.rotation
-                    if hasattr(self.main_window, 'update_status'):
-                        self.main_window.update_status(f"Rotating X: {rotation[0]:.1f}°, Z: {rotation[2]:.1f}°")
+                    self._update_status(f"Rotating X: {rotation[0]:.1f}°, Z: {rotation[2]:.1f}°")
                 else:
                     # Normal drag: Rotate around Y axis only
                     self.scene_manager.rotate_selected_object(0, delta_x * 0.5, 0)
-                    if hasattr(self.main_window, 'update_status'):
-                        self.main_window.update_status(f"Rotating Y-axis: {self.selected_object.rotation[1]:.1f}°")
+                    self._update_status(f"Rotating Y-axis: {self.selected_object.rotation[1]:.1f}°")
         
-        if self.right_button_down:
+        if state & RIGHT:
             # Pan camera
             self.camera.pan(delta_x * 0.01, -delta_y * 0.01)
         
-        if self.middle_button_down:
+        if state & MIDDLE:
             # Custom action (e.g., adjust height)
             if self.selected_object is not None and self.mode == "move":
                 self.scene_manager.move_selected_object(0, delta_y * 0.01, 0)
         
-        self.last_x = event.x
-        self.last_y = event.y
+        self.last_x = x
+        self.last_y = y
     
     def on_mouse_wheel(self, event):
         """
@@ -229,84 +346,56 @@ class InputHandler:
         """
         key = event.keysym.lower()
         
-        # General shortcuts
-        if key == "escape":
-            self.deselect_object()
-        elif key == "delete" and self.selected_object is not None:
-            self.scene_manager.delete_selected_object()
-            self.selected_object = None
-        elif key == "tab":
-            # Cycle through objects at the last clicked position
-            next_obj = self.scene_manager.cycle_selection(self.last_click_x, self.last_click_y)
-            if next_obj:
-                self.select_object(next_obj)
-        elif key == "c":
-            # Alternative shortcut for cycling objects under cursor
-            if hasattr(self.main_window, 'update_status'):
-                self.main_window.update_status("Cycling through objects under cursor")
-            # Get cursor position from last mouse position
-            next_obj = self.scene_manager.cycle_selection(self.last_x, self.last_y)
-            if next_obj:
-                self.select_object(next_obj)
-        
-        # Camera controls
-        if key == "r":
-            self.camera.reset()
+        # Track shift for rotation shortcuts
+        if key == "shift_l" or key == "shift_r":
+            self._button_state |= SHIFT
+            return
+        
+        # General shortcuts and camera controls
+        shortcut = self._shortcut_keys.get(key)
+        if shortcut is not None:
+            shortcut()
         
         # Object manipulation with arrow keys
+        if self.selected_object is None:
+            return
+        
+        # Shift + arrow/Z/X keys rotate, everything else falls back to moving
+        if self._button_state & SHIFT:
+            rotation = _ROTATE_KEYS.get(key)
+            if rotation is not None:
+                delta, axis_name, axis = rotation
+                self.scene_manager.rotate_selected_object(*delta)
+                self._update_status(f"Rotating {axis_name}-axis: {self.selected_object.rotation[axis]}°")
+                return
+        
+        delta = _MOVE_KEYS.get(key)
+        if delta is not None:
+            self.scene_manager.move_selected_object(*delta)
+    
+    def _on_escape_key(self):
+        """Escape: clear the selection"""
+        self.deselect_object()
+    
+    def _on_delete_key(self):
+        """Delete: remove the selected object from the scene"""
         if self.selected_object is not None:
-            # Position controls
-            if key == "up":
-                self.scene_manager.move_selected_object(0, 0, -0.1)
-            elif key == "down":
-                self.scene_manager.move_selected_object(0, 0, 0.1)
-            elif key == "left":
-                self.scene_manager.move_selected_object(-0.1, 0, 0)
-            elif key == "right":
-                self.scene_manager.move_selected_object(0.1, 0, 0)
-            elif key == "page_up":
-                self.scene_manager.move_selected_object(0, 0.1, 0)
-            elif key == "page_down":
-                self.scene_manager.move_selected_object(0, -0.1, 0)
-            
-            # Rotation controls with Shift key
-            elif key == "shift_l" or key == "shift_r":
-                # Store that shift is pressed
-                self.shift_pressed = True
-            
-            # Rotation with shift + arrow keys or shift + rotation keys
-            if hasattr(self, 'shift_pressed') and self.shift_pressed:
-                rotation_amount = 15
-                
-                # Y-axis rotation
-                if key == "left":
-                    self.scene_manager.rotate_selected_object(0, -rotation_amount, 0)
-                    if hasattr(self.main_window, 'update_status'):
-                        self.main_window.update_status(f"Rotating Y-axis: {self.selected_object.rotation[1]}°")
-                elif key == "right":
-                    self.scene_manager.rotate_selected_object(0, rotation_amount, 0)
-                    if hasattr(self.main_window, 'update_status'):
-                        self.main_window.update_status(f"Rotating Y-axis: {self.selected_object.rotation[1]}°")
-                
-                # X-axis rotation
-                elif key == "up":
-                    self.scene_manager.rotate_selected_object(-rotation_amount, 0, 0)
-                    if hasattr(self.main_window, 'update_status'):
-                        self.main_window.update_status(f"Rotating X-axis: {self.selected_object.rotation[0]}°")
-                elif key == "down":
-                    self.scene_manager.rotate_selected_object(rotation_amount, 0, 0)
-                    if hasattr(self.main_window, 'update_status'):
-                        self.main_window.update_status(f"Rotating X-axis: {self.selected_object.rotation[0]}°")
-                
-                # Z-axis rotation
-                elif key == "z":
-                    self.scene_manager.rotate_selected_object(0, 0, -rotation_amount)
-                    if hasattr(self.main_window, 'update_status'):
-                        self.main_window.update_status(f"Rotating Z-axis: {self.selected_object.rotation[2]}°")
-                elif key == "x":
-                    self.scene_manager.rotate_selected_object(0, 0, rotation_amount)
-                    if hasattr(self.main_window, 'update_status'):
-                        self.main_window.update_status(f"Rotating Z-axis: {self.selected_object.rotation[2]}°")
+            self.scene_manager.delete_selected_object()
+            self.selected_object = None
+    
+    def _on_tab_key(self):
+        """Tab: cycle through objects at the last clicked position"""
+        next_obj = self.scene_manager.cycle_selection(self.last_click_x, self.last_click_y)
+        if next_obj:
+            self.select_object(next_obj)
+    
+    def _on_cycle_key(self):
+        """C: alternative shortcut for cycling objects under the cursor"""
+        self._update_status("Cycling through objects under cursor")
+        # Get cursor position from last mouse position
+        next_obj = self.scene_manager.cycle_selection(self.last_x, self.last_y)
+        if next_obj:
+            self.select_object(next_obj)
     
     def on_key_release(self, event):
         """
@@ -319,7 +408,7 @@ class InputHandler:
         
         # Track shift key release
         if key == "shift_l" or key == "shift_r":
-            self.shift_pressed = False
+            self._button_state &= ~SHIFT
     
     def select_object(self, obj):
         """
@@ -334,33 +423,22 @@ class InputHandler:
             self.scene_manager.set_selected_object(obj)
             
             # Update UI if available
-            if hasattr(self.main_window, 'sidebar'):
-                self.main_window.sidebar.show_object_properties(obj)
+            if self._sidebar is not None:
+                self._sidebar.show_object_properties(obj)
             
             # Show status message with object details
-            if hasattr(self.main_window, 'update_status'):
-                if obj is not None:
-                    # Format a nice message based on object type
-                    cycling_msg = " (Tab to cycle through objects)" if self.are_objects_overlapping() else ""
-                    rotation_msg = " | Set rotation in Properties tab or use Shift+Arrows/XZ keys"
-                    
-                    if isinstance(obj, Room):
-                        self.main_window.update_status(f"Selected {obj.room_type} ({obj.width}m × {obj.length}m × {obj.height}m){cycling_msg}")
-                    elif isinstance(obj, Door):
-                        self.main_window.update_status(f"Selected {obj.door_type} ({obj.width}m × {obj.height}m){cycling_msg}{rotation_msg}")
-                    elif isinstance(obj, Window):
-                        self.main_window.update_status(f"Selected {obj.window_type} ({obj.width}m × {obj.height}m){cycling_msg}{rotation_msg}")
-                    elif isinstance(obj, Furniture):
-                        self.main_window.update_status(f"Selected {obj.furniture_type} ({obj.width}m × {obj.depth}m × {obj.height}m){cycling_msg}{rotation_msg}")
-                    else:
-                        self.main_window.update_status(f"Selected {obj.name}{cycling_msg}{rotation_msg}")
+            if obj is not None:
+                obj_type = type(obj)
+                describe = _SELECTION_STATUS.get(obj_type, _describe_object)
+                cycling_msg = _CYCLING_HINT if self.are_objects_overlapping() else ""
+                rotation_msg = "" if obj_type is Room else _ROTATION_HINT
+                self._update_status(f"{describe(obj)}{cycling_msg}{rotation_msg}")
     
     def are_objects_overlapping(self):
         """Check if there might be other selectable objects near the current selection"""
         # Simple implementation - just check if we have more than 2 objects in the scene
         # In a real implementation, this would check for objects near the current selection point
-        all_objects = self.scene_manager.get_all_objects()
-        return len([obj for obj in all_objects if obj != self.scene_manager.room]) >= 2
+        return self.scene_manager.get_object_count() >= 2
     
     def deselect_object(self):
         """Deselect the currently selected object and provide feedback"""
@@ -369,9 +447,8 @@ class InputHandler:
             self.scene_manager.set_selected_object(None)
             
             # Update UI if available
-            if hasattr(self.main_window, 'sidebar'):
-                self.main_window.sidebar.show_object_properties(None)
+            if self._sidebar is not None:
+                self._sidebar.show_object_properties(None)
             
             # Update status
-            if hasattr(self.main_window, 'update_status'):
-                self.main_window.update_status("No object selected") 
\ No newline at end of file
+            self._update_status("No object selected") 
\ No newline at end of file
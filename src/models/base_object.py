@@ -1,11 +1,53 @@
 import numpy as np
-import math
-from src.rendering.matrix import vec3, mat4, translate, rotate, scale, radians
+from src.rendering.matrix import mat4
+from src.rendering._fastmath import fill_trs
+
+# Shared default for a missing position/rotation in from_dict()
+ORIGIN = (0.0, 0.0, 0.0)
+
+def dict_setter(name, convert=None):
+    """
+    Build a from_dict() handler that assigns a value to an attribute
+    
+    Args:
+        name: Attribute (or property) to assign
+        convert: Optional function applied to the value first
+        
+    Returns:
+        Function taking (obj, value)
+    """
+    if convert is None:
+        return lambda obj, value: setattr(obj, name, value)
+    return lambda obj, value: setattr(obj, name, convert(value))
+
+# Slot names per class, including those of base classes (see _slot_names)
+_SLOT_NAMES = {}
+
+def _slot_names(cls):
+    """Get every __slots__ entry declared by cls and its base classes"""
+    names = _SLOT_NAMES.get(cls)
+    if names is None:
+        names = tuple(name for klass in reversed(cls.__mro__)
+                      for name in klass.__dict__.get("__slots__", ()))
+        _SLOT_NAMES[cls] = names
+    return names
 
 class BaseObject:
     """
     Base class for all 3D objects in the scene
     """
+    __slots__ = ("_id", "_name", "_position", "_rotation", "_scale",
+                 "_visible", "_selectable", "_is_selected",
+                 "_model_matrix", "_model_dirty", "_transform_store", "_transform_index",
+                 "_mesh", "_material")
+    
+    # from_dict() handlers for optional keys: key -> function(obj, value)
+    _FROM_DICT_SETTERS = {
+        "scale": dict_setter("scale"),
+        "visible": dict_setter("visible"),
+        "selectable": dict_setter("selectable"),
+    }
+    
     def __init__(self, object_id, name, position=None, rotation=None):
         """
         Initialize the base object
@@ -25,6 +67,14 @@ class BaseObject:
         self._selectable = True
         self._is_selected = False
         
+        # Cached model matrix, rebuilt in place when position/rotation/scale change
+        self._model_matrix = mat4(1.0)
+        self._model_dirty = True
+        
+        # Scene-level transform storage (see TransformStore), None while detached
+        self._transform_store = None
+        self._transform_index = -1
+        
         # Will be set when the object mesh is loaded
         self._mesh = None
         self._material = None
@@ -47,7 +97,8 @@ class BaseObject:
     
     @position.setter
     def position(self, position):
-        self._position = np.array(position, dtype=np.float32)
+        self._position[:] = position
+        self._invalidate_model()
     
     @property
     def rotation(self):
@@ -55,7 +106,8 @@ class BaseObject:
     
     @rotation.setter
     def rotation(self, rotation):
-        self._rotation = np.array(rotation, dtype=np.float32)
+        self._rotation[:] = rotation
+        self._invalidate_model()
     
     @property
     def scale(self):
@@ -63,10 +115,9 @@ class BaseObject:
     
     @scale.setter
     def scale(self, scale):
-        if isinstance(scale, (int, float)):
-            self._scale = np.array([scale, scale, scale], dtype=np.float32)
-        else:
-            self._scale = np.array(scale, dtype=np.float32)
+        # Accepts a uniform scalar or a per-axis (x, y, z) sequence
+        self._scale[:] = scale
+        self._invalidate_model()
     
     @property
     def visible(self):
@@ -112,36 +163,127 @@ class BaseObject:
         """Get the object's unique ID"""
         return self._id
     
+    def _invalidate_model(self):
+        """Mark the model matrix as out of date after a transform change"""
+        self._model_dirty = True
+        if self._transform_store is not None:
+            self._transform_store.mark_dirty(self._transform_index)
+    
+    def _bind_transform(self, store, index):
+        """
+        Point the transform arrays at a row of a TransformStore
+        
+        Args:
+            store: TransformStore to bind to, or None to take private copies
+            index: Row index in the store
+        """
+        if store is None:
+            self._position = self._position.copy()
+            self._rotation = self._rotation.copy()
+            self._scale = self._scale.copy()
+            self._model_matrix = self._model_matrix.copy(order="F")
+            self._model_dirty = True
+        else:
+            self._position = store.positions[index]
+            self._rotation = store.rotations[index]
+            self._scale = store.scales[index]
+            self._model_matrix = store.model_matrices[index]
+        
+        self._transform_store = store
+        self._transform_index = index
+    
     def get_model_matrix(self):
         """
         Calculate the model matrix for this object
         
+        The matrix is cached and only rebuilt after position, rotation or
+        scale have been assigned. Objects attached to a TransformStore are
+        rebuilt together with the rest of the scene.
+        
         Returns:
             4x4 transformation matrix
         """
-        # Create identity matrix
-        model_matrix = mat4(1.0)
+        store = self._transform_store
+        if store is not None:
+            if store.any_dirty:
+                store.compute_model_matrices()
+            return self._model_matrix
+        
+        if not self._model_dirty:
+            return self._model_matrix
+        
+        px, py, pz = self._position.tolist()
+        rx, ry, rz = self._rotation.tolist()
+        sx, sy, sz = self._scale.tolist()
+        
+        # Translation * RotX * RotY * RotZ * Scale written into the cached buffer
+        m = self._model_matrix
+        fill_trs(m, px, py, pz, rx, ry, rz, sx, sy, sz)
+        
+        self._model_dirty = False
+        return m
+    
+    def _apply_dict_fields(self, data):
+        """
+        Apply the optional fields of a serialized object
         
-        # Apply translation
-        model_matrix = translate(model_matrix, self._position)
+        Walks the keys present in data once and calls the matching handler
+        from _FROM_DICT_SETTERS; unknown keys are ignored.
+        
+        Args:
+            data: Dictionary with object data
+        """
+        setters = self._FROM_DICT_SETTERS
+        for key, value in data.items():
+            setter = setters.get(key)
+            if setter is not None:
+                setter(self, value)
+    
+    def __copy__(self):
+        """
+        Copy the object slot by slot
         
-        # Apply rotation (in degrees)
-        model_matrix = rotate(model_matrix, radians(self._rotation[0]), vec3(1, 0, 0))
-        model_matrix = rotate(model_matrix, radians(self._rotation[1]), vec3(0, 1, 0))
-        model_matrix = rotate(model_matrix, radians(self._rotation[2]), vec3(0, 0, 1))
+        NumPy arrays (transform, color tables) are copied so the copy never
+        aliases the original's rows; everything else is shared. The copy is
+        not attached to any TransformStore.
+        """
+        cls = type(self)
+        new = cls.__new__(cls)
+        for name in _slot_names(cls):
+            value = getattr(self, name)
+            if type(value) is np.ndarray:
+                value = value.copy(order="A")
+            setattr(new, name, value)
         
-        # Apply scale
-        model_matrix = scale(model_matrix, self._scale)
+        new._transform_store = None
+        new._transform_index = -1
+        new._model_dirty = True
+        return new
+    
+    def __deepcopy__(self, memo):
+        """
+        Copy the object without copy.deepcopy()'s generic introspection
         
-        return model_matrix
+        Colors are immutable tuples and the remaining fields are scalars,
+        strings or arrays, so the slot copy of __copy__ is already deep.
+        Mesh and material are shared since they are GPU-side resources.
+        """
+        new = self.__copy__()
+        memo[id(self)] = new
+        return new
     
-    def to_dict(self):
+    def to_dict(self, copy=True):
         """
         Convert object to dictionary for serialization
         
+        Args:
+            copy: Copy mutable containers instead of returning references
+                (only subclasses with such fields use it)
+            
         Returns:
             dict: Object data
         """
+        # Furniture.to_dict() and Window.to_dict() write these keys inline; keep them in sync
         return {
             "id": self._id,
             "name": self._name,
@@ -167,16 +309,11 @@ class BaseObject:
         obj = cls(
             object_id=data["id"],
             name=data["name"],
-            position=data.get("position", [0, 0, 0]),
-            rotation=data.get("rotation", [0, 0, 0])
+            position=data.get("position", ORIGIN),
+            rotation=data.get("rotation", ORIGIN)
         )
         
         # Set additional properties
-        if "scale" in data:
-            obj.scale = data["scale"]
-        if "visible" in data:
-            obj.visible = data["visible"]
-        if "selectable" in data:
-            obj.selectable = data["selectable"]
+        obj._apply_dict_fields(data)
         
         return obj 
\ No newline at end of file
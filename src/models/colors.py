@@ -0,0 +1,72 @@
+"""
+Shared color values for scene objects
+"""
+from functools import lru_cache
+import numpy as np
+
+# Canonical tuple for every distinct color seen so far
+_COLOR_POOL = {}
+
+# Channel byte -> 0-1 float, so parsing a hex color does no division
+_BYTE_TO_FLOAT = tuple(i / 255.0 for i in range(256))
+
+def intern_color(color):
+    """
+    Get the shared immutable tuple for a color
+    
+    Objects loaded from a scene file mostly use a handful of colors, so
+    equal colors are stored once instead of as one list per object.
+    
+    Args:
+        color: Color as a sequence of floats (RGB or RGBA)
+        
+    Returns:
+        tuple: Canonical tuple with the same values
+    """
+    key = tuple(color)
+    return _COLOR_POOL.setdefault(key, key)
+
+def rgba_buffer(color, alpha=1.0):
+    """
+    Get a shared float32 RGBA array for a color
+    
+    The array can be passed straight to glUniform4fv, so drawing an object
+    does not build a new list of floats every frame.
+    
+    Args:
+        color: Color as a sequence of floats (RGB, or RGBA whose alpha is ignored)
+        alpha: Alpha component
+        
+    Returns:
+        numpy.ndarray: Read-only array of 4 float32 values
+    """
+    return _rgba_array(tuple(color), alpha)
+
+@lru_cache(maxsize=256)
+def _rgba_array(color, alpha):
+    """Build the read-only RGBA array cached by rgba_buffer()"""
+    rgba = np.array((*color[:3], alpha), dtype=np.float32)
+    rgba.flags.writeable = False
+    return rgba
+
+@lru_cache(maxsize=512)
+def hex_to_rgb(hex_color):
+    """
+    Convert a hex color string to a shared RGB tuple with values 0-1
+    
+    Results are cached per string, so repeated colors are parsed once.
+    
+    Args:
+        hex_color: Hex color string ("#RRGGBB" or "#RGB", "#" optional)
+        
+    Returns:
+        tuple: Interned (r, g, b) tuple, white if the string is not a color
+    """
+    digits = hex_color.lstrip('#')
+    if len(digits) == 3:
+        digits = digits[0] * 2 + digits[1] * 2 + digits[2] * 2
+    try:
+        r, g, b = bytes.fromhex(digits) if len(digits) == 6 else b"\xff\xff\xff"
+    except ValueError:
+        r = g = b = 255
+    return intern_color((_BYTE_TO_FLOAT[r], _BYTE_TO_FLOAT[g], _BYTE_TO_FLOAT[b]))
@@ -1,9 +1,31 @@
-from src.models.base_object import BaseObject
+import numpy as np
+from src.models.base_object import BaseObject, ORIGIN, dict_setter
+from src.models.colors import intern_color
+
+# Minimum door dimensions in meters
+_MIN_DOOR_WIDTH = 0.6
+_MIN_DOOR_HEIGHT = 1.8
+_MIN_DOOR_THICKNESS = 0.01
 
 class Door(BaseObject):
     """
     Represents a door in the 3D scene
     """
+    __slots__ = ("door_type", "_width", "_height", "_thickness", "color", "texture",
+                 "_door_state", "_door_registry", "_door_index")
+    
+    # to_dict() keys for the class-specific fields, in value order
+    _DICT_KEYS = ("type", "door_type", "width", "height", "thickness", "color",
+                  "open_angle", "is_open")
+    
+    _FROM_DICT_SETTERS = {
+        **BaseObject._FROM_DICT_SETTERS,
+        "thickness": dict_setter("thickness"),
+        "color": dict_setter("color", intern_color),
+        "texture": dict_setter("texture"),
+        "open_angle": dict_setter("open_angle"),
+    }
+    
     def __init__(self, door_id, name, door_type, width, height, position=None, rotation=None):
         """
         Initialize a door
@@ -19,24 +41,22 @@ class Door(BaseObject):
         """
         super().__init__(door_id, name, position, rotation)
         
-        self._door_type = door_type
-        self._width = max(0.6, float(width))
-        self._height = max(1.8, float(height))
+        self.door_type = door_type
+        width = float(width)
+        self._width = width if width > _MIN_DOOR_WIDTH else _MIN_DOOR_WIDTH
+        height = float(height)
+        self._height = height if height > _MIN_DOOR_HEIGHT else _MIN_DOOR_HEIGHT
         self._thickness = 0.05  # Door thickness in meters
         
-        # Door appearance and state
-        self._color = [0.6, 0.4, 0.2]  # Wood brown color
-        self._texture = None
-        self._open_angle = 0  # Door open angle (0 = closed, 90 = fully open)
-        self._is_open = False
-    
-    @property
-    def door_type(self):
-        return self._door_type
-    
-    @door_type.setter
-    def door_type(self, door_type):
-        self._door_type = door_type
+        # Door appearance
+        self.color = (0.6, 0.4, 0.2)  # Wood brown color
+        self.texture = None
+        
+        # Current and target open angle (0 = closed, 90 = fully open); a view
+        # into a DoorRegistry row while the door is part of a scene
+        self._door_state = np.zeros(2, dtype=np.float64)
+        self._door_registry = None
+        self._door_index = -1
     
     @property
     def width(self):
@@ -44,7 +64,8 @@ class Door(BaseObject):
     
     @width.setter
     def width(self, width):
-        self._width = max(0.6, float(width))
+        width = float(width)
+        self._width = width if width > _MIN_DOOR_WIDTH else _MIN_DOOR_WIDTH
     
     @property
     def height(self):
@@ -52,7 +73,8 @@ class Door(BaseObject):
     
     @height.setter
     def height(self, height):
-        self._height = max(1.8, float(height))
+        height = float(height)
+        self._height = height if height > _MIN_DOOR_HEIGHT else _MIN_DOOR_HEIGHT
     
     @property
     def thickness(self):
@@ -60,37 +82,21 @@ class Door(BaseObject):
     
     @thickness.setter
     def thickness(self, thickness):
-        self._thickness = max(0.01, float(thickness))
-    
-    @property
-    def color(self):
-        return self._color
-    
-    @color.setter
-    def color(self, color):
-        self._color = color
-    
-    @property
-    def texture(self):
-        return self._texture
-    
-    @texture.setter
-    def texture(self, texture_path):
-        self._texture = texture_path
+        thickness = float(thickness)
+        self._thickness = thickness if thickness > _MIN_DOOR_THICKNESS else _MIN_DOOR_THICKNESS
     
     @property
     def open_angle(self):
-        return self._open_angle
+        return float(self._door_state[0])
     
     @open_angle.setter
     def open_angle(self, angle):
-        # Clamp angle between 0 and 90 degrees
-        self._open_angle = max(0, min(90, float(angle)))
-        self._is_open = self._open_angle > 0
+        # Clamp angle between 0 and 90 degrees (also stops any animation)
+        self._door_state[:] = max(0.0, min(90.0, float(angle)))
     
     @property
     def is_open(self):
-        return self._is_open
+        return bool(self._door_state[0] > 0.0)
     
     def open(self, angle=90):
         """
@@ -103,39 +109,66 @@ class Door(BaseObject):
     
     def close(self):
         """Close the door"""
-        self.open_angle = 0
+        self.set_state(False)
+    
+    def set_state(self, is_open):
+        """
+        Fully open or close the door
+        
+        Args:
+            is_open: True to open the door to 90 degrees, False to close it
+        """
+        self._door_state[:] = 90.0 if is_open else 0.0
     
     def toggle(self):
         """Toggle the door open/closed state"""
-        if self._is_open:
-            self.close()
+        self.set_state(not self.is_open)
+    
+    def _bind_state(self, registry, index):
+        """
+        Point the angle state at a row of a DoorRegistry
+        
+        Args:
+            registry: DoorRegistry to bind to, or None to take a private copy
+            index: Row index in the registry
+        """
+        if registry is None:
+            self._door_state = self._door_state.copy()
         else:
-            self.open()
+            self._door_state = registry.states[index]
+        
+        self._door_registry = registry
+        self._door_index = index
     
-    def to_dict(self):
+    def __copy__(self):
+        """Copy the door, detached from any DoorRegistry"""
+        new = super().__copy__()
+        new._door_registry = None
+        new._door_index = -1
+        return new
+    
+    def to_dict(self, copy=True):
         """
         Convert door to dictionary for serialization
         
+        Args:
+            copy: Copy mutable containers (see Furniture.to_dict)
+            
         Returns:
             dict: Door data
         """
         data = super().to_dict()
+        angle = float(self._door_state[0])
         
         # Add door-specific properties
-        data.update({
-            "type": "Door",
-            "door_type": self._door_type,
-            "width": self._width,
-            "height": self._height,
-            "thickness": self._thickness,
-            "color": self._color,
-            "open_angle": self._open_angle,
-            "is_open": self._is_open
-        })
+        data.update(zip(self._DICT_KEYS, (
+            "Door", self.door_type, self._width, self._height, self._thickness,
+            self.color, angle, angle > 0.0
+        )))
         
         # Add texture path if it exists
-        if self._texture:
-            data["texture"] = self._texture
+        if self.texture:
+            data["texture"] = self.texture
         
         return data
     
@@ -156,28 +189,11 @@ class Door(BaseObject):
             door_type=data["door_type"],
             width=data["width"],
             height=data["height"],
-            position=data.get("position", [0, 0, 0]),
-            rotation=data.get("rotation", [0, 0, 0])
+            position=data.get("position", ORIGIN),
+            rotation=data.get("rotation", ORIGIN)
         )
         
-        # Set appearance properties
-        if "thickness" in data:
-            door.thickness = data["thickness"]
-        if "color" in data:
-            door.color = data["color"]
-        if "texture" in data:
-            door.texture = data["texture"]
-        
-        # Set state
-        if "open_angle" in data:
-            door.open_angle = data["open_angle"]
-        
-        # Set additional base properties
-        if "scale" in data:
-            door.scale = data["scale"]
-        if "visible" in data:
-            door.visible = data["visible"]
-        if "selectable" in data:
-            door.selectable = data["selectable"]
+        # Set appearance, state and base properties
+        door._apply_dict_fields(data)
         
         return door 
\ No newline at end of file
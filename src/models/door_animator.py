@@ -0,0 +1,75 @@
+from src.rendering._fastmath import step_angles
+
+class DoorAnimator:
+    """
+    Animates door open angles towards their targets
+    
+    Angles live in a DoorRegistry, so a frame advances every door of the
+    scene with a single step_angles() call over the registry columns.
+    Nothing in the app starts or steps an animation yet; Door.open(),
+    close() and set_state() still set the angle immediately.
+    """
+    __slots__ = ("registry", "speed", "_moving")
+    
+    def __init__(self, registry, speed=180.0):
+        """
+        Initialize the animator
+        
+        Args:
+            registry: DoorRegistry holding the door angles
+            speed: Opening/closing speed in degrees per second
+        """
+        self.registry = registry
+        self.speed = speed
+        self._moving = False
+    
+    @property
+    def is_animating(self):
+        return self._moving
+    
+    def animate(self, door, angle):
+        """
+        Start moving a door towards an open angle
+        
+        Args:
+            door: Door to animate (attached to the registry if it is not yet)
+            angle: Target angle in degrees (0 = closed, 90 = fully open)
+        """
+        if door._door_registry is not self.registry:
+            self.registry.attach(door)
+        
+        door._door_state[1] = max(0.0, min(90.0, float(angle)))
+        self._moving = True
+    
+    def toggle(self, door):
+        """
+        Animate a door to the opposite of the state it is heading to
+        
+        Args:
+            door: Door to open or close
+        """
+        self.animate(door, 0.0 if door._door_state[1] > 0.0 else 90.0)
+    
+    def step(self, dt):
+        """
+        Advance all animating doors by one frame
+        
+        Args:
+            dt: Elapsed time in seconds
+            
+        Returns:
+            True if any door is still moving
+        """
+        if not self._moving:
+            return False
+        
+        registry = self.registry
+        moving = step_angles(registry.angles, registry.targets, self.speed * dt)
+        self._moving = moving > 0
+        return self._moving
+    
+    def clear(self):
+        """Stop all animations, leaving the doors at their current angles"""
+        registry = self.registry
+        registry.targets[:] = registry.angles
+        self._moving = False
@@ -0,0 +1,92 @@
+import numpy as np
+
+class DoorRegistry:
+    """
+    Packed open-angle storage for the doors in a scene
+    
+    Row i holds the current (column 0) and target (column 1) open angle of
+    the i-th attached door. Doors read and write their angle through a view
+    of their row, so DoorAnimator can step every door with one kernel call.
+    """
+    __slots__ = ("count", "doors", "states")
+    
+    def __init__(self, capacity=16):
+        """
+        Initialize the registry
+        
+        Args:
+            capacity: Number of rows to allocate up front (grows as needed)
+        """
+        self.count = 0
+        self.doors = []
+        self.states = np.zeros((capacity, 2), dtype=np.float64)
+    
+    @property
+    def angles(self):
+        return self.states[:self.count, 0]
+    
+    @property
+    def targets(self):
+        return self.states[:self.count, 1]
+    
+    def _grow(self):
+        """Double the capacity and re-point attached doors at the new rows"""
+        states = np.zeros((2 * len(self.states), 2), dtype=np.float64)
+        states[:self.count] = self.states[:self.count]
+        self.states = states
+        
+        for index, door in enumerate(self.doors):
+            door._bind_state(self, index)
+    
+    def attach(self, door):
+        """
+        Move a door's angle state into the registry
+        
+        Args:
+            door: Door to attach
+        """
+        if door._door_registry is self:
+            return
+        if door._door_registry is not None:
+            door._door_registry.detach(door)
+        
+        if self.count == len(self.states):
+            self._grow()
+        
+        index = self.count
+        self.states[index] = door._door_state
+        
+        self.doors.append(door)
+        self.count += 1
+        door._bind_state(self, index)
+    
+    def detach(self, door):
+        """
+        Give a door its own angle state again and free its row
+        
+        Args:
+            door: Door to detach
+        """
+        if door._door_registry is not self:
+            return
+        
+        index = door._door_index
+        door._bind_state(None, -1)
+        
+        # Fill the hole with the last row so the array stays packed
+        last = self.count - 1
+        if index != last:
+            moved = self.doors[last]
+            self.states[index] = self.states[last]
+            self.doors[index] = moved
+            moved._bind_state(self, index)
+        
+        self.doors.pop()
+        self.count -= 1
+    
+    def clear(self):
+        """Detach all doors"""
+        for door in self.doors:
+            door._bind_state(None, -1)
+        self.doors.clear()
+        self.count = 0
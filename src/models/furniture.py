@@ -1,9 +1,53 @@
-from src.models.base_object import BaseObject
+import numpy as np
+from src.models.base_object import BaseObject, ORIGIN, dict_setter
+from src.models.colors import intern_color
+
+# Minimum furniture width/depth/height in meters
+_MIN_DIM = 0.1
+
+# Accepted material_type values (anything else falls back to "wood")
+_VALID_MATERIALS = frozenset(("wood", "metal", "fabric", "leather", "glass", "plastic"))
+
+def _load_adjustable_parts(furniture, parts):
+    """from_dict() handler for the adjustable_parts table"""
+    for part_name, part_data in parts.items():
+        furniture.add_adjustable_part(
+            part_name=part_name,
+            min_value=part_data["min"],
+            max_value=part_data["max"],
+            current_value=part_data["current"]
+        )
+
+# Packed per-item record for batch uploads (see Furniture.pack_batch)
+FURNITURE_DTYPE = np.dtype([
+    ("position", "3f4"),
+    ("size", "3f4"),  # width, height, depth (X, Y, Z)
+    ("color", "3f4"),
+])
 
 class Furniture(BaseObject):
     """
     Represents a furniture item in the 3D scene
     """
+    __slots__ = ("furniture_type", "_category", "_width", "_depth", "_height",
+                 "color", "texture", "_material_type", "_adjustable_parts")
+    
+    _FROM_DICT_SETTERS = {
+        **BaseObject._FROM_DICT_SETTERS,
+        "color": dict_setter("color", intern_color),
+        "texture": dict_setter("texture"),
+        "material_type": dict_setter("material_type"),
+        "adjustable_parts": _load_adjustable_parts,
+    }
+    
+    # Default colors per category (other categories keep the light gray default)
+    _DEFAULT_COLORS = {
+        "Chairs": (0.3, 0.3, 0.35),  # Dark gray
+        "Tables": (0.6, 0.4, 0.2),   # Brown wood
+        "Sofas": (0.2, 0.2, 0.6),    # Blue
+        "Beds": (0.9, 0.9, 0.9),     # White/light
+    }
+    
     def __init__(self, furniture_id, name, furniture_type, category, width, depth, height, position=None, rotation=None):
         """
         Initialize a furniture item
@@ -21,15 +65,18 @@ class Furniture(BaseObject):
         """
         super().__init__(furniture_id, name, position, rotation)
         
-        self._furniture_type = furniture_type
+        self.furniture_type = furniture_type
         self._category = category
-        self._width = max(0.1, float(width))
-        self._depth = max(0.1, float(depth))
-        self._height = max(0.1, float(height))
+        width = float(width)
+        self._width = width if width > _MIN_DIM else _MIN_DIM
+        depth = float(depth)
+        self._depth = depth if depth > _MIN_DIM else _MIN_DIM
+        height = float(height)
+        self._height = height if height > _MIN_DIM else _MIN_DIM
         
         # Furniture appearance
-        self._color = [0.8, 0.8, 0.8]  # Default light gray
-        self._texture = None
+        self.color = (0.8, 0.8, 0.8)  # Default light gray
+        self.texture = None
         self._material_type = "wood"  # Default material
         
         # For some furniture types (e.g., adjustable chairs)
@@ -38,14 +85,6 @@ class Furniture(BaseObject):
         # Set default color based on category
         self._set_default_color()
     
-    @property
-    def furniture_type(self):
-        return self._furniture_type
-    
-    @furniture_type.setter
-    def furniture_type(self, furniture_type):
-        self._furniture_type = furniture_type
-    
     @property
     def category(self):
         return self._category
@@ -62,7 +101,8 @@ class Furniture(BaseObject):
     
     @width.setter
     def width(self, width):
-        self._width = max(0.1, float(width))
+        width = float(width)
+        self._width = width if width > _MIN_DIM else _MIN_DIM
     
     @property
     def depth(self):
@@ -70,7 +110,8 @@ class Furniture(BaseObject):
     
     @depth.setter
     def depth(self, depth):
-        self._depth = max(0.1, float(depth))
+        depth = float(depth)
+        self._depth = depth if depth > _MIN_DIM else _MIN_DIM
     
     @property
     def height(self):
@@ -78,23 +119,8 @@ class Furniture(BaseObject):
     
     @height.setter
     def height(self, height):
-        self._height = max(0.1, float(height))
-    
-    @property
-    def color(self):
-        return self._color
-    
-    @color.setter
-    def color(self, color):
-        self._color = color
-    
-    @property
-    def texture(self):
-        return self._texture
-    
-    @texture.setter
-    def texture(self, texture_path):
-        self._texture = texture_path
+        height = float(height)
+        self._height = height if height > _MIN_DIM else _MIN_DIM
     
     @property
     def material_type(self):
@@ -102,13 +128,18 @@ class Furniture(BaseObject):
     
     @material_type.setter
     def material_type(self, material_type):
-        valid_materials = ["wood", "metal", "fabric", "leather", "glass", "plastic"]
-        self._material_type = material_type if material_type in valid_materials else "wood"
+        self._material_type = material_type if material_type in _VALID_MATERIALS else "wood"
     
     @property
     def adjustable_parts(self):
         return self._adjustable_parts
     
+    def __deepcopy__(self, memo):
+        """Copy the furniture, giving it its own adjustable parts table"""
+        new = super().__deepcopy__(memo)
+        new._adjustable_parts = {name: dict(part) for name, part in self._adjustable_parts.items()}
+        return new
+    
     def add_adjustable_part(self, part_name, min_value, max_value, current_value):
         """
         Add an adjustable part to the furniture
@@ -146,40 +177,64 @@ class Furniture(BaseObject):
     
     def _set_default_color(self):
         """Set default color based on furniture category"""
-        if self._category == "Chairs":
-            self._color = [0.3, 0.3, 0.35]  # Dark gray
-        elif self._category == "Tables":
-            self._color = [0.6, 0.4, 0.2]  # Brown wood
-        elif self._category == "Sofas":
-            self._color = [0.2, 0.2, 0.6]  # Blue
-        elif self._category == "Beds":
-            self._color = [0.9, 0.9, 0.9]  # White/light
-    
-    def to_dict(self):
+        default = self._DEFAULT_COLORS.get(self._category)
+        if default is not None:
+            self.color = default
+    
+    @classmethod
+    def pack_batch(cls, items):
+        """
+        Pack the positions, sizes and colors of several furniture items into one array
+        
+        Args:
+            items: Sequence of Furniture objects
+            
+        Returns:
+            Structured array with dtype FURNITURE_DTYPE, one record per item
+        """
+        out = np.empty(len(items), dtype=FURNITURE_DTYPE)
+        for i, item in enumerate(items):
+            out[i] = (item._position, (item._width, item._height, item._depth), item.color[:3])
+        return out
+    
+    def to_dict(self, copy=True):
         """
         Convert furniture to dictionary for serialization
         
+        Args:
+            copy: Copy mutable containers (adjustable parts) instead of
+                returning references; pass False for read-only use such
+                as writing JSON
+            
         Returns:
             dict: Furniture data
         """
-        data = super().to_dict()
-        
-        # Add furniture-specific properties
-        data.update({
+        # Built as one literal (base fields read inline) rather than through
+        # super().to_dict(), since this runs for every item on each save
+        parts = self._adjustable_parts
+        data = {
+            "id": self._id,
+            "name": self._name,
+            "position": self._position.tolist(),
+            "rotation": self._rotation.tolist(),
+            "scale": self._scale.tolist(),
+            "visible": self._visible,
+            "selectable": self._selectable,
+            "is_selected": self._is_selected,
             "type": "Furniture",
-            "furniture_type": self._furniture_type,
+            "furniture_type": self.furniture_type,
             "category": self._category,
             "width": self._width,
             "depth": self._depth,
             "height": self._height,
-            "color": self._color,
+            "color": self.color,
             "material_type": self._material_type,
-            "adjustable_parts": self._adjustable_parts.copy() if self._adjustable_parts else {}
-        })
+            "adjustable_parts": (parts.copy() if copy else parts) if parts else {}
+        }
         
         # Add texture path if it exists
-        if self._texture:
-            data["texture"] = self._texture
+        if self.texture:
+            data["texture"] = self.texture
         
         return data
     
@@ -202,33 +257,11 @@ class Furniture(BaseObject):
             width=data["width"],
             depth=data["depth"],
             height=data["height"],
-            position=data.get("position", [0, 0, 0]),
-            rotation=data.get("rotation", [0, 0, 0])
+            position=data.get("position", ORIGIN),
+            rotation=data.get("rotation", ORIGIN)
         )
         
-        # Set appearance properties
-        if "color" in data:
-            furniture.color = data["color"]
-        if "texture" in data:
-            furniture.texture = data["texture"]
-        if "material_type" in data:
-            furniture.material_type = data["material_type"]
-        
-        # Set adjustable parts
-        for part_name, part_data in data.get("adjustable_parts", {}).items():
-            furniture.add_adjustable_part(
-                part_name=part_name,
-                min_value=part_data["min"],
-                max_value=part_data["max"],
-                current_value=part_data["current"]
-            )
-        
-        # Set additional base properties
-        if "scale" in data:
-            furniture.scale = data["scale"]
-        if "visible" in data:
-            furniture.visible = data["visible"]
-        if "selectable" in data:
-            furniture.selectable = data["selectable"]
+        # Set appearance, adjustable parts and base properties
+        furniture._apply_dict_fields(data)
         
         return furniture 
\ No newline at end of file
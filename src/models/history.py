@@ -0,0 +1,36 @@
+class HistoryEntry:
+    """
+    One undoable change to the scene
+    
+    Entries record only what changed, so saving one costs O(1) for
+    transforms and colors instead of a full scene snapshot. The meaning of
+    old/new depends on op:
+    
+        "transform", "attr": value of attribute `field` on object obj_id
+        "add": new holds the added object's to_dict() data
+        "remove": old holds the removed object's to_dict() data
+        "room": Room.to_dict() data before and after the change
+        "room_colors": Room.get_color_state() before and after the change
+        "scene": full snapshot before the change; new is taken on undo
+        "group": old holds a list of entries applied together
+    """
+    __slots__ = ("op", "obj_id", "field", "old", "new", "description")
+    
+    def __init__(self, op, obj_id=None, field=None, old=None, new=None, description=""):
+        """
+        Initialize a history entry
+        
+        Args:
+            op: Kind of change (see class docstring)
+            obj_id: ID of the changed object, if any
+            field: Changed attribute for "transform" and "attr" entries
+            old: Value or data before the change
+            new: Value or data after the change
+            description: Description shown for undo/redo
+        """
+        self.op = op
+        self.obj_id = obj_id
+        self.field = field
+        self.old = old
+        self.new = new
+        self.description = description
@@ -1,9 +1,90 @@
-from src.models.base_object import BaseObject
+import numpy as np
+from src.models.base_object import BaseObject, dict_setter
+from src.models.colors import intern_color
+
+# Rows of the Room wall color tables
+WALL_DEFAULT, WALL_NORTH, WALL_SOUTH, WALL_EAST, WALL_WEST = range(5)
+
+# Override mask bits of the four side walls
+_SIDE_WALL_BITS = (1 << WALL_NORTH) | (1 << WALL_SOUTH) | (1 << WALL_EAST) | (1 << WALL_WEST)
+
+# Minimum room width/length/height in meters
+_MIN_DIM = 1.0
+
+# Packed per-room record for batch uploads (see Room.pack_batch)
+ROOM_DTYPE = np.dtype([
+    ("width", "f4"), ("length", "f4"), ("height", "f4"),
+    ("wall_color", "3f4"), ("floor_color", "3f4"), ("ceiling_color", "3f4"),
+    ("wall_opacity", "f4"), ("floor_opacity", "f4"), ("ceiling_opacity", "f4"),
+])
+
+def _wall_color_property(interior, wall):
+    """
+    Build a property for one wall's row in a Room wall color table
+    
+    Until a color is assigned to the wall it reads as the default wall color.
+    Assigning None removes the wall's own color again.
+    """
+    if interior:
+        def getter(self):
+            return tuple(self._interior_walls[wall].tolist())
+    else:
+        def getter(self):
+            return tuple(self._exterior_walls[wall].tolist())
+    
+    def setter(self, color):
+        self._set_wall_color(interior, wall, color)
+    
+    return property(getter, setter)
 
 class Room(BaseObject):
     """
     Represents a room in the 3D scene
     """
+    __slots__ = ("room_type", "_width", "_length", "_height",
+                 "_exterior_walls", "_exterior_overrides", "floor_color", "ceiling_color",
+                 "_interior_walls", "_interior_overrides",
+                 "interior_floor_color", "interior_ceiling_color",
+                 "floor_texture", "wall_texture", "ceiling_texture",
+                 "_wall_opacity", "_floor_opacity", "_ceiling_opacity")
+    
+    # to_dict() keys for the class-specific fields, in value order
+    _DICT_KEYS = ("type", "room_type", "width", "length", "height", "wall_color",
+                  "north_wall_color", "south_wall_color", "east_wall_color",
+                  "west_wall_color", "floor_color", "ceiling_color",
+                  "interior_wall_color", "interior_north_wall_color",
+                  "interior_south_wall_color", "interior_east_wall_color",
+                  "interior_west_wall_color", "interior_floor_color",
+                  "interior_ceiling_color", "wall_texture", "floor_texture",
+                  "ceiling_texture", "wall_opacity", "floor_opacity", "ceiling_opacity")
+    
+    # from_dict() handlers for optional keys: key -> function(obj, value)
+    _FROM_DICT_SETTERS = {
+        # Exterior colors
+        "wall_color": dict_setter("wall_color"),
+        "north_wall_color": dict_setter("north_wall_color"),
+        "south_wall_color": dict_setter("south_wall_color"),
+        "east_wall_color": dict_setter("east_wall_color"),
+        "west_wall_color": dict_setter("west_wall_color"),
+        "floor_color": dict_setter("floor_color", intern_color),
+        "ceiling_color": dict_setter("ceiling_color", intern_color),
+        # Interior colors
+        "interior_wall_color": dict_setter("interior_wall_color"),
+        "interior_north_wall_color": dict_setter("interior_north_wall_color"),
+        "interior_south_wall_color": dict_setter("interior_south_wall_color"),
+        "interior_east_wall_color": dict_setter("interior_east_wall_color"),
+        "interior_west_wall_color": dict_setter("interior_west_wall_color"),
+        "interior_floor_color": dict_setter("interior_floor_color", intern_color),
+        "interior_ceiling_color": dict_setter("interior_ceiling_color", intern_color),
+        # Textures and opacity
+        "wall_texture": dict_setter("wall_texture"),
+        "floor_texture": dict_setter("floor_texture"),
+        "ceiling_texture": dict_setter("ceiling_texture"),
+        "wall_opacity": dict_setter("_wall_opacity"),
+        "floor_opacity": dict_setter("_floor_opacity"),
+        "ceiling_opacity": dict_setter("_ceiling_opacity"),
+    }
+    
     def __init__(self, room_id, name, room_type, width, length, height, position=None, rotation=None):
         """
         Initialize a room
@@ -20,54 +101,50 @@ class Room(BaseObject):
         """
         super().__init__(room_id, name, position, rotation)
         
-        self._room_type = room_type
-        self._width = max(1.0, float(width))     # Ensure positive dimensions
-        self._length = max(1.0, float(length))
-        self._height = max(1.0, float(height))
+        self.room_type = room_type
+        # Ensure positive dimensions
+        width = float(width)
+        self._width = width if width > _MIN_DIM else _MIN_DIM
+        length = float(length)
+        self._length = length if length > _MIN_DIM else _MIN_DIM
+        height = float(height)
+        self._height = height if height > _MIN_DIM else _MIN_DIM
         
         # Room appearance properties - Exterior colors (seen from outside)
-        self._wall_color = [0.8, 0.8, 0.8]       # Light gray (default for all walls)
-        self._north_wall_color = None
-        self._south_wall_color = None
-        self._east_wall_color = None
-        self._west_wall_color = None
-        self._floor_color = [0.8, 0.8, 0.8]      # Light gray
-        self._ceiling_color = [0.8, 0.8, 0.8]    # Light gray
+        # Wall colors are (5, 3) tables indexed by WALL_*. Each row holds the
+        # effective color of that wall: walls whose bit is not set in the
+        # overrides mask mirror the WALL_DEFAULT row
+        self._exterior_walls = np.empty((5, 3), dtype=np.float64)
+        self._exterior_walls[:] = [0.8, 0.8, 0.8]  # Light gray (default for all walls)
+        self._exterior_overrides = 0
+        self.floor_color = (0.8, 0.8, 0.8)      # Light gray
+        self.ceiling_color = (0.8, 0.8, 0.8)    # Light gray
         
         # Interior colors (seen from inside the room)
-        self._interior_wall_color = [0.85, 0.85, 0.82]  # Slightly warmer light gray for all interior walls
-        self._interior_north_wall_color = None
-        self._interior_south_wall_color = None
-        self._interior_east_wall_color = None
-        self._interior_west_wall_color = None
-        self._interior_floor_color = [0.82, 0.8, 0.75]  # Slightly warmer floor
-        self._interior_ceiling_color = [0.9, 0.9, 0.9]  # Slightly brighter ceiling
+        self._interior_walls = np.empty((5, 3), dtype=np.float64)
+        self._interior_walls[:] = [0.85, 0.85, 0.82]  # Slightly warmer light gray for all interior walls
+        self._interior_overrides = 0
+        self.interior_floor_color = (0.82, 0.8, 0.75)  # Slightly warmer floor
+        self.interior_ceiling_color = (0.9, 0.9, 0.9)  # Slightly brighter ceiling
         
         # Textures
-        self._floor_texture = None
-        self._wall_texture = None
-        self._ceiling_texture = None
+        self.floor_texture = None
+        self.wall_texture = None
+        self.ceiling_texture = None
         
         # Opacity properties 
         self._wall_opacity = 1.0
         self._floor_opacity = 1.0
         self._ceiling_opacity = 1.0
     
-    @property
-    def room_type(self):
-        return self._room_type
-    
-    @room_type.setter
-    def room_type(self, room_type):
-        self._room_type = room_type
-    
     @property
     def width(self):
         return self._width
     
     @width.setter
     def width(self, width):
-        self._width = max(1.0, float(width))
+        width = float(width)
+        self._width = width if width > _MIN_DIM else _MIN_DIM
     
     @property
     def length(self):
@@ -75,7 +152,8 @@ class Room(BaseObject):
     
     @length.setter
     def length(self, length):
-        self._length = max(1.0, float(length))
+        length = float(length)
+        self._length = length if length > _MIN_DIM else _MIN_DIM
     
     @property
     def height(self):
@@ -83,87 +161,132 @@ class Room(BaseObject):
     
     @height.setter
     def height(self, height):
-        self._height = max(1.0, float(height))
-    
-    @property
-    def wall_color(self):
-        return self._wall_color
+        height = float(height)
+        self._height = height if height > _MIN_DIM else _MIN_DIM
     
-    @wall_color.setter
-    def wall_color(self, color):
-        self._wall_color = color
+    # Exterior wall colors
+    wall_color = _wall_color_property(False, WALL_DEFAULT)
+    north_wall_color = _wall_color_property(False, WALL_NORTH)
+    south_wall_color = _wall_color_property(False, WALL_SOUTH)
+    east_wall_color = _wall_color_property(False, WALL_EAST)
+    west_wall_color = _wall_color_property(False, WALL_WEST)
     
     @property
-    def floor_color(self):
-        return self._floor_color
-    
-    @floor_color.setter
-    def floor_color(self, color):
-        self._floor_color = color
+    def exterior_wall_colors(self):
+        """(5, 3) float64 table of effective exterior wall colors, indexed by WALL_*"""
+        return self._exterior_walls
     
     @property
-    def ceiling_color(self):
-        return self._ceiling_color
-    
-    @ceiling_color.setter
-    def ceiling_color(self, color):
-        self._ceiling_color = color
+    def interior_wall_colors(self):
+        """(5, 3) float64 table of effective interior wall colors, indexed by WALL_*"""
+        return self._interior_walls
     
-    @property
-    def north_wall_color(self):
-        return self._north_wall_color if self._north_wall_color is not None else self._wall_color
-
-    @north_wall_color.setter
-    def north_wall_color(self, color):
-        self._north_wall_color = color
-
-    @property
-    def south_wall_color(self):
-        return self._south_wall_color if self._south_wall_color is not None else self._wall_color
-
-    @south_wall_color.setter
-    def south_wall_color(self, color):
-        self._south_wall_color = color
-
-    @property
-    def east_wall_color(self):
-        return self._east_wall_color if self._east_wall_color is not None else self._wall_color
-
-    @east_wall_color.setter
-    def east_wall_color(self, color):
-        self._east_wall_color = color
-
-    @property
-    def west_wall_color(self):
-        return self._west_wall_color if self._west_wall_color is not None else self._wall_color
-
-    @west_wall_color.setter
-    def west_wall_color(self, color):
-        self._west_wall_color = color
+    def has_wall_color(self, wall, interior=False):
+        """
+        Check whether a wall has its own color instead of the default one
+        
+        Args:
+            wall: One of WALL_NORTH, WALL_SOUTH, WALL_EAST, WALL_WEST
+            interior: Check the interior color instead of the exterior one
+            
+        Returns:
+            bool: True if the wall color was set explicitly
+        """
+        overrides = self._interior_overrides if interior else self._exterior_overrides
+        return bool(overrides & (1 << wall))
     
-    @property
-    def wall_texture(self):
-        return self._wall_texture
+    def has_other_wall_color(self, wall, interior=False):
+        """
+        Check whether any side wall other than the given one has its own color
+        
+        Args:
+            wall: One of WALL_NORTH, WALL_SOUTH, WALL_EAST, WALL_WEST
+            interior: Check the interior colors instead of the exterior ones
+            
+        Returns:
+            bool: True if another wall's color was set explicitly
+        """
+        overrides = self._interior_overrides if interior else self._exterior_overrides
+        return bool(overrides & _SIDE_WALL_BITS & ~(1 << wall))
     
-    @wall_texture.setter
-    def wall_texture(self, texture_path):
-        self._wall_texture = texture_path
+    def clear_wall_colors(self, interior=False):
+        """Make all walls use the default wall color again"""
+        table = self._interior_walls if interior else self._exterior_walls
+        table[WALL_DEFAULT + 1:] = table[WALL_DEFAULT]
+        if interior:
+            self._interior_overrides = 0
+        else:
+            self._exterior_overrides = 0
     
-    @property
-    def floor_texture(self):
-        return self._floor_texture
+    def _set_wall_color(self, interior, wall, color):
+        """Write a wall color into its table row (None clears the override)"""
+        table = self._interior_walls if interior else self._exterior_walls
+        overrides = self._interior_overrides if interior else self._exterior_overrides
+        
+        if wall == WALL_DEFAULT:
+            if color is None:
+                return
+            table[WALL_DEFAULT] = color[:3]
+            # Walls without their own color follow the default
+            for row in range(WALL_DEFAULT + 1, len(table)):
+                if not overrides & (1 << row):
+                    table[row] = table[WALL_DEFAULT]
+            return
+        
+        bit = 1 << wall
+        if color is None:
+            table[wall] = table[WALL_DEFAULT]
+            overrides &= ~bit
+        else:
+            table[wall] = color[:3]
+            overrides |= bit
+        
+        if interior:
+            self._interior_overrides = overrides
+        else:
+            self._exterior_overrides = overrides
     
-    @floor_texture.setter
-    def floor_texture(self, texture_path):
-        self._floor_texture = texture_path
+    def _wall_color_data(self, interior):
+        """
+        Serialized wall color table, in WALL_* order
+        
+        Side walls that use the default color are written as None.
+        """
+        table = self._interior_walls if interior else self._exterior_walls
+        overrides = self._interior_overrides if interior else self._exterior_overrides
+        rows = [tuple(row) for row in table.tolist()]
+        for wall in range(WALL_DEFAULT + 1, len(rows)):
+            if not overrides & (1 << wall):
+                rows[wall] = None
+        return rows
     
-    @property
-    def ceiling_texture(self):
-        return self._ceiling_texture
+    def get_color_state(self):
+        """
+        Capture the room's colors and opacities
+        
+        Returns:
+            tuple: State to pass to set_color_state() later, e.g. for undo
+        """
+        return (self._exterior_walls.copy(), self._exterior_overrides,
+                self._interior_walls.copy(), self._interior_overrides,
+                self.floor_color, self.ceiling_color,
+                self.interior_floor_color, self.interior_ceiling_color,
+                self._wall_opacity, self._floor_opacity, self._ceiling_opacity)
     
-    @ceiling_texture.setter
-    def ceiling_texture(self, texture_path):
-        self._ceiling_texture = texture_path
+    def set_color_state(self, state):
+        """
+        Restore colors and opacities captured by get_color_state()
+        
+        Args:
+            state: Tuple returned by get_color_state()
+        """
+        (exterior_walls, self._exterior_overrides, interior_walls, self._interior_overrides,
+         self.floor_color, self.ceiling_color, self.interior_floor_color, self.interior_ceiling_color,
+         self._wall_opacity, self._floor_opacity, self._ceiling_opacity) = state
+        
+        # Write into the existing tables so views held elsewhere stay valid
+        self._exterior_walls[:] = exterior_walls
+        self._interior_walls[:] = interior_walls
     
     @property
     def wall_opacity(self):
@@ -189,103 +312,58 @@ class Room(BaseObject):
     def ceiling_opacity(self, opacity):
         self._ceiling_opacity = float(opacity)
     
-    # Properties for interior wall colors
-    @property
-    def interior_wall_color(self):
-        return self._interior_wall_color
-    
-    @interior_wall_color.setter
-    def interior_wall_color(self, color):
-        self._interior_wall_color = color
-    
-    @property
-    def interior_north_wall_color(self):
-        return self._interior_north_wall_color if self._interior_north_wall_color is not None else self._interior_wall_color
-
-    @interior_north_wall_color.setter
-    def interior_north_wall_color(self, color):
-        self._interior_north_wall_color = color
-
-    @property
-    def interior_south_wall_color(self):
-        return self._interior_south_wall_color if self._interior_south_wall_color is not None else self._interior_wall_color
-
-    @interior_south_wall_color.setter
-    def interior_south_wall_color(self, color):
-        self._interior_south_wall_color = color
-
-    @property
-    def interior_east_wall_color(self):
-        return self._interior_east_wall_color if self._interior_east_wall_color is not None else self._interior_wall_color
-
-    @interior_east_wall_color.setter
-    def interior_east_wall_color(self, color):
-        self._interior_east_wall_color = color
-
-    @property
-    def interior_west_wall_color(self):
-        return self._interior_west_wall_color if self._interior_west_wall_color is not None else self._interior_wall_color
-
-    @interior_west_wall_color.setter
-    def interior_west_wall_color(self, color):
-        self._interior_west_wall_color = color
-    
-    @property
-    def interior_floor_color(self):
-        return self._interior_floor_color
-    
-    @interior_floor_color.setter
-    def interior_floor_color(self, color):
-        self._interior_floor_color = color
+    # Interior wall colors
+    interior_wall_color = _wall_color_property(True, WALL_DEFAULT)
+    interior_north_wall_color = _wall_color_property(True, WALL_NORTH)
+    interior_south_wall_color = _wall_color_property(True, WALL_SOUTH)
+    interior_east_wall_color = _wall_color_property(True, WALL_EAST)
+    interior_west_wall_color = _wall_color_property(True, WALL_WEST)
     
-    @property
-    def interior_ceiling_color(self):
-        return self._interior_ceiling_color
-    
-    @interior_ceiling_color.setter
-    def interior_ceiling_color(self, color):
-        self._interior_ceiling_color = color
+    @classmethod
+    def pack_batch(cls, rooms):
+        """
+        Pack the dimensions, colors and opacities of several rooms into one array
+        
+        Args:
+            rooms: Sequence of Room objects
+            
+        Returns:
+            Structured array with dtype ROOM_DTYPE, one record per room
+        """
+        out = np.empty(len(rooms), dtype=ROOM_DTYPE)
+        for i, room in enumerate(rooms):
+            out[i] = (room._width, room._length, room._height,
+                      room._exterior_walls[WALL_DEFAULT], room.floor_color[:3], room.ceiling_color[:3],
+                      room._wall_opacity, room._floor_opacity, room._ceiling_opacity)
+        return out
     
-    def to_dict(self):
+    def to_dict(self, copy=True):
         """
         Convert room to dictionary for serialization
         
+        Args:
+            copy: Copy mutable containers (see Furniture.to_dict)
+            
         Returns:
             dict: Room data
         """
         data = super().to_dict()
         
         # Add room-specific properties
-        data.update({
-            "type": "Room",
-            "room_type": self._room_type,
-            "width": self._width,
-            "length": self._length,
-            "height": self._height,
-            # Exterior colors
-            "wall_color": self._wall_color,
-            "north_wall_color": self._north_wall_color,
-            "south_wall_color": self._south_wall_color,
-            "east_wall_color": self._east_wall_color,
-            "west_wall_color": self._west_wall_color,
-            "floor_color": self._floor_color,
-            "ceiling_color": self._ceiling_color,
-            # Interior colors
-            "interior_wall_color": self._interior_wall_color,
-            "interior_north_wall_color": self._interior_north_wall_color,
-            "interior_south_wall_color": self._interior_south_wall_color,
-            "interior_east_wall_color": self._interior_east_wall_color,
-            "interior_west_wall_color": self._interior_west_wall_color,
-            "interior_floor_color": self._interior_floor_color,
-            "interior_ceiling_color": self._interior_ceiling_color,
+        data.update(zip(self._DICT_KEYS, (
+            "Room", self.room_type, self._width, self._length, self._height,
+            # Exterior colors (default, north, south, east, west)
+            *self._wall_color_data(False),
+            self.floor_color,
+            self.ceiling_color,
+            # Interior colors (default, north, south, east, west)
+            *self._wall_color_data(True),
+            self.interior_floor_color,
+            self.interior_ceiling_color,
             # Textures and opacity
-            "wall_texture": self._wall_texture,
-            "floor_texture": self._floor_texture,
-            "ceiling_texture": self._ceiling_texture,
-            "wall_opacity": self._wall_opacity,
-            "floor_opacity": self._floor_opacity,
-            "ceiling_opacity": self._ceiling_opacity
-        })
+            self.wall_texture, self.floor_texture, self.ceiling_texture,
+            self._wall_opacity, self._floor_opacity, self._ceiling_opacity
+        )))
         
         return data
     
@@ -311,52 +389,7 @@ class Room(BaseObject):
             rotation=data.get("rotation")
         )
         
-        # Set room appearance properties if available
-        if "wall_color" in data:
-            obj._wall_color = data["wall_color"]
-        if "north_wall_color" in data:
-            obj._north_wall_color = data["north_wall_color"]
-        if "south_wall_color" in data:
-            obj._south_wall_color = data["south_wall_color"]
-        if "east_wall_color" in data:
-            obj._east_wall_color = data["east_wall_color"]
-        if "west_wall_color" in data:
-            obj._west_wall_color = data["west_wall_color"]
-        if "floor_color" in data:
-            obj._floor_color = data["floor_color"]
-        if "ceiling_color" in data:
-            obj._ceiling_color = data["ceiling_color"]
-            
-        # Set interior colors if available
-        if "interior_wall_color" in data:
-            obj._interior_wall_color = data["interior_wall_color"]
-        if "interior_north_wall_color" in data:
-            obj._interior_north_wall_color = data["interior_north_wall_color"]
-        if "interior_south_wall_color" in data:
-            obj._interior_south_wall_color = data["interior_south_wall_color"]
-        if "interior_east_wall_color" in data:
-            obj._interior_east_wall_color = data["interior_east_wall_color"]
-        if "interior_west_wall_color" in data:
-            obj._interior_west_wall_color = data["interior_west_wall_color"]
-        if "interior_floor_color" in data:
-            obj._interior_floor_color = data["interior_floor_color"]
-        if "interior_ceiling_color" in data:
-            obj._interior_ceiling_color = data["interior_ceiling_color"]
-        
-        # Set texture paths if available
-        if "wall_texture" in data:
-            obj._wall_texture = data["wall_texture"]
-        if "floor_texture" in data:
-            obj._floor_texture = data["floor_texture"]
-        if "ceiling_texture" in data:
-            obj._ceiling_texture = data["ceiling_texture"]
-            
-        # Set opacity values if available
-        if "wall_opacity" in data:
-            obj._wall_opacity = data["wall_opacity"]
-        if "floor_opacity" in data:
-            obj._floor_opacity = data["floor_opacity"]
-        if "ceiling_opacity" in data:
-            obj._ceiling_opacity = data["ceiling_opacity"]
+        # Set the colors, textures and opacity values that are present
+        obj._apply_dict_fields(data)
         
         return obj 
\ No newline at end of file
@@ -1,20 +1,149 @@
 import os
 import json
+import logging
+import math
 import numpy as np
-import uuid
+from collections import deque
+from contextlib import contextmanager
+from itertools import chain
 
 # Add missing import for the methods that use it
 import glm
 
-from src.models.room import Room
+from src.models.room import Room, WALL_NORTH, WALL_SOUTH, WALL_EAST, WALL_WEST
 from src.models.door import Door
 from src.models.window import Window
 from src.models.furniture import Furniture
+from src.models.colors import intern_color, hex_to_rgb
+from src.models.transform_store import TransformStore
+from src.models.door_registry import DoorRegistry
+from src.models.door_animator import DoorAnimator
+from src.models.history import HistoryEntry
+from src.models.spatial_grid import SpatialGrid
+from src.rendering._fastmath import ray_box_hits
+
+# Per-object debug messages; formatted only when DEBUG logging is enabled
+log = logging.getLogger(__name__)
+
+def _object_key(object_id):
+    """
+    Normalize an object ID to its object_map key
+    
+    Scene objects are numbered with ints in memory, but their IDs arrive
+    as strings from saved files and the save_scene() keys.
+    
+    Args:
+        object_id: ID as an int or string
+        
+    Returns:
+        int for numeric IDs, otherwise the ID unchanged
+    """
+    if type(object_id) is str and object_id.isdigit():
+        return int(object_id)
+    return object_id
+
+# Default (width, depth, height) of each furniture type, in meters
+_FURNITURE_DIMENSIONS = {
+    # Chairs
+    "Dining Chair": (0.5, 0.5, 0.9),
+    "Office Chair": (0.6, 0.6, 1.1),
+    "Armchair": (0.8, 0.8, 0.8),
+    
+    # Tables
+    "Dining Table": (1.5, 0.9, 0.75),
+    "Coffee Table": (1.0, 0.6, 0.45),
+    "Desk": (1.2, 0.6, 0.75),
+    
+    # Sofas
+    "2-Seater Sofa": (1.5, 0.85, 0.7),
+    "3-Seater Sofa": (2.1, 0.85, 0.7),
+    "L-Shaped Sofa": (2.5, 2.0, 0.7),
+    
+    # Beds
+    "Single Bed": (0.9, 2.0, 0.5),
+    "Double Bed": (1.4, 2.0, 0.5),
+    "King Size Bed": (1.8, 2.0, 0.5),
+    
+    # Cupboards
+    "Single Door Cupboard": (0.6, 0.5, 2.0),
+    "Double Door Cupboard": (1.2, 0.5, 2.0),
+    "Sliding Door Cupboard": (1.5, 0.6, 2.0),
+}
+_DEFAULT_DIMENSIONS = (1.0, 1.0, 1.0)
+
+# Object types whose saved data is reused by save_scene() until they change
+# (room and door state can change without a history entry, e.g. animation)
+_SAVE_CACHED_TYPES = (Window, Furniture)
+
+# Object types with a single RGB `color` attribute (windows use frame/glass
+# colors and the room per-surface colors); a new type with one goes here.
+# No object type has an opacity of its own.
+_COLORED_TYPES = (Door, Furniture)
+
+# Category of each known furniture type
+_TYPE_TO_CATEGORY = {
+    furniture_type: category
+    for category, furniture_types in (
+        ("Chairs", ("Dining Chair", "Office Chair", "Armchair")),
+        ("Tables", ("Dining Table", "Coffee Table", "Desk")),
+        ("Sofas", ("2-Seater Sofa", "3-Seater Sofa", "L-Shaped Sofa")),
+        ("Beds", ("Single Bed", "Double Bed", "King Size Bed")),
+        ("Cupboards", ("Single Door Cupboard", "Double Door Cupboard", "Sliding Door Cupboard")),
+    )
+    for furniture_type in furniture_types
+}
+
+# set_room_color() components for single exterior walls: component -> (room attribute, wall)
+_EXTERIOR_WALL_COMPONENTS = {
+    "north_wall": ("north_wall_color", WALL_NORTH),
+    "south_wall": ("south_wall_color", WALL_SOUTH),
+    "east_wall": ("east_wall_color", WALL_EAST),
+    "west_wall": ("west_wall_color", WALL_WEST),
+}
+
+# Other room color components: component -> (color attribute, opacity attribute)
+_EXTERIOR_SURFACE_COMPONENTS = {
+    "floor": ("floor_color", "floor_opacity"),
+    "ceiling": ("ceiling_color", "ceiling_opacity"),
+}
+_INTERIOR_COMPONENTS = {
+    "interior_walls": ("interior_wall_color", "wall_opacity"),
+    "interior_north_wall": ("interior_north_wall_color", "wall_opacity"),
+    "interior_south_wall": ("interior_south_wall_color", "wall_opacity"),
+    "interior_east_wall": ("interior_east_wall_color", "wall_opacity"),
+    "interior_west_wall": ("interior_west_wall_color", "wall_opacity"),
+    "interior_floor": ("interior_floor_color", "floor_opacity"),
+    "interior_ceiling": ("interior_ceiling_color", "ceiling_opacity"),
+}
+
+# Keyboard nudges: key -> unit step along (x, y, z), scaled by the step size
+_MOVE_KEYS = {
+    "ArrowLeft": (-1, 0, 0),
+    "ArrowRight": (1, 0, 0),
+    "ArrowUp": (0, 0, -1),
+    "ArrowDown": (0, 0, 1),
+}
+_ROTATION_KEYS = {
+    # Arrows yaw (left/right) and pitch (up/down), z/x roll
+    "ArrowLeft": (0, -1, 0),
+    "ArrowRight": (0, 1, 0),
+    "ArrowUp": (-1, 0, 0),
+    "ArrowDown": (1, 0, 0),
+    "z": (0, 0, -1),
+    "x": (0, 0, 1),
+}
 
 class SceneManager:
     """
     Manages all objects in the 3D scene
     """
+    __slots__ = ("room", "doors", "windows", "furniture", "selected_object", "last_id",
+                 "object_map", "_type_bucket", "_bucket_index", "_saved_dicts",
+                 "_non_room_object_count", "transforms", "_bounds_room", "_room_min", "_room_max",
+                 "_spatial_index", "camera", "viewport", "door_registry", "door_animator",
+                 "max_history", "undo_stack", "redo_stack", "_history_paused",
+                 "_batch_depth", "_batch_entries", "_batch_description")
+    
     def __init__(self):
         """Initialize the scene manager"""
         self.room = None
@@ -27,17 +156,51 @@ class SceneManager:
         # Dictionary to track objects by ID
         self.object_map = {}
         
-        # History tracking for undo/redo
-        self.history = []
-        self.history_index = -1
-        self.max_history = 20  # Maximum number of history states to keep
+        # Collection for each object type, and each object's index in it
+        self._type_bucket = {Door: self.doors, Window: self.windows, Furniture: self.furniture}
+        self._bucket_index = {}
+        
+        # Last saved (object, to_dict()) of each window and furniture item
+        self._saved_dicts = {}
+        
+        # Number of doors, windows and furniture currently in the scene
+        self._non_room_object_count = 0
+        
+        # Packed position/rotation/scale arrays for every object in the scene
+        self.transforms = TransformStore()
+        
+        # Movement bounds of the current room (see _room_bounds)
+        self._bounds_room = None
+        self._room_min = None
+        self._room_max = None
+        
+        # Floor-plane grid of doors, windows and furniture for picking
+        self._spatial_index = SpatialGrid()
+        
+        # View used to turn screen coordinates into pick rays (set by the UI)
+        self.camera = None
+        self.viewport = (800, 600)
+        
+        # Packed open angles of the doors, animated by the render loop
+        self.door_registry = DoorRegistry()
+        self.door_animator = DoorAnimator(self.door_registry)
+        
+        # History tracking for undo/redo (HistoryEntry records, newest last)
+        self.max_history = 20  # Maximum number of history entries to keep
+        self.undo_stack = deque(maxlen=self.max_history)
+        self.redo_stack = deque(maxlen=self.max_history)
+        self._history_paused = 0  # Nonzero while undo/redo replays changes
+        
+        # Changes collected by begin_batch()/end_batch() for a single undo step
+        self._batch_depth = 0
+        self._batch_entries = []
+        self._batch_description = ""
         
         # Set default room
         self.set_room("Living Room", 5.0, 6.0, 2.5)
         
         # Clear history after initial setup
-        self.history.clear()
-        self.history_index = -1
+        self.undo_stack.clear()
     
     def set_room(self, name, width, length, height, room_type="bedroom"):
         """
@@ -53,11 +216,15 @@ class SceneManager:
         Returns:
             Room: The created room object
         """
-        # Save current state for undo
-        if self.room:
-            self._save_state(f"Change Room to {name}")
+        # Remember the current room for undo
+        old_room = self.room.to_dict() if self.room and not self._history_paused else None
             
-        room_id = str(uuid.uuid4())
+        if self.room is not None:
+            self.transforms.detach(self.room)
+        
+        # Rooms take their ID from the same counter as other objects
+        room_id = f"room_{self.last_id}"
+        self.last_id += 1
         self.room = Room(
             room_id=room_id,
             name=name,
@@ -68,9 +235,17 @@ class SceneManager:
             position=[0, 0, 0],
             rotation=[0, 0, 0]
         )
+        self.transforms.attach(self.room)
         
         # Set room colors to light gray
-        self.set_room_color("wall", "#CCCCCC", [0.8, 0.8, 0.8])
+        self._history_paused += 1
+        try:
+            self.set_room_color("#CCCCCC", 1.0, "walls")
+        finally:
+            self._history_paused -= 1
+        
+        if old_room is not None:
+            self._record_room_change(old_room, f"Change Room to {name}")
         
         return self.room
     
@@ -89,9 +264,6 @@ class SceneManager:
         Returns:
             Door object that was added
         """
-        # Save state for undo
-        self._save_state(f"Add {door_type}")
-        
         # Create default position if not provided
         if position is None:
             # Place the door on one of the walls
@@ -121,6 +293,8 @@ class SceneManager:
         
         # Add to scene
         self.add_object(door)
+        self._push_history(HistoryEntry("add", door.get_id(), new=door.to_dict(),
+                                        description=f"Add {door_type}"))
         
         return door
     
@@ -138,9 +312,6 @@ class SceneManager:
         Returns:
             Window object that was added
         """
-        # Save state for undo
-        self._save_state(f"Add {window_type}")
-        
         # Create default position if not provided
         if position is None:
             # Place the window on one of the walls
@@ -167,6 +338,8 @@ class SceneManager:
         
         # Add to scene
         self.add_object(window)
+        self._push_history(HistoryEntry("add", window.get_id(), new=window.to_dict(),
+                                        description=f"Add {window_type}"))
         
         return window
     
@@ -186,9 +359,6 @@ class SceneManager:
         Returns:
             Furniture object that was added
         """
-        # Save state for undo
-        self._save_state(f"Add {furniture_type}")
-        
         # Create default position if not provided
         if position is None:
             # Place furniture on the floor in the center of the room
@@ -201,18 +371,7 @@ class SceneManager:
         # Determine category if not provided
         if category is None:
             # Derive category from furniture type
-            if furniture_type in ["Dining Chair", "Office Chair", "Armchair"]:
-                category = "Chairs"
-            elif furniture_type in ["Dining Table", "Coffee Table", "Desk"]:
-                category = "Tables"
-            elif furniture_type in ["2-Seater Sofa", "3-Seater Sofa", "L-Shaped Sofa"]:
-                category = "Sofas"
-            elif furniture_type in ["Single Bed", "Double Bed", "King Size Bed"]:
-                category = "Beds"
-            elif furniture_type in ["Single Door Cupboard", "Double Door Cupboard", "Sliding Door Cupboard"]:
-                category = "Cupboards"
-            else:
-                category = "Miscellaneous"
+            category = _TYPE_TO_CATEGORY.get(furniture_type, "Miscellaneous")
         
         # Create furniture object
         furniture = Furniture(
@@ -229,6 +388,8 @@ class SceneManager:
         
         # Add to scene
         self.add_object(furniture)
+        self._push_history(HistoryEntry("add", furniture.get_id(), new=furniture.to_dict(),
+                                        description=f"Add {furniture_type}"))
         
         return furniture
     
@@ -240,41 +401,19 @@ class SceneManager:
             furniture_type: Type of furniture
             
         Returns:
-            dict: Dictionary with width, depth and height
-        """
-        # Default dimensions for various furniture types (in meters)
-        furniture_dimensions = {
-            # Chairs
-            "Dining Chair": {"width": 0.5, "depth": 0.5, "height": 0.9},
-            "Office Chair": {"width": 0.6, "depth": 0.6, "height": 1.1},
-            "Armchair": {"width": 0.8, "depth": 0.8, "height": 0.8},
-            
-            # Tables
-            "Dining Table": {"width": 1.5, "depth": 0.9, "height": 0.75},
-            "Coffee Table": {"width": 1.0, "depth": 0.6, "height": 0.45},
-            "Desk": {"width": 1.2, "depth": 0.6, "height": 0.75},
-            
-            # Sofas
-            "2-Seater Sofa": {"width": 1.5, "depth": 0.85, "height": 0.7},
-            "3-Seater Sofa": {"width": 2.1, "depth": 0.85, "height": 0.7},
-            "L-Shaped Sofa": {"width": 2.5, "depth": 2.0, "height": 0.7},
-            
-            # Beds
-            "Single Bed": {"width": 0.9, "depth": 2.0, "height": 0.5},
-            "Double Bed": {"width": 1.4, "depth": 2.0, "height": 0.5},
-            "King Size Bed": {"width": 1.8, "depth": 2.0, "height": 0.5},
-            
-            # Cupboards
-            "Single Door Cupboard": {"width": 0.6, "depth": 0.5, "height": 2.0},
-            "Double Door Cupboard": {"width": 1.2, "depth": 0.5, "height": 2.0},
-            "Sliding Door Cupboard": {"width": 1.5, "depth": 0.6, "height": 2.0},
-        }
+            tuple: (width, depth, height)
+        """
+        return _FURNITURE_DIMENSIONS.get(furniture_type, _DEFAULT_DIMENSIONS)
+    
+    def iter_all_objects(self):
+        """
+        Iterate over all objects in the scene without building a list
         
-        # Return dimensions or default if not found
-        if furniture_type in furniture_dimensions:
-            return furniture_dimensions[furniture_type]
-        else:
-            return {"width": 1.0, "depth": 1.0, "height": 1.0}
+        Returns:
+            Iterator over the room, doors, windows and furniture
+        """
+        room = (self.room,) if self.room is not None else ()
+        return chain(room, self.doors, self.windows, self.furniture)
     
     def get_all_objects(self):
         """
@@ -283,34 +422,37 @@ class SceneManager:
         Returns:
             List of all objects in the scene
         """
-        all_objects = []
-        
-        # Add room
-        if self.room is not None:
-            all_objects.append(self.room)
-        
-        # Add doors
-        all_objects.extend(self.doors)
-        
-        # Add windows
-        all_objects.extend(self.windows)
+        return list(self.iter_all_objects())
+    
+    def get_object_count(self):
+        """
+        Get the number of objects in the scene, excluding the room
         
-        # Add furniture
-        all_objects.extend(self.furniture)
+        Returns:
+            int: Number of doors, windows and furniture items
+        """
+        return self._non_room_object_count
+    
+    def compute_model_matrices(self):
+        """
+        Rebuild the model matrices of all scene objects in one vectorized pass
         
-        return all_objects
+        Returns:
+            (N, 4, 4) array of model matrices, one row per attached object
+        """
+        return self.transforms.compute_model_matrices()
     
     def get_object_by_id(self, object_id):
         """
         Get object by ID
         
         Args:
-            object_id: UUID of the object
+            object_id: ID of the object (int, or its string form)
             
         Returns:
             Object or None
         """
-        return self.object_map.get(object_id)
+        return self.object_map.get(_object_key(object_id))
     
     def pick_object(self, screen_x, screen_y, cycle_selection=False, current_object=None):
         """
@@ -325,38 +467,165 @@ class SceneManager:
         Returns:
             Object or None
         """
-        # In a real implementation, this would perform ray casting from the screen coordinates
-        # through the camera's view frustum and into the 3D scene.
+        ray = self._screen_ray(screen_x, screen_y)
+        if ray is None:
+            # No camera to cast from: every object is a candidate
+            return self._cycle_all(current_object if cycle_selection else None)
         
-        # Get all objects in the scene
-        all_objects = self.get_all_objects()
-        
-        # Filter out the room (optional) and sort by distance from camera
-        pickable_objects = [obj for obj in all_objects if obj != self.room]
+        pickable_objects = self._ray_hits(*ray)
         
         # If no objects to pick, return None
         if not pickable_objects:
             return None
             
-        # If cycling through selection and we have a current object
-        if cycle_selection and current_object in pickable_objects:
-            # Find the current object's index
-            current_index = pickable_objects.index(current_object)
-            # Select the next object (wrap around if at the end)
-            next_index = (current_index + 1) % len(pickable_objects)
-            return pickable_objects[next_index]
+        # If cycling through selection, select the hit after the current object
+        # (wrap around if at the end); one identity scan over the few hits
+        if cycle_selection:
+            for index, obj in enumerate(pickable_objects):
+                if obj is current_object:
+                    return pickable_objects[(index + 1) % len(pickable_objects)]
+        
+        # Nearest hit first
+        return pickable_objects[0]
+    
+    def _cycle_all(self, current_object):
+        """
+        Pick from all doors, windows and furniture in collection order
+        
+        The current object's place is found through _bucket_index, so no
+        list of all objects is built or searched.
+        
+        Args:
+            current_object: Object to step past, or None for the first one
             
-        # For non-cycling selection, return the first pickable object
-        # In a real implementation, this would calculate which objects
-        # are actually under the cursor via raycasting, then return them in order
-        # of distance from the camera (nearest first)
-        for obj in pickable_objects:
-            if hasattr(obj, 'position'):
-                # Here we would check if the ray intersects this object
-                # For testing, just return it
-                return obj
+        Returns:
+            Object or None
+        """
+        total = self._non_room_object_count
+        if total == 0:
+            return None
         
+        buckets = (self.doors, self.windows, self.furniture)
+        index = -1
+        if current_object is not None:
+            bucket = self._type_bucket.get(type(current_object))
+            position = self._bucket_index.get(current_object.get_id())
+            if position is not None and bucket[position] is current_object:
+                # Offset by the sizes of the collections that come before it
+                for other in buckets:
+                    if other is bucket:
+                        break
+                    position += len(other)
+                index = position
+        
+        index = (index + 1) % total
+        for bucket in buckets:
+            if index < len(bucket):
+                return bucket[index]
+            index -= len(bucket)
         return None
+    
+    def _screen_ray(self, screen_x, screen_y):
+        """
+        Build a world-space ray through a screen position
+        
+        Args:
+            screen_x: Screen X coordinate
+            screen_y: Screen Y coordinate
+            
+        Returns:
+            (origin, direction) arrays, or None without a camera
+        """
+        if self.camera is None:
+            return None
+        
+        width, height = self.viewport
+        ndc_x = 2.0 * screen_x / max(1, width) - 1.0
+        ndc_y = 1.0 - 2.0 * screen_y / max(1, height)
+        
+        # Unproject points on the near and far planes
+        inverse = np.linalg.inv(self.camera.projection_matrix.astype(np.float64) @
+                                self.camera.view_matrix)
+        near = inverse @ (ndc_x, ndc_y, -1.0, 1.0)
+        far = inverse @ (ndc_x, ndc_y, 1.0, 1.0)
+        near = near[:3] / near[3]
+        far = far[:3] / far[3]
+        
+        direction = far - near
+        return near, direction / np.linalg.norm(direction)
+    
+    def _half_extents(self, obj):
+        """Get the local half size (x, y, z) of a door, window or furniture item"""
+        if isinstance(obj, Furniture):
+            return obj.width / 2, obj.height / 2, obj.depth / 2
+        return obj.width / 2, obj.height / 2, obj.thickness / 2
+    
+    def _center_y(self, obj):
+        """Get the local Y of an object's box center (furniture meshes stand on y = 0)"""
+        return obj.height / 2 if isinstance(obj, Furniture) else 0.0
+    
+    def _index_object(self, obj):
+        """Add or move an object in the picking grid"""
+        hx, hy, hz = self._half_extents(obj)
+        top = hy + abs(self._center_y(obj))
+        
+        # Rotation-independent bound around the origin, so rotating an
+        # object needs no update; covers the box's offset from the origin
+        radius = math.sqrt(hx * hx + top * top + hz * hz) * float(np.max(np.abs(obj.scale)))
+        position = obj.position
+        self._spatial_index.insert(obj.get_id(), float(position[0]), float(position[2]), radius)
+    
+    def _ray_hits(self, origin, direction):
+        """
+        Find the objects hit by a ray
+        
+        Candidates come from the picking grid cells under the part of the
+        ray between floor and ceiling; each is then tested exactly against
+        its oriented bounding box.
+        
+        Args:
+            origin: Ray origin
+            direction: Normalized ray direction
+            
+        Returns:
+            list: Hit objects, nearest first
+        """
+        # Part of the ray inside the floor-to-ceiling slab
+        top = self.room.height if self.room is not None else 3.0
+        if abs(direction[1]) > 1e-6:
+            t0 = -origin[1] / direction[1]
+            t1 = (top - origin[1]) / direction[1]
+            t_min, t_max = max(0.0, min(t0, t1)), max(t0, t1)
+        else:
+            t_min, t_max = 0.0, 100.0
+        if t_max < t_min:
+            return []
+        
+        start = origin + direction * t_min
+        end = origin + direction * t_max
+        candidates = self._spatial_index.query(
+            min(start[0], end[0]), min(start[2], end[2]),
+            max(start[0], end[0]), max(start[2], end[2])
+        )
+        
+        objects = [self.object_map[obj_id] for obj_id in sorted(candidates) if obj_id in self.object_map]
+        if not objects:
+            return []
+        
+        # Slab test against every candidate's box in one compiled loop
+        models = self.transforms.gather_model_matrices(objects).astype(np.float64)
+        half = np.array([self._half_extents(obj) for obj in objects], dtype=np.float64)
+        inverse = np.linalg.inv(models)
+        
+        # Move the local origin to each box center
+        inverse[:, 1, 3] -= [self._center_y(obj) for obj in objects]
+        distance = np.empty(len(objects))
+        ray_box_hits(origin, direction, inverse, half, distance)
+        
+        # Nearest first; candidates are in ID order, so ties stay stable for cycling
+        order = np.flatnonzero(distance >= 0.0)
+        order = order[np.argsort(distance[order], kind="stable")]
+        return [objects[k] for k in order.tolist()]
         
     def cycle_selection(self, screen_x, screen_y):
         """
@@ -388,6 +657,7 @@ class SceneManager:
         # Clear selection state on previously selected object
         if self.selected_object and hasattr(self.selected_object, 'is_selected'):
             self.selected_object.is_selected = False
+            self._saved_dicts.pop(self.selected_object.get_id(), None)
             
         # Set new selected object
         self.selected_object = obj
@@ -395,6 +665,7 @@ class SceneManager:
         # Mark the object as selected for visual highlighting
         if obj and hasattr(obj, 'is_selected'):
             obj.is_selected = True
+            self._saved_dicts.pop(obj.get_id(), None)
         
         # We could also trigger a sound effect or other feedback here
     
@@ -412,28 +683,18 @@ class SceneManager:
         if self.selected_object == self.room:
             return False
         
-        # Save state for undo before deleting
-        self._save_state(f"Delete {self.selected_object.name}")
-        
-        # Remove from collections
-        if isinstance(self.selected_object, Door):
-            if self.selected_object in self.doors:
-                self.doors.remove(self.selected_object)
-        elif isinstance(self.selected_object, Window):
-            if self.selected_object in self.windows:
-                self.windows.remove(self.selected_object)
-        elif isinstance(self.selected_object, Furniture):
-            if self.selected_object in self.furniture:
-                self.furniture.remove(self.selected_object)
-        
-        # Remove from objects dictionary
         object_id = self.selected_object.get_id()
-        if object_id in self.object_map:
-            del self.object_map[object_id]
-            self.selected_object = None
-            return True
+        if object_id not in self.object_map:
+            return False
         
-        return False
+        # Save the object for undo before deleting
+        self._push_history(HistoryEntry("remove", object_id,
+                                        old=self.selected_object.to_dict(),
+                                        description=f"Delete {self.selected_object.name}"))
+        
+        # Swap-and-pop removal from its collection (see _bucket_remove)
+        self.remove_object(object_id)
+        return True
     
     def move_selected_object(self, dx, dy, dz):
         """
@@ -450,37 +711,44 @@ class SceneManager:
         if self.selected_object is None or self.selected_object == self.room:
             return False
         
-        # Get current position
-        current_pos = self.selected_object.position
-        
-        # Calculate new position - use numpy array instead of glm.vec3
-        new_pos = np.array([
-            current_pos[0] + dx,
-            current_pos[1] + dy,
-            current_pos[2] + dz
-        ], dtype=np.float32)
+        # Keep the current position for undo
+        old_pos = self.selected_object.position.copy()
         
-        # Check if new position is within room bounds (with some margin)
-        margin = 0.1
+        # Calculate new position in one float32 add, then clamp it in place
+        new_pos = np.add(old_pos, (dx, dy, dz), dtype=np.float32)
         
         if self.room:
-            half_width = self.room.width / 2 - margin
-            half_length = self.room.length / 2 - margin
-            max_height = self.room.height - margin
-            
-            # Clamp position to room bounds - use numpy functions
-            new_pos[0] = max(-half_width, min(half_width, new_pos[0]))
-            new_pos[1] = max(0, min(max_height, new_pos[1]))
-            new_pos[2] = max(-half_length, min(half_length, new_pos[2]))
+            # Clamp position to room bounds in one vectorized call
+            room_min, room_max = self._room_bounds()
+            np.clip(new_pos, room_min, room_max, out=new_pos)
         
         # Update position
         self.selected_object.position = new_pos
+        self._index_object(self.selected_object)
         
-        # Save state for undo after moving
-        self._save_state(f"Move {self.selected_object.name}")
+        # Save the change for undo
+        self._record_transform("position", old_pos, f"Move {self.selected_object.name}")
         
         return True
     
+    def _room_bounds(self):
+        """
+        Get the range objects can be moved in, inside the room walls
+        
+        Returns:
+            tuple: (min, max) float32 corners, cached until the room is replaced
+        """
+        room = self.room
+        if self._bounds_room is not room:
+            # Keep objects a small margin away from the walls and ceiling
+            margin = 0.1
+            half_width = room.width / 2 - margin
+            half_length = room.length / 2 - margin
+            self._room_min = np.array([-half_width, 0.0, -half_length], dtype=np.float32)
+            self._room_max = np.array([half_width, room.height - margin, half_length], dtype=np.float32)
+            self._bounds_room = room
+        return self._room_min, self._room_max
+    
     def rotate_selected_object(self, dx, dy, dz):
         """
         Rotate the selected object
@@ -496,21 +764,19 @@ class SceneManager:
         if self.selected_object is None or self.selected_object == self.room:
             return False
         
-        # Get current rotation
-        current_rot = self.selected_object.rotation
+        # Keep the current rotation for undo
+        old_rot = self.selected_object.rotation.copy()
         
-        # Calculate new rotation - use numpy array instead of glm.vec3
-        new_rot = np.array([
-            (current_rot[0] + dx) % 360,
-            (current_rot[1] + dy) % 360,
-            (current_rot[2] + dz) % 360
-        ], dtype=np.float32)
+        # Accumulate the Euler deltas in one float32 add and wrap them in place;
+        # the model matrix is only rebuilt when it is next needed
+        new_rot = np.add(old_rot, (dx, dy, dz), dtype=np.float32)
+        np.mod(new_rot, 360, out=new_rot)
         
         # Update rotation
         self.selected_object.rotation = new_rot
         
-        # Save state for undo after rotating
-        self._save_state(f"Rotate {self.selected_object.name}")
+        # Save the change for undo
+        self._record_transform("rotation", old_rot, f"Rotate {self.selected_object.name}")
         
         return True
     
@@ -533,11 +799,15 @@ class SceneManager:
         old_pos = self.selected_object.position.copy()
         
         # Update position
-        self.selected_object.position = np.array([x, y, z], dtype=np.float32)
+        self.selected_object.position = (x, y, z)
+        self._index_object(self.selected_object)
+        self._saved_dicts.pop(self.selected_object.get_id(), None)
         
-        # Save state for undo if position changed significantly
-        if np.linalg.norm(old_pos - self.selected_object.position) > 0.01:
-            self._save_state(f"Move {self.selected_object.name}")
+        # Save state for undo if position changed significantly (squared
+        # distance against 0.01 squared, so no square root is taken)
+        diff = old_pos - self.selected_object.position
+        if diff.dot(diff) > 1e-4:
+            self._record_transform("position", old_pos, f"Move {self.selected_object.name}")
         
         return True
     
@@ -560,11 +830,13 @@ class SceneManager:
         old_rot = self.selected_object.rotation.copy()
         
         # Update rotation
-        self.selected_object.rotation = np.array([x, y, z], dtype=np.float32)
+        self.selected_object.rotation = (x, y, z)
+        self._saved_dicts.pop(self.selected_object.get_id(), None)
         
-        # Save state for undo if rotation changed significantly
-        if np.linalg.norm(old_rot - self.selected_object.rotation) > 0.1:
-            self._save_state(f"Rotate {self.selected_object.name}")
+        # Save state for undo if rotation changed significantly (0.1 squared)
+        diff = old_rot - self.selected_object.rotation
+        if diff.dot(diff) > 1e-2:
+            self._record_transform("rotation", old_rot, f"Rotate {self.selected_object.name}")
         
         return True
     
@@ -576,29 +848,55 @@ class SceneManager:
         self.doors.clear()
         self.windows.clear()
         self.furniture.clear()
+        self._bucket_index.clear()
+        self._saved_dicts.clear()
         self.object_map.clear()
+        self.transforms.clear()
+        self.door_registry.clear()
+        self._spatial_index.clear()
+        self._non_room_object_count = 0
         self.selected_object = None
         self.last_id = 0
         
-        # Create a default empty room
-        self.set_room("Empty Room", 5.0, 5.0, 2.5)
+        # Create a default empty room (part of the same undo step)
+        self._history_paused += 1
+        try:
+            self.set_room("Empty Room", 5.0, 5.0, 2.5)
+        finally:
+            self._history_paused -= 1
     
-    def save_scene(self):
+    def save_scene(self, copy=True):
         """
         Save the scene to a dictionary
         
+        Windows and furniture that have not changed since the previous call
+        reuse the dictionaries built then, so the result must be treated as
+        read-only.
+        
+        Args:
+            copy: Copy mutable object fields; pass False when the result is
+                only serialized (e.g. json.dump) and then discarded
+            
         Returns:
             dict: Scene data
         """
-        scene_data = {
-            "objects": {}
-        }
+        objects = {}
+        saved = self._saved_dicts
         
         # Save all objects
         for obj_id, obj in self.object_map.items():
-            scene_data["objects"][obj_id] = obj.to_dict()
+            key = str(obj_id)
+            if type(obj) not in _SAVE_CACHED_TYPES:
+                objects[key] = obj.to_dict(copy)
+                continue
+            
+            cached = saved.get(obj_id)
+            if cached is None or cached[0] is not obj:
+                # Cached data outlives this call, so it is always a copy
+                cached = saved[obj_id] = (obj, obj.to_dict())
+            objects[key] = cached[1]
         
-        return scene_data
+        return {"objects": objects}
     
     def load_scene(self, scene_data):
         """
@@ -615,6 +913,7 @@ class SceneManager:
             self.clear_scene()
             
             # Reset room reference
+            self.transforms.detach(self.room)
             self.room = None
             
             # Load objects
@@ -622,29 +921,45 @@ class SceneManager:
             
             for obj_id, data in object_data.items():
                 obj_type = data.get("type")
+                obj_id = _object_key(obj_id)
                 
                 if obj_type == "Room":
                     # Create room
                     self.room = Room.from_dict(data)
+                    self.room._id = obj_id
                     self.object_map[obj_id] = self.room
+                    self.transforms.attach(self.room)
                     
                 elif obj_type == "Door":
                     # Create door
                     door = Door.from_dict(data)
+                    door._id = obj_id
                     self.object_map[obj_id] = door
-                    self.doors.append(door)
+                    self._bucket_append(door)
+                    self.transforms.attach(door)
+                    self._index_object(door)
                     
                 elif obj_type == "Window":
                     # Create window
                     window = Window.from_dict(data)
+                    window._id = obj_id
                     self.object_map[obj_id] = window
-                    self.windows.append(window)
+                    self._bucket_append(window)
+                    self.transforms.attach(window)
+                    self._index_object(window)
                     
                 elif obj_type == "Furniture":
                     # Create furniture
                     furniture = Furniture.from_dict(data)
+                    furniture._id = obj_id
                     self.object_map[obj_id] = furniture
-                    self.furniture.append(furniture)
+                    self._bucket_append(furniture)
+                    self.transforms.attach(furniture)
+                    self._index_object(furniture)
+            
+            # Number new objects after the loaded ones
+            self.last_id = max((key + 1 for key in self.object_map if type(key) is int),
+                               default=self.last_id)
             
             # If no room was loaded, create default room
             if self.room is None:
@@ -665,27 +980,36 @@ class SceneManager:
         Args:
             obj: Object to add
         """
-        object_id = str(self.last_id)
+        object_id = self.last_id
         self.last_id += 1
         
         if hasattr(obj, '_id'):
             obj._id = object_id
         
+        self._insert_object(obj)
+        
+        return object_id
+    
+    def _insert_object(self, obj):
+        """
+        Add an object that already has its ID to the scene
+        
+        Args:
+            obj: Object to add
+        """
         # Add to appropriate collection based on type
-        if isinstance(obj, Door):
-            self.doors.append(obj)
-            print(f"Added door: {obj.door_type}, {obj.width}x{obj.height}")
-        elif isinstance(obj, Window):
-            self.windows.append(obj)
-            print(f"Added window: {obj.window_type}, {obj.width}x{obj.height}")
-        elif isinstance(obj, Furniture):
-            self.furniture.append(obj)
-            print(f"Added furniture: {obj.furniture_type}")
+        bucket = self._bucket_append(obj)
+        if bucket is self.doors:
+            log.debug("Added door: %s, %sx%s", obj.door_type, obj.width, obj.height)
+        elif bucket is self.windows:
+            log.debug("Added window: %s, %sx%s", obj.window_type, obj.width, obj.height)
+        elif bucket is self.furniture:
+            log.debug("Added furniture: %s", obj.furniture_type)
         
         # Add to object map for lookup by ID
-        self.object_map[object_id] = obj
-        
-        return object_id
+        self.object_map[obj.get_id()] = obj
+        self.transforms.attach(obj)
+        self._index_object(obj)
     
     def remove_object(self, object_id):
         """
@@ -694,26 +1018,66 @@ class SceneManager:
         Args:
             object_id: ID of object to remove
         """
+        object_id = _object_key(object_id)
         if object_id in self.object_map:
             obj = self.object_map[object_id]
             
             # Remove from the appropriate collection
-            if isinstance(obj, Door):
-                if obj in self.doors:
-                    self.doors.remove(obj)
-            elif isinstance(obj, Window):
-                if obj in self.windows:
-                    self.windows.remove(obj)
-            elif isinstance(obj, Furniture):
-                if obj in self.furniture:
-                    self.furniture.remove(obj)
+            self._bucket_remove(obj)
             
             # Remove from object map
             del self.object_map[object_id]
+            self._saved_dicts.pop(object_id, None)
+            self.transforms.detach(obj)
+            self._spatial_index.remove(object_id)
             
             # If selected object was removed, deselect
             if self.selected_object is obj:
-                self.selected_object = None 
+                self.selected_object = None
+    
+    def _bucket_append(self, obj):
+        """
+        Append an object to the collection for its type
+        
+        Args:
+            obj: Door, window or furniture object
+            
+        Returns:
+            list: The collection, or None for other object types
+        """
+        bucket = self._type_bucket.get(type(obj))
+        if bucket is None:
+            return None
+        
+        self._bucket_index[obj.get_id()] = len(bucket)
+        bucket.append(obj)
+        self._non_room_object_count += 1
+        if bucket is self.doors:
+            self.door_registry.attach(obj)
+        return bucket
+    
+    def _bucket_remove(self, obj):
+        """
+        Remove an object from the collection for its type
+        
+        The last object of the collection takes its place, so removal does
+        not scan or shift the list.
+        
+        Args:
+            obj: Door, window or furniture object
+        """
+        bucket = self._type_bucket.get(type(obj))
+        index = self._bucket_index.pop(obj.get_id(), None)
+        if bucket is None or index is None:
+            return
+        
+        last = bucket.pop()
+        if last is not obj:
+            bucket[index] = last
+            self._bucket_index[last.get_id()] = index
+        self._non_room_object_count -= 1
+        if bucket is self.doors:
+            self.door_registry.detach(obj)
     
     def delete_object(self, object_id):
         """
@@ -725,6 +1089,7 @@ class SceneManager:
         Returns:
             bool: True if successful, False otherwise
         """
+        object_id = _object_key(object_id)
         if object_id not in self.object_map:
             return False
             
@@ -734,8 +1099,9 @@ class SceneManager:
         if obj == self.room:
             return False
             
-        # Save state for undo before deleting
-        self._save_state(f"Delete {obj.name}")
+        # Save the object for undo before deleting
+        self._push_history(HistoryEntry("remove", object_id, old=obj.to_dict(),
+                                        description=f"Delete {obj.name}"))
         
         # Remove the object
         self.remove_object(object_id)
@@ -743,38 +1109,255 @@ class SceneManager:
         return True
     
     # History management methods
+    def _push_history(self, entry):
+        """
+        Add a change to the undo history
+        
+        Args:
+            entry: HistoryEntry describing the change
+        """
+        self._forget_saved(entry)
+        if self._history_paused:
+            return
+        
+        if self._batch_depth:
+            # Merge repeated transforms of the same object (e.g. a drag)
+            entries = self._batch_entries
+            last = entries[-1] if entries else None
+            if (entry.op == "transform" and last is not None and last.op == "transform"
+                    and last.obj_id == entry.obj_id and last.field == entry.field):
+                last.new = entry.new
+            else:
+                entries.append(HistoryEntry(entry.op, entry.obj_id, entry.field, entry.old,
+                                            entry.new, entry.description))
+            return
+        
+        # Oldest entries fall off the deque once max_history is reached
+        self.undo_stack.append(entry)
+        self.redo_stack.clear()
+    
+    def begin_batch(self, description):
+        """
+        Start collecting changes into a single undo step
+        
+        Calls nest; the step is recorded when the outermost batch ends.
+        
+        Args:
+            description: Description of the combined change
+        """
+        if self._batch_depth == 0:
+            self._batch_entries = []
+            self._batch_description = description
+        self._batch_depth += 1
+    
+    def end_batch(self):
+        """Record the changes collected since begin_batch() as one undo step"""
+        if self._batch_depth == 0:
+            return
+        self._batch_depth -= 1
+        if self._batch_depth:
+            return
+        
+        entries = self._batch_entries
+        self._batch_entries = []
+        if len(entries) == 1:
+            self._push_history(entries[0])
+        elif entries:
+            self._push_history(HistoryEntry("group", old=entries,
+                                            description=self._batch_description))
+    
+    @contextmanager
+    def batch_edit(self, description):
+        """
+        Context manager form of begin_batch()/end_batch()
+        
+        Args:
+            description: Description of the combined change
+        """
+        self.begin_batch(description)
+        try:
+            yield self
+        finally:
+            self.end_batch()
+    
+    def _forget_saved(self, entry):
+        """Drop the save_scene() data of the objects a history entry changes"""
+        if entry.op == "group":
+            for sub_entry in entry.old:
+                self._forget_saved(sub_entry)
+        elif entry.op == "scene":
+            self._saved_dicts.clear()
+        elif entry.obj_id is not None:
+            self._saved_dicts.pop(entry.obj_id, None)
+    
+    def _record_transform(self, field, old_value, description):
+        """
+        Record a position or rotation change of the selected object
+        
+        Args:
+            field: "position" or "rotation"
+            old_value: Copy of the value before the change
+            description: Description of the change
+        """
+        obj = self.selected_object
+        self._push_history(HistoryEntry("transform", obj.get_id(), field, old_value,
+                                        getattr(obj, field).copy(), description))
+    
+    def _record_room_change(self, old_room, description):
+        """
+        Record a change to the room
+        
+        Args:
+            old_room: Room.to_dict() data from before the change
+            description: Description of the change
+        """
+        self._push_history(HistoryEntry("room", self.room.get_id(), old=old_room,
+                                        new=self.room.to_dict(), description=description))
+    
+    def _record_room_colors(self, old_colors, description):
+        """
+        Record a change to the room's colors or opacities
+        
+        Args:
+            old_colors: Room.get_color_state() from before the change
+            description: Description of the change
+        """
+        self._push_history(HistoryEntry("room_colors", self.room.get_id(), old=old_colors,
+                                        new=self.room.get_color_state(), description=description))
+    
     def _save_state(self, description=""):
         """
-        Save the current state to history
+        Save a snapshot of the whole scene to history
+        
+        Used for changes that are not recorded as a smaller HistoryEntry,
+        and must be called before the change is made.
         
         Args:
             description: Description of the state change
         """
-        # Get current scene state
-        scene_data = self.save_scene()
-        scene_data["description"] = description
+        # Nothing is recorded while history is paused (undo/redo replay,
+        # nested calls), so skip serializing the whole scene as well
+        if self._history_paused:
+            return
+        
+        self._push_history(HistoryEntry("scene", old=self._snapshot(), description=description))
+    
+    def _snapshot(self):
+        """Capture the room, objects and ID counter for a "scene" history entry"""
+        return {
+            "room": self.room.to_dict() if self.room else None,
+            "scene": self.save_scene(),
+            "last_id": self.last_id
+        }
+    
+    def _restore_snapshot(self, snapshot):
+        """
+        Restore a snapshot taken by _snapshot()
+        
+        Only objects whose saved data differs from the current scene are
+        rebuilt; unchanged objects are kept as they are.
+        
+        Args:
+            snapshot: Dictionary returned by _snapshot()
+        """
+        objects = snapshot["scene"]["objects"]
+        current = self.save_scene()["objects"]
+        
+        # Drop objects that are gone or changed, then create the missing ones
+        for obj_id, data in current.items():
+            if data.get("type") != "Room" and objects.get(obj_id) != data:
+                self.remove_object(obj_id)
+        for obj_id, data in objects.items():
+            if data.get("type") != "Room" and _object_key(obj_id) not in self.object_map:
+                self._insert_object(self._object_from_dict(data))
+        
+        room = snapshot["room"]
+        if room is not None and (self.room is None or self.room.to_dict() != room):
+            self._set_room_data(room)
+        
+        # The room is listed in object_map only if it was at snapshot time
+        for obj_id, data in current.items():
+            if data.get("type") == "Room" and obj_id not in objects:
+                self.object_map.pop(_object_key(obj_id), None)
+        if self.room is not None and str(self.room.get_id()) in objects:
+            self.object_map[self.room.get_id()] = self.room
+        
+        self.last_id = snapshot["last_id"]
+    
+    def _set_room_data(self, data):
+        """Replace the room with one created from Room.to_dict() data"""
+        old_room = self.room
+        listed = False
+        if old_room is not None:
+            self.transforms.detach(old_room)
+            listed = self.object_map.get(old_room.get_id()) is old_room
+            if listed:
+                del self.object_map[old_room.get_id()]
+        
+        self.room = Room.from_dict(data)
+        self.transforms.attach(self.room)
+        if listed:
+            self.object_map[self.room.get_id()] = self.room
+    
+    def _object_from_dict(self, data):
+        """Create a door, window or furniture item from its to_dict() data"""
+        obj_type = data.get("type")
+        if obj_type == "Door":
+            return Door.from_dict(data)
+        elif obj_type == "Window":
+            return Window.from_dict(data)
+        return Furniture.from_dict(data)
+    
+    def _apply_history(self, entry, undo):
+        """
+        Apply a history entry backwards (undo) or forwards (redo)
+        
+        Args:
+            entry: HistoryEntry to apply
+            undo: True to revert the change, False to make it again
+        """
+        op = entry.op
+        self._forget_saved(entry)
+        
+        if op == "transform" or op == "attr":
+            obj = self.object_map.get(entry.obj_id)
+            if obj is not None:
+                setattr(obj, entry.field, entry.old if undo else entry.new)
+                if entry.field == "position":
+                    self._index_object(obj)
+        
+        elif op == "add" or op == "remove":
+            # Undoing a removal or redoing an addition puts the object back
+            if (op == "add") != undo:
+                data = entry.new if op == "add" else entry.old
+                self._insert_object(self._object_from_dict(data))
+            else:
+                self.remove_object(entry.obj_id)
         
-        # If we're not at the end of the history, truncate the future history
-        if self.history_index < len(self.history) - 1:
-            self.history = self.history[:self.history_index + 1]
+        elif op == "room":
+            self._set_room_data(entry.old if undo else entry.new)
+        elif op == "room_colors":
+            if self.room is not None:
+                self.room.set_color_state(entry.old if undo else entry.new)
         
-        # Add the new state to history
-        self.history.append(scene_data)
-        self.history_index = len(self.history) - 1
+        elif op == "scene":
+            if undo:
+                entry.new = self._snapshot()
+                self._restore_snapshot(entry.old)
+            else:
+                self._restore_snapshot(entry.new)
         
-        # Enforce history size limit
-        if len(self.history) > self.max_history:
-            # Remove the oldest state
-            self.history.pop(0)
-            self.history_index -= 1
+        elif op == "group":
+            for sub_entry in (reversed(entry.old) if undo else entry.old):
+                self._apply_history(sub_entry, undo)
     
     def can_undo(self):
         """Check if undo is available"""
-        return self.history_index > 0
+        return bool(self.undo_stack)
     
     def can_redo(self):
         """Check if redo is available"""
-        return self.history_index < len(self.history) - 1
+        return bool(self.redo_stack)
     
     def undo(self):
         """
@@ -786,18 +1369,15 @@ class SceneManager:
         if not self.can_undo():
             return ""
         
-        # Decrement the history index
-        self.history_index -= 1
-        
-        # Get the previous state
-        prev_state = self.history[self.history_index]
-        
-        # Restore that state
-        self.load_scene(prev_state)
+        entry = self.undo_stack.pop()
+        self._history_paused += 1
+        try:
+            self._apply_history(entry, undo=True)
+        finally:
+            self._history_paused -= 1
         
-        # Return the description of what was undone
-        next_state = self.history[self.history_index + 1]
-        return next_state.get("description", "Unknown action")
+        self.redo_stack.append(entry)
+        return entry.description or "Unknown action"
     
     def redo(self):
         """
@@ -809,17 +1389,15 @@ class SceneManager:
         if not self.can_redo():
             return ""
         
-        # Increment the history index
-        self.history_index += 1
-        
-        # Get the next state
-        next_state = self.history[self.history_index]
-        
-        # Restore that state
-        self.load_scene(next_state)
+        entry = self.redo_stack.pop()
+        self._history_paused += 1
+        try:
+            self._apply_history(entry, undo=False)
+        finally:
+            self._history_paused -= 1
         
-        # Return the description of what was redone
-        return next_state.get("description", "Unknown action")
+        self.undo_stack.append(entry)
+        return entry.description or "Unknown action"
     
     # Object selection and interaction methods
     def handle_mouse_click(self, x, y, ctrl_pressed=False):
@@ -866,22 +1444,14 @@ class SceneManager:
         # Delete key - delete selected object
         if key == 'Delete':
             return self.delete_selected_object()
-            
-        # Arrow keys - move selected object
-        if key.startswith('Arrow'):
-            direction = key.replace('Arrow', '').lower()
-            move_amount = 0.1  # Move by 10cm
-            
-            if direction == 'left':
-                return self.move_selected_object(-move_amount, 0, 0)
-            elif direction == 'right':
-                return self.move_selected_object(move_amount, 0, 0)
-            elif direction == 'up':
-                return self.move_selected_object(0, 0, -move_amount)
-            elif direction == 'down':
-                return self.move_selected_object(0, 0, move_amount)
-                
-        return False
+        
+        # Arrow keys - move selected object by 10cm
+        step = _MOVE_KEYS.get(key)
+        if step is None:
+            return False
+        move_amount = 0.1
+        return self.move_selected_object(step[0] * move_amount, step[1] * move_amount,
+                                         step[2] * move_amount)
     
     def handle_rotation_key(self, key):
         """
@@ -893,31 +1463,13 @@ class SceneManager:
         Returns:
             bool: True if the key was handled
         """
-        # Default rotation amount
-        rotation_amount = 15  # Rotate by 15 degrees
-        
-        # R + Arrow keys - rotate selected object
-        if key.startswith('Arrow'):
-            direction = key.replace('Arrow', '').lower()
-            
-            # Regular arrow keys handle Y-axis (yaw) rotation
-            if direction == 'left':
-                return self.rotate_selected_object(0, -rotation_amount, 0)
-            elif direction == 'right':
-                return self.rotate_selected_object(0, rotation_amount, 0)
-            # Up/down handle X-axis (pitch) rotation 
-            elif direction == 'up':
-                return self.rotate_selected_object(-rotation_amount, 0, 0)
-            elif direction == 'down':
-                return self.rotate_selected_object(rotation_amount, 0, 0)
-        
-        # Additional keys for Z-axis (roll) rotation
-        elif key == 'z':
-            return self.rotate_selected_object(0, 0, -rotation_amount)
-        elif key == 'x':
-            return self.rotate_selected_object(0, 0, rotation_amount)
-                
-        return False
+        # R + arrow keys and z/x - rotate selected object by 15 degrees
+        step = _ROTATION_KEYS.get(key)
+        if step is None:
+            return False
+        rotation_amount = 15
+        return self.rotate_selected_object(step[0] * rotation_amount, step[1] * rotation_amount,
+                                           step[2] * rotation_amount)
     
     def handle_mouse_drag(self, x, y, dx, dy, mode='select'):
         """
@@ -935,27 +1487,33 @@ class SceneManager:
         """
         if self.selected_object is None:
             return False
-            
-        if mode == 'move':
-            # Convert screen dx/dy to 3D movement
-            # This is simplified and would need proper 3D calculations in real implementation
-            move_scale = 0.01  # Scaling factor
-            return self.move_selected_object(
-                dx * move_scale,
-                0,  # Don't change height with mouse drag
-                dy * move_scale
-            )
-            
-        elif mode == 'rotate':
-            # Convert screen dx/dy to rotation
-            rotation_scale = 0.5  # Scaling factor
-            return self.rotate_selected_object(
-                dy * rotation_scale,  # Pitch (around X)
-                dx * rotation_scale,  # Yaw (around Y)
-                0                     # Roll (around Z)
-            )
-            
-        return False
+        
+        handler = self._DRAG_HANDLERS.get(mode)
+        return handler(self, dx, dy) if handler is not None else False
+    
+    def _drag_move(self, dx, dy):
+        """Move the selected object on the floor plane by a screen drag"""
+        # Convert screen dx/dy to 3D movement
+        # This is simplified and would need proper 3D calculations in real implementation
+        move_scale = 0.01  # Scaling factor
+        return self.move_selected_object(
+            dx * move_scale,
+            0,  # Don't change height with mouse drag
+            dy * move_scale
+        )
+    
+    def _drag_rotate(self, dx, dy):
+        """Rotate the selected object by a screen drag"""
+        # Convert screen dx/dy to rotation
+        rotation_scale = 0.5  # Scaling factor
+        return self.rotate_selected_object(
+            dy * rotation_scale,  # Pitch (around X)
+            dx * rotation_scale,  # Yaw (around Y)
+            0                     # Roll (around Z)
+        )
+    
+    # handle_mouse_drag() handler per interaction mode
+    _DRAG_HANDLERS = {"move": _drag_move, "rotate": _drag_rotate}
     
     # Color management methods
     def set_object_color(self, obj, color_hex, opacity=1.0):
@@ -965,31 +1523,22 @@ class SceneManager:
         Args:
             obj: Object to set color for
             color_hex: Hex color code (e.g. "#FF0000" for red)
-            opacity: Opacity value (0.0 to 1.0)
+            opacity: Unused, objects have no opacity of their own
             
         Returns:
             bool: True if successful
         """
         if obj is None:
             return False
-            
-        # Save state for undo before changing color
-        self._save_state(f"Change {obj.name} color to {color_hex}")
         
         # Set color attribute - use RGB format for internal storage
-        if hasattr(obj, 'color'):
-            if obj == self.room:
-                # For room objects, use _hex_to_rgb conversion
-                obj.color = self._hex_to_rgb(color_hex)
-            elif isinstance(obj, (Door, Furniture)):
-                # For Door and Furniture, always store as RGB list
-                obj.color = self._hex_to_rgb(color_hex)
-            else:
-                # For other objects, store as hex string
-                obj.color = color_hex
+        if isinstance(obj, _COLORED_TYPES):
+            old_color = obj.color
+            obj.color = self._hex_to_rgb(color_hex)
             
-        if hasattr(obj, 'opacity'):
-            obj.opacity = opacity
+            # Save the change for undo
+            self._push_history(HistoryEntry("attr", obj.get_id(), "color", old_color, obj.color,
+                                            f"Change {obj.name} color to {color_hex}"))
         
         return True
     
@@ -1000,40 +1549,38 @@ class SceneManager:
         Args:
             obj_type: Type of object ('room', 'door', 'window', 'furniture')
             color_hex: Hex color code
-            opacity: Opacity value (0.0 to 1.0)
+            opacity: Unused, objects have no opacity of their own
             
         Returns:
             int: Number of objects updated
         """
-        count = 0
-        
-        # Save state for undo before changing colors
-        self._save_state(f"Change all {obj_type} colors to {color_hex}")
-        
-        if obj_type.lower() == 'door':
-            # Update all doors
-            for door in self.doors:
-                if hasattr(door, 'color'):
-                    door.color = self._hex_to_rgb(color_hex)
-                if hasattr(door, 'opacity'):
-                    door.opacity = opacity
-                count += 1
-        elif obj_type.lower() == 'window':
-            # Update all windows
-            for window in self.windows:
-                if hasattr(window, 'color'):
-                    window.color = color_hex
-                if hasattr(window, 'opacity'):
-                    window.opacity = opacity
-                count += 1
-        elif obj_type.lower() == 'furniture':
-            # Update all furniture
-            for furniture in self.furniture:
-                if hasattr(furniture, 'color'):
-                    furniture.color = self._hex_to_rgb(color_hex)
-                if hasattr(furniture, 'opacity'):
-                    furniture.opacity = opacity
-                count += 1
+        kind = obj_type.lower()
+        if kind == 'door':
+            objects = self.doors
+        elif kind == 'furniture':
+            objects = self.furniture
+        elif kind == 'window':
+            # Windows have no single color to change, but are still counted
+            return len(self.windows)
+        else:
+            return 0
+        
+        # Colors of the updated objects before the change, for undo
+        old_colors = []
+        
+        # Convert the color once for the whole collection
+        color = self._hex_to_rgb(color_hex)
+        for obj in objects:
+            old_colors.append((obj, obj.color))
+            obj.color = color
+        count = len(objects)
+        
+        # Save the changes for undo as a single step
+        if old_colors:
+            self._push_history(HistoryEntry("group", old=[
+                HistoryEntry("attr", obj.get_id(), "color", old_color, obj.color)
+                for obj, old_color in old_colors
+            ], description=f"Change all {obj_type} colors to {color_hex}"))
         
         return count
     
@@ -1049,59 +1596,32 @@ class SceneManager:
         if self.room is None:
             return
         
-        # Save state for undo
-        self._save_state(f"Change {component} color")
+        # Remember the room colors for undo
+        old_colors = self.room.get_color_state()
         
         # Convert hex color to RGB
         color_rgb = self._hex_to_rgb(color_hex)
         
         # Set color based on component
+        room = self.room
         if component == "walls":
             # When setting all walls, make sure to update both the default color and clear any individual settings
-            self.room.wall_color = color_rgb
-            self.room._north_wall_color = None
-            self.room._south_wall_color = None
-            self.room._east_wall_color = None
-            self.room._west_wall_color = None
-            self.room.wall_opacity = opacity
-        elif component == "north_wall":
-            self.room.north_wall_color = color_rgb
-            # Also update default if this is the first wall being set
-            if (self.room._south_wall_color is None and 
-                self.room._east_wall_color is None and 
-                self.room._west_wall_color is None):
-                self.room.wall_color = color_rgb
-            self.room.wall_opacity = opacity
-        elif component == "south_wall":
-            self.room.south_wall_color = color_rgb
-            # Also update default if this is the first wall being set
-            if (self.room._north_wall_color is None and 
-                self.room._east_wall_color is None and 
-                self.room._west_wall_color is None):
-                self.room.wall_color = color_rgb
-            self.room.wall_opacity = opacity
-        elif component == "east_wall":
-            self.room.east_wall_color = color_rgb
+            room.wall_color = color_rgb
+            room.clear_wall_colors()
+            room.wall_opacity = opacity
+        elif component in _EXTERIOR_WALL_COMPONENTS:
+            color_attr, wall = _EXTERIOR_WALL_COMPONENTS[component]
+            setattr(room, color_attr, color_rgb)
             # Also update default if this is the first wall being set
-            if (self.room._north_wall_color is None and 
-                self.room._south_wall_color is None and 
-                self.room._west_wall_color is None):
-                self.room.wall_color = color_rgb
-            self.room.wall_opacity = opacity
-        elif component == "west_wall":
-            self.room.west_wall_color = color_rgb
-            # Also update default if this is the first wall being set
-            if (self.room._north_wall_color is None and 
-                self.room._south_wall_color is None and 
-                self.room._east_wall_color is None):
-                self.room.wall_color = color_rgb
-            self.room.wall_opacity = opacity
-        elif component == "floor":
-            self.room.floor_color = color_rgb
-            self.room.floor_opacity = opacity
-        elif component == "ceiling":
-            self.room.ceiling_color = color_rgb
-            self.room.ceiling_opacity = opacity
+            if not room.has_other_wall_color(wall):
+                room.wall_color = color_rgb
+            room.wall_opacity = opacity
+        elif component in _EXTERIOR_SURFACE_COMPONENTS:
+            color_attr, opacity_attr = _EXTERIOR_SURFACE_COMPONENTS[component]
+            setattr(room, color_attr, color_rgb)
+            setattr(room, opacity_attr, opacity)
+        
+        self._record_room_colors(old_colors, f"Change {component} color")
     
     def set_room_interior_color(self, color_hex, opacity=1.0, component="interior_walls"):
         """
@@ -1115,40 +1635,26 @@ class SceneManager:
         if self.room is None:
             return
         
-        # Save state for undo
-        self._save_state(f"Change interior {component} color")
+        # Remember the room colors for undo
+        old_colors = self.room.get_color_state()
         
         # Convert hex color to RGB
         color_rgb = self._hex_to_rgb(color_hex)
         
         # Set color based on component
-        if component == "interior_walls":
-            self.room.interior_wall_color = color_rgb
-            self.room.wall_opacity = opacity
-        elif component == "interior_north_wall":
-            self.room.interior_north_wall_color = color_rgb
-            self.room.wall_opacity = opacity
-        elif component == "interior_south_wall":
-            self.room.interior_south_wall_color = color_rgb
-            self.room.wall_opacity = opacity
-        elif component == "interior_east_wall":
-            self.room.interior_east_wall_color = color_rgb
-            self.room.wall_opacity = opacity
-        elif component == "interior_west_wall":
-            self.room.interior_west_wall_color = color_rgb
-            self.room.wall_opacity = opacity
-        elif component == "interior_floor":
-            self.room.interior_floor_color = color_rgb
-            self.room.floor_opacity = opacity
-        elif component == "interior_ceiling":
-            self.room.interior_ceiling_color = color_rgb
-            self.room.ceiling_opacity = opacity
+        fields = _INTERIOR_COMPONENTS.get(component)
+        if fields is not None:
+            color_attr, opacity_attr = fields
+            setattr(self.room, color_attr, color_rgb)
+            setattr(self.room, opacity_attr, opacity)
         
         # Update the corresponding exterior colors if interior colors are changed
         # (only if they haven't been explicitly set)
-        if component == "interior_walls" and self.room._wall_color == [0.9, 0.9, 0.9]:
+        if component == "interior_walls" and np.allclose(self.room.wall_color, [0.9, 0.9, 0.9]):
             # Default wall color not changed, sync with interior
             self.room.wall_color = color_rgb
+        
+        self._record_room_colors(old_colors, f"Change interior {component} color")
     
     def _hex_to_rgb(self, hex_color):
         """
@@ -1158,27 +1664,11 @@ class SceneManager:
             hex_color: Hex color string (e.g., "#FF0000")
             
         Returns:
-            list: [r, g, b] with values 0-1
+            tuple: Shared (r, g, b) tuple with values 0-1
         """
         # Check if already an RGB array
         if isinstance(hex_color, (list, tuple)) and len(hex_color) >= 3:
-            return hex_color
+            return intern_color(hex_color)
         
-        # Convert hex to RGB
-        hex_color = hex_color.lstrip('#')
-        try:
-            if len(hex_color) == 6:
-                r = int(hex_color[0:2], 16) / 255.0
-                g = int(hex_color[2:4], 16) / 255.0
-                b = int(hex_color[4:6], 16) / 255.0
-                return [r, g, b]
-            elif len(hex_color) == 3:
-                r = int(hex_color[0] + hex_color[0], 16) / 255.0
-                g = int(hex_color[1] + hex_color[1], 16) / 255.0
-                b = int(hex_color[2] + hex_color[2], 16) / 255.0
-                return [r, g, b]
-        except:
-            pass
-        
-        # Return white as default if conversion fails
-        return [1.0, 1.0, 1.0] 
\ No newline at end of file
+        # Convert hex to RGB (parsed once per distinct string, white if invalid)
+        return hex_to_rgb(hex_color) 
\ No newline at end of file
@@ -0,0 +1,101 @@
+import math
+
+class SpatialGrid:
+    """
+    Uniform grid over the floor plane (X/Z) for finding objects near a ray
+    
+    Each object is stored in every cell its bounding circle overlaps, so a
+    query only has to look at the objects registered in the cells it covers.
+    Cells are kept in a dictionary, so the grid needs no fixed extent.
+    """
+    __slots__ = ("cell_size", "cells", "_object_cells")
+    
+    def __init__(self, cell_size=1.0):
+        """
+        Initialize the grid
+        
+        Args:
+            cell_size: Cell edge length in meters
+        """
+        self.cell_size = cell_size
+        self.cells = {}  # (i, j) -> set of object IDs
+        self._object_cells = {}  # object ID -> cells the object is stored in
+    
+    def _cell_range(self, min_x, min_z, max_x, max_z):
+        """Get the cells overlapping a rectangle on the floor plane"""
+        size = self.cell_size
+        i0, i1 = math.floor(min_x / size), math.floor(max_x / size)
+        j0, j1 = math.floor(min_z / size), math.floor(max_z / size)
+        return [(i, j) for i in range(i0, i1 + 1) for j in range(j0, j1 + 1)]
+    
+    def insert(self, obj_id, x, z, radius):
+        """
+        Add an object, replacing any previous entry for the same ID
+        
+        Args:
+            obj_id: Object ID
+            x, z: Object center on the floor plane
+            radius: Radius of a circle enclosing the object's footprint
+        """
+        if obj_id in self._object_cells:
+            self.remove(obj_id)
+        
+        cells = self._cell_range(x - radius, z - radius, x + radius, z + radius)
+        for cell in cells:
+            bucket = self.cells.get(cell)
+            if bucket is None:
+                self.cells[cell] = {obj_id}
+            else:
+                bucket.add(obj_id)
+        self._object_cells[obj_id] = cells
+    
+    def remove(self, obj_id):
+        """
+        Remove an object (does nothing if it is not in the grid)
+        
+        Args:
+            obj_id: Object ID
+        """
+        cells = self._object_cells.pop(obj_id, None)
+        if cells is None:
+            return
+        
+        for cell in cells:
+            bucket = self.cells[cell]
+            bucket.discard(obj_id)
+            if not bucket:
+                del self.cells[cell]
+    
+    def clear(self):
+        """Remove all objects"""
+        self.cells.clear()
+        self._object_cells.clear()
+    
+    def query(self, min_x, min_z, max_x, max_z):
+        """
+        Find the objects stored in the cells overlapping a rectangle
+        
+        Args:
+            min_x, min_z: Minimum corner on the floor plane
+            max_x, max_z: Maximum corner on the floor plane
+            
+        Returns:
+            set: IDs of candidate objects
+        """
+        found = set()
+        size = self.cell_size
+        i0, i1 = math.floor(min_x / size), math.floor(max_x / size)
+        j0, j1 = math.floor(min_z / size), math.floor(max_z / size)
+        
+        # Walk whichever is smaller: the covered cells or the occupied ones
+        if (i1 - i0 + 1) * (j1 - j0 + 1) <= len(self.cells):
+            for i in range(i0, i1 + 1):
+                for j in range(j0, j1 + 1):
+                    bucket = self.cells.get((i, j))
+                    if bucket:
+                        found.update(bucket)
+        else:
+            for (i, j), bucket in self.cells.items():
+                if i0 <= i <= i1 and j0 <= j <= j1:
+                    found.update(bucket)
+        return found
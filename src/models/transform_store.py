@@ -0,0 +1,174 @@
+import numpy as np
+from src.rendering.matrix import batch_trs, mat4_stack
+
+class TransformStore:
+    """
+    Structure-of-arrays storage for object positions, rotations and scales
+    
+    Attached objects read and write their transform through views into rows
+    of these arrays, so the model matrices of the whole scene can be rebuilt
+    with a handful of vectorized NumPy operations.
+    """
+    __slots__ = ("count", "objects", "any_dirty", "dirty",
+                 "positions", "rotations", "scales", "model_matrices")
+    
+    def __init__(self, capacity=16):
+        """
+        Initialize the store
+        
+        Args:
+            capacity: Number of rows to allocate up front (grows as needed)
+        """
+        self.count = 0
+        self.objects = []
+        self.any_dirty = False
+        
+        # Rows whose transform changed since the last rebuild
+        self.dirty = np.zeros(capacity, dtype=bool)
+        
+        self.positions = np.zeros((capacity, 3), dtype=np.float32)
+        self.rotations = np.zeros((capacity, 3), dtype=np.float32)
+        self.scales = np.ones((capacity, 3), dtype=np.float32)
+        self.model_matrices = mat4_stack(capacity)
+    
+    def _grow(self):
+        """Double the capacity and re-point attached objects at the new rows"""
+        capacity = 2 * len(self.positions)
+        count = self.count
+        
+        positions = np.zeros((capacity, 3), dtype=np.float32)
+        rotations = np.zeros((capacity, 3), dtype=np.float32)
+        scales = np.ones((capacity, 3), dtype=np.float32)
+        model_matrices = mat4_stack(capacity)
+        dirty = np.zeros(capacity, dtype=bool)
+        
+        positions[:count] = self.positions[:count]
+        rotations[:count] = self.rotations[:count]
+        scales[:count] = self.scales[:count]
+        model_matrices[:count] = self.model_matrices[:count]
+        dirty[:count] = self.dirty[:count]
+        
+        self.positions = positions
+        self.rotations = rotations
+        self.scales = scales
+        self.model_matrices = model_matrices
+        self.dirty = dirty
+        
+        for index, obj in enumerate(self.objects):
+            obj._bind_transform(self, index)
+    
+    def attach(self, obj):
+        """
+        Move an object's transform into the store
+        
+        Args:
+            obj: BaseObject to attach
+        """
+        if obj._transform_store is self:
+            return
+        if obj._transform_store is not None:
+            obj._transform_store.detach(obj)
+        
+        if self.count == len(self.positions):
+            self._grow()
+        
+        index = self.count
+        self.positions[index] = obj._position
+        self.rotations[index] = obj._rotation
+        self.scales[index] = obj._scale
+        
+        self.objects.append(obj)
+        self.count += 1
+        obj._bind_transform(self, index)
+        self.mark_dirty(index)
+    
+    def detach(self, obj):
+        """
+        Give an object its own transform arrays again and free its row
+        
+        Args:
+            obj: BaseObject to detach
+        """
+        if obj._transform_store is not self:
+            return
+        
+        index = obj._transform_index
+        obj._bind_transform(None, -1)
+        
+        # Fill the hole with the last row so the arrays stay packed
+        last = self.count - 1
+        if index != last:
+            moved = self.objects[last]
+            self.positions[index] = self.positions[last]
+            self.rotations[index] = self.rotations[last]
+            self.scales[index] = self.scales[last]
+            self.model_matrices[index] = self.model_matrices[last]
+            self.dirty[index] = self.dirty[last]
+            self.objects[index] = moved
+            moved._bind_transform(self, index)
+        
+        self.dirty[last] = False
+        self.objects.pop()
+        self.count -= 1
+    
+    def clear(self):
+        """Detach all objects"""
+        for obj in self.objects:
+            obj._bind_transform(None, -1)
+        self.objects.clear()
+        self.count = 0
+        self.dirty[:] = False
+        self.any_dirty = False
+    
+    def mark_dirty(self, index):
+        """
+        Flag a row for rebuilding on the next compute_model_matrices() call
+        
+        Args:
+            index: Row index of the changed object
+        """
+        self.dirty[index] = True
+        self.any_dirty = True
+    
+    def compute_model_matrices(self):
+        """
+        Rebuild the model matrices of attached objects whose transform changed
+        
+        Only rows flagged dirty are recomputed; the rest keep their cached
+        matrices. Rotations are stored in degrees.
+        
+        Returns:
+            (N, 4, 4) float32 array of model matrices
+        """
+        count = self.count
+        out = self.model_matrices[:count]
+        if not self.any_dirty:
+            return out
+        
+        dirty = self.dirty[:count]
+        if dirty.all():
+            batch_trs(self.positions[:count], np.radians(self.rotations[:count]),
+                      self.scales[:count], out=out)
+        else:
+            rows = np.flatnonzero(dirty)
+            out[rows] = batch_trs(self.positions[rows], np.radians(self.rotations[rows]),
+                                  self.scales[rows])
+        
+        dirty[:] = False
+        self.any_dirty = False
+        return out
+    
+    def gather_model_matrices(self, objects):
+        """
+        Get the model matrices of several attached objects as one array
+        
+        Args:
+            objects: Sequence of objects attached to this store
+            
+        Returns:
+            (K, 4, 4) float32 array, one row per object in the given order
+        """
+        if self.any_dirty:
+            self.compute_model_matrices()
+        rows = np.fromiter((obj._transform_index for obj in objects), dtype=np.intp, count=len(objects))
+        return self.model_matrices[rows]
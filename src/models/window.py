@@ -1,9 +1,30 @@
-from src.models.base_object import BaseObject
+from src.models.base_object import BaseObject, ORIGIN, dict_setter
+from src.models.colors import intern_color
+
+# Minimum window dimensions in meters
+_MIN_WINDOW_SIZE = 0.5
+_MIN_WINDOW_THICKNESS = 0.05
 
 class Window(BaseObject):
     """
     Represents a window in the 3D scene
     """
+    __slots__ = ("_window_type", "_width", "_height", "_thickness", "_frame_color",
+                 "_glass_color", "_glass_transparency", "_texture", "_open_percentage",
+                 "_is_open", "_angle", "_segments")
+    
+    _FROM_DICT_SETTERS = {
+        **BaseObject._FROM_DICT_SETTERS,
+        "thickness": dict_setter("thickness"),
+        "frame_color": dict_setter("frame_color", intern_color),
+        "glass_color": dict_setter("glass_color", intern_color),
+        "glass_transparency": dict_setter("glass_transparency"),
+        "texture": dict_setter("texture"),
+        "open_percentage": dict_setter("open_percentage"),
+        "segments": dict_setter("segments"),
+        "angle": dict_setter("angle"),  # Only applied to bay windows by the setter
+    }
+    
     def __init__(self, window_id, name, window_type, width, height, position=None, rotation=None):
         """
         Initialize a window
@@ -20,13 +41,15 @@ class Window(BaseObject):
         super().__init__(window_id, name, position, rotation)
         
         self._window_type = window_type
-        self._width = max(0.5, float(width))
-        self._height = max(0.5, float(height))
+        width = float(width)
+        self._width = width if width > _MIN_WINDOW_SIZE else _MIN_WINDOW_SIZE
+        height = float(height)
+        self._height = height if height > _MIN_WINDOW_SIZE else _MIN_WINDOW_SIZE
         self._thickness = 0.1  # Window frame thickness in meters
         
         # Window appearance and state
-        self._frame_color = [0.95, 0.95, 0.95]  # White frame like in the reference image
-        self._glass_color = [0.95, 0.97, 0.99, 0.4]  # Very light blue with transparency
+        self._frame_color = (0.95, 0.95, 0.95)  # White frame like in the reference image
+        self._glass_color = (0.95, 0.97, 0.99, 0.4)  # Very light blue with transparency
         self._glass_transparency = 0.6  # Slightly more transparent for realistic glass
         self._texture = None
         self._open_percentage = 0  # Window open state (0 = closed, 100 = fully open)
@@ -58,7 +81,8 @@ class Window(BaseObject):
     
     @width.setter
     def width(self, width):
-        self._width = max(0.5, float(width))
+        width = float(width)
+        self._width = width if width > _MIN_WINDOW_SIZE else _MIN_WINDOW_SIZE
     
     @property
     def height(self):
@@ -66,7 +90,8 @@ class Window(BaseObject):
     
     @height.setter
     def height(self, height):
-        self._height = max(0.5, float(height))
+        height = float(height)
+        self._height = height if height > _MIN_WINDOW_SIZE else _MIN_WINDOW_SIZE
     
     @property
     def thickness(self):
@@ -74,7 +99,8 @@ class Window(BaseObject):
     
     @thickness.setter
     def thickness(self, thickness):
-        self._thickness = max(0.05, float(thickness))
+        thickness = float(thickness)
+        self._thickness = thickness if thickness > _MIN_WINDOW_THICKNESS else _MIN_WINDOW_THICKNESS
     
     @property
     def frame_color(self):
@@ -167,17 +193,27 @@ class Window(BaseObject):
         else:
             self.open()
     
-    def to_dict(self):
+    def to_dict(self, copy=True):
         """
         Convert window to dictionary for serialization
         
+        Args:
+            copy: Copy mutable containers (see Furniture.to_dict)
+            
         Returns:
             dict: Window data
         """
-        data = super().to_dict()
-        
-        # Add window-specific properties
-        data.update({
+        # Built as one literal (base fields read inline) rather than through
+        # super().to_dict(), since this runs for every window on each save
+        data = {
+            "id": self._id,
+            "name": self._name,
+            "position": self._position.tolist(),
+            "rotation": self._rotation.tolist(),
+            "scale": self._scale.tolist(),
+            "visible": self._visible,
+            "selectable": self._selectable,
+            "is_selected": self._is_selected,
             "type": "Window",
             "window_type": self._window_type,
             "width": self._width,
@@ -189,7 +225,7 @@ class Window(BaseObject):
             "open_percentage": self._open_percentage,
             "is_open": self._is_open,
             "segments": self._segments
-        })
+        }
         
         # Add bay window angle if applicable
         if self._window_type == "Bay Window":
@@ -218,38 +254,11 @@ class Window(BaseObject):
             window_type=data["window_type"],
             width=data["width"],
             height=data["height"],
-            position=data.get("position", [0, 0, 0]),
-            rotation=data.get("rotation", [0, 0, 0])
+            position=data.get("position", ORIGIN),
+            rotation=data.get("rotation", ORIGIN)
         )
         
-        # Set appearance properties
-        if "thickness" in data:
-            window.thickness = data["thickness"]
-        if "frame_color" in data:
-            window.frame_color = data["frame_color"]
-        if "glass_color" in data:
-            window.glass_color = data["glass_color"]
-        if "glass_transparency" in data:
-            window.glass_transparency = data["glass_transparency"]
-        if "texture" in data:
-            window.texture = data["texture"]
-        
-        # Set state
-        if "open_percentage" in data:
-            window.open_percentage = data["open_percentage"]
-        
-        # Set bay window properties
-        if "segments" in data:
-            window.segments = data["segments"]
-        if "angle" in data and window.window_type == "Bay Window":
-            window.angle = data["angle"]
-        
-        # Set additional base properties
-        if "scale" in data:
-            window.scale = data["scale"]
-        if "visible" in data:
-            window.visible = data["visible"]
-        if "selectable" in data:
-            window.selectable = data["selectable"]
+        # Set appearance, state, bay window and base properties
+        window._apply_dict_fields(data)
         
         return window 
\ No newline at end of file
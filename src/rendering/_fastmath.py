@@ -0,0 +1,280 @@
+"""
+Matrix and bulk-data kernels, compiled with Numba when it is available
+
+Every kernel writes into a caller-provided buffer so that hot paths do not
+allocate. Without Numba the same functions run as plain Python.
+"""
+import math
+import numpy as np
+
+# Use Numba for JIT compilation if available
+try:
+    from numba import njit
+    USE_NUMBA = True
+except ImportError:
+    USE_NUMBA = False
+    
+    def njit(*args, **kwargs):
+        """Stand-in for numba.njit that returns the function unchanged"""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+@njit(cache=True, fastmath=True)
+def fill_trs(out, px, py, pz, rx, ry, rz, sx, sy, sz):
+    """
+    Write a Translation * RotX * RotY * RotZ * Scale model matrix
+    
+    Args:
+        out: 4x4 float32 output buffer
+        px, py, pz: Translation
+        rx, ry, rz: Rotation angles in degrees, applied in X, Y, Z order
+        sx, sy, sz: Per-axis scale
+    """
+    rx = math.radians(rx)
+    ry = math.radians(ry)
+    rz = math.radians(rz)
+    cx, snx = math.cos(rx), math.sin(rx)
+    cy, sny = math.cos(ry), math.sin(ry)
+    cz, snz = math.cos(rz), math.sin(rz)
+    
+    out[0, 0] = cy * cz * sx
+    out[0, 1] = cy * snz * sy
+    out[0, 2] = -sny * sz
+    out[0, 3] = px
+    out[1, 0] = (snx * sny * cz - cx * snz) * sx
+    out[1, 1] = (snx * sny * snz + cx * cz) * sy
+    out[1, 2] = snx * cy * sz
+    out[1, 3] = py
+    out[2, 0] = (cx * sny * cz + snx * snz) * sx
+    out[2, 1] = (cx * sny * snz - snx * cz) * sy
+    out[2, 2] = cx * cy * sz
+    out[2, 3] = pz
+    out[3, 0] = 0.0
+    out[3, 1] = 0.0
+    out[3, 2] = 0.0
+    out[3, 3] = 1.0
+
+@njit(cache=True, fastmath=True)
+def fill_axis_trs(out, px, py, pz, x, y, z, angle, sx, sy, sz):
+    """
+    Write a Translation * Rotation(axis, angle) * Scale matrix
+    
+    Args:
+        out: 4x4 float32 output buffer
+        px, py, pz: Translation
+        x, y, z: Rotation axis, normalized here
+        angle: Rotation angle in radians (counter-clockwise about the axis)
+        sx, sy, sz: Per-axis scale
+    """
+    norm = math.sqrt(x * x + y * y + z * z)
+    if norm > 0.0:
+        x /= norm
+        y /= norm
+        z /= norm
+    c = math.cos(angle)
+    s = math.sin(angle)
+    t = 1.0 - c
+    
+    # Rotation columns, each scaled by its axis
+    out[0, 0] = (t * x * x + c) * sx
+    out[1, 0] = (t * x * y + s * z) * sx
+    out[2, 0] = (t * x * z - s * y) * sx
+    out[0, 1] = (t * x * y - s * z) * sy
+    out[1, 1] = (t * y * y + c) * sy
+    out[2, 1] = (t * y * z + s * x) * sy
+    out[0, 2] = (t * x * z + s * y) * sz
+    out[1, 2] = (t * y * z - s * x) * sz
+    out[2, 2] = (t * z * z + c) * sz
+    out[0, 3] = px
+    out[1, 3] = py
+    out[2, 3] = pz
+    out[3, 0] = 0.0
+    out[3, 1] = 0.0
+    out[3, 2] = 0.0
+    out[3, 3] = 1.0
+
+@njit(cache=True, fastmath=True)
+def fill_lookat(out, eye, center, up):
+    """
+    Write a view matrix looking from eye to center (same result as matrix.lookAt)
+    
+    Args:
+        out: 4x4 float32 output buffer
+        eye: Camera position
+        center: Target position
+        up: Up vector
+    """
+    # Forward
+    fx = center[0] - eye[0]
+    fy = center[1] - eye[1]
+    fz = center[2] - eye[2]
+    norm = math.sqrt(fx * fx + fy * fy + fz * fz)
+    if norm >= 1e-10:
+        fx /= norm
+        fy /= norm
+        fz /= norm
+    
+    # Side = forward x up
+    sx = fy * up[2] - fz * up[1]
+    sy = fz * up[0] - fx * up[2]
+    sz = fx * up[1] - fy * up[0]
+    norm = math.sqrt(sx * sx + sy * sy + sz * sz)
+    if norm >= 1e-10:
+        sx /= norm
+        sy /= norm
+        sz /= norm
+    
+    # Up = side x forward
+    ux = sy * fz - sz * fy
+    uy = sz * fx - sx * fz
+    uz = sx * fy - sy * fx
+    
+    out[0, 0] = sx
+    out[0, 1] = sy
+    out[0, 2] = sz
+    out[0, 3] = -(sx * eye[0] + sy * eye[1] + sz * eye[2])
+    out[1, 0] = ux
+    out[1, 1] = uy
+    out[1, 2] = uz
+    out[1, 3] = -(ux * eye[0] + uy * eye[1] + uz * eye[2])
+    out[2, 0] = -fx
+    out[2, 1] = -fy
+    out[2, 2] = -fz
+    out[2, 3] = fx * eye[0] + fy * eye[1] + fz * eye[2]
+    out[3, 0] = 0.0
+    out[3, 1] = 0.0
+    out[3, 2] = 0.0
+    out[3, 3] = 1.0
+
+@njit(cache=True, fastmath=True)
+def fill_block(out, template, w, h, d, ox, oy, oz, rx, ry, rz):
+    """
+    Write a scaled, rotated and offset copy of a unit block template
+    
+    Args:
+        out: (N, 8) float32 output rows (position, normal, texcoord)
+        template: (N, 8) unit block vertices in the same layout
+        w, h, d: Per-axis scale
+        ox, oy, oz: Offset added after rotating
+        rx, ry, rz: Rotation angles in radians, combined as Rz * Ry * Rx
+    """
+    rotated = rx != 0.0 or ry != 0.0 or rz != 0.0
+    if rotated:
+        cx, snx = math.cos(rx), math.sin(rx)
+        cy, sny = math.cos(ry), math.sin(ry)
+        cz, snz = math.cos(rz), math.sin(rz)
+        r00 = cz * cy
+        r01 = cz * sny * snx - snz * cx
+        r02 = cz * sny * cx + snz * snx
+        r10 = snz * cy
+        r11 = snz * sny * snx + cz * cx
+        r12 = snz * sny * cx - cz * snx
+        r20 = -sny
+        r21 = cy * snx
+        r22 = cy * cx
+    
+    for i in range(template.shape[0]):
+        x = template[i, 0] * w
+        y = template[i, 1] * h
+        z = template[i, 2] * d
+        nx = template[i, 3]
+        ny = template[i, 4]
+        nz = template[i, 5]
+        if rotated:
+            x, y, z = (r00 * x + r01 * y + r02 * z,
+                       r10 * x + r11 * y + r12 * z,
+                       r20 * x + r21 * y + r22 * z)
+            nx, ny, nz = (r00 * nx + r01 * ny + r02 * nz,
+                          r10 * nx + r11 * ny + r12 * nz,
+                          r20 * nx + r21 * ny + r22 * nz)
+        out[i, 0] = x + ox
+        out[i, 1] = y + oy
+        out[i, 2] = z + oz
+        out[i, 3] = nx
+        out[i, 4] = ny
+        out[i, 5] = nz
+        out[i, 6] = template[i, 6]
+        out[i, 7] = template[i, 7]
+
+@njit(cache=True, fastmath=True)
+def step_angles(current, target, rate):
+    """
+    Move each angle towards its target by at most rate, in place
+    
+    Args:
+        current: 1D float array of angles, updated in place
+        target: 1D float array of target angles
+        rate: Maximum change per call
+        
+    Returns:
+        Number of angles that have not reached their target yet
+    """
+    moving = 0
+    for i in range(current.shape[0]):
+        d = target[i] - current[i]
+        if d > rate:
+            current[i] += rate
+            moving += 1
+        elif d < -rate:
+            current[i] -= rate
+            moving += 1
+        else:
+            current[i] = target[i]
+    return moving
+
+@njit(cache=True, fastmath=True)
+def ray_box_hits(origin, direction, inverse, half, out):
+    """
+    Slab-test a ray against oriented boxes, in each box's local space
+    
+    Args:
+        origin: World-space ray origin (3,)
+        direction: World-space ray direction (3,)
+        inverse: (K, 4, 4) inverse model matrices of the boxes
+        half: (K, 3) half extents of the boxes
+        out: (K,) output buffer, set to the distance along the ray at which
+            each box is entered (0 if the origin is inside), or -1 for a miss
+    """
+    for k in range(inverse.shape[0]):
+        m = inverse[k]
+        t_near = 0.0
+        t_far = 1e30
+        hit = True
+        for a in range(3):
+            o = m[a, 0] * origin[0] + m[a, 1] * origin[1] + m[a, 2] * origin[2] + m[a, 3]
+            d = m[a, 0] * direction[0] + m[a, 1] * direction[1] + m[a, 2] * direction[2]
+            h = half[k, a]
+            if abs(d) < 1e-12:
+                # Parallel to this slab: always or never inside it
+                if abs(o) > h:
+                    hit = False
+                    break
+            else:
+                t1 = (-h - o) / d
+                t2 = (h - o) / d
+                if t1 > t2:
+                    t1, t2 = t2, t1
+                if t1 > t_near:
+                    t_near = t1
+                if t2 < t_far:
+                    t_far = t2
+                if t_near > t_far:
+                    hit = False
+                    break
+        out[k] = t_near if hit else -1.0
+
+if USE_NUMBA:
+    # Compile once at import so the first rendered frame does not pay for it
+    _warmup = np.eye(4, dtype=np.float32, order="F")
+    _warmup_vec = np.zeros(3, dtype=np.float32)
+    fill_trs(_warmup, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 1.0, 1.0, 1.0)
+    fill_axis_trs(_warmup, 0.0, 0.0, 0.0, 0.0, 1.0, 0.0, 0.0, 1.0, 1.0, 1.0)
+    fill_lookat(_warmup, _warmup_vec, _warmup_vec, _warmup_vec)
+    _warmup_block = np.zeros((1, 8))
+    fill_block(np.empty((1, 8), dtype=np.float32), _warmup_block,
+               1.0, 1.0, 1.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0)
+    _warmup_states = np.zeros((1, 2))
+    step_angles(_warmup_states[:, 0], _warmup_states[:, 1], 1.0)
+    _warmup_boxes = np.identity(4).reshape(1, 4, 4)
+    ray_box_hits(np.zeros(3), np.ones(3), _warmup_boxes, np.ones((1, 3)), np.empty(1))
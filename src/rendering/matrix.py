@@ -1,5 +1,7 @@
 import numpy as np
 import math
+from functools import lru_cache
+from src.rendering._fastmath import fill_axis_trs
 
 def vec3(x, y=None, z=None):
     """Create a 3D vector"""
@@ -9,12 +11,27 @@ def vec3(x, y=None, z=None):
         return np.array([x, x, x], dtype=np.float32)
     return np.array([x, y, z], dtype=np.float32)
 
-def normalize(vector):
-    """Normalize a vector"""
-    norm = np.linalg.norm(vector)
+def _unit(x, y, z):
+    """Scale (x, y, z) to unit length as floats; None if it has no length"""
+    norm = math.sqrt(x * x + y * y + z * z)
     if norm < 1e-10:  # Avoid division by zero
+        return None
+    inv = 1.0 / norm
+    return x * inv, y * inv, z * inv
+
+def normalize(vector):
+    """Normalize a 3D vector (returned unchanged if it has no length)"""
+    unit = _unit(float(vector[0]), float(vector[1]), float(vector[2]))
+    if unit is None:
         return vector
-    return vector / norm
+    return np.array(unit, dtype=np.float32)
+
+def normalize_inplace(vector):
+    """Normalize a 3D float array in place (left unchanged if it has no length)"""
+    unit = _unit(float(vector[0]), float(vector[1]), float(vector[2]))
+    if unit is not None:
+        vector[0], vector[1], vector[2] = unit
+    return vector
 
 def cross(v1, v2):
     """Cross product of two vectors"""
@@ -33,43 +50,93 @@ def distance(v1, v2):
     return np.linalg.norm(v1 - v2)
 
 def mat4(value=None):
-    """Create a 4x4 matrix"""
+    """Create a 4x4 matrix, stored column-major (see value_ptr)"""
     if value is None or value == 1.0:
-        return np.identity(4, dtype=np.float32)
+        return np.eye(4, dtype=np.float32, order="F")
     return np.array([[value, 0, 0, 0],
                      [0, value, 0, 0],
                      [0, 0, value, 0],
-                     [0, 0, 0, value]], dtype=np.float32)
+                     [0, 0, 0, value]], dtype=np.float32, order="F")
+
+def mat4_stack(count):
+    """
+    Create a stack of 4x4 matrices, each stored column-major
+    
+    Args:
+        count: Number of matrices
+        
+    Returns:
+        (count, 4, 4) float32 array of zero matrices with a 1 in the corner
+    """
+    # Transposed view of a C-ordered buffer: stack[i] is Fortran-contiguous
+    stack = np.zeros((count, 4, 4), dtype=np.float32).transpose(0, 2, 1)
+    stack[:, 3, 3] = 1.0
+    return stack
 
 def translate(matrix, vec):
     """Translate a matrix by a vector"""
     result = matrix.copy()
-    result[0, 3] = matrix[0, 0] * vec[0] + matrix[0, 1] * vec[1] + matrix[0, 2] * vec[2] + matrix[0, 3]
-    result[1, 3] = matrix[1, 0] * vec[0] + matrix[1, 1] * vec[1] + matrix[1, 2] * vec[2] + matrix[1, 3]
-    result[2, 3] = matrix[2, 0] * vec[0] + matrix[2, 1] * vec[1] + matrix[2, 2] * vec[2] + matrix[2, 3]
-    result[3, 3] = matrix[3, 0] * vec[0] + matrix[3, 1] * vec[1] + matrix[3, 2] * vec[2] + matrix[3, 3]
+    # Last column += first three columns . vec, as one matrix-vector product
+    result[:, 3] += matrix[:, :3].dot(np.asarray(vec, dtype=np.float32)[:3])
+    return result
+
+@lru_cache(maxsize=64)
+def _cos_sin(angle):
+    """Get (cos, sin) of an angle in radians, cached for the few step angles input uses"""
+    return math.cos(angle), math.sin(angle)
+
+def _rotate_columns(matrix, angle, i, j):
+    """Rotate column pair (i, j) of a matrix: the product with a principal-axis rotation"""
+    c, s = _cos_sin(angle)
+    col_i = matrix[:, i]
+    col_j = matrix[:, j]
+    result = matrix.copy(order="K")
+    result[:, i] = col_i * c - col_j * s
+    result[:, j] = col_j * c + col_i * s
     return result
 
+def rotate_x(matrix, angle):
+    """Rotate a matrix around the X axis by angle radians"""
+    return _rotate_columns(matrix, angle, 1, 2)
+
+def rotate_y(matrix, angle):
+    """Rotate a matrix around the Y axis by angle radians"""
+    return _rotate_columns(matrix, angle, 2, 0)
+
+def rotate_z(matrix, angle):
+    """Rotate a matrix around the Z axis by angle radians"""
+    return _rotate_columns(matrix, angle, 0, 1)
+
 def rotate(matrix, angle, axis):
-    """Rotate a matrix around an axis by angle radians"""
-    c = math.cos(angle)
-    s = math.sin(angle)
-    axis = normalize(axis)
-    temp = np.array([(1 - c) * axis], dtype=np.float32).T
-    
-    rotate_matrix = np.identity(4, dtype=np.float32)
-    rotate_matrix[0, 0] = c + temp[0, 0] * axis[0]
-    rotate_matrix[0, 1] = temp[0, 0] * axis[1] + s * axis[2]
-    rotate_matrix[0, 2] = temp[0, 0] * axis[2] - s * axis[1]
-    rotate_matrix[1, 0] = temp[0, 0] * axis[0] - s * axis[2]
-    rotate_matrix[1, 1] = c + temp[0, 0] * axis[1]
-    rotate_matrix[1, 2] = temp[0, 0] * axis[2] + s * axis[0]
-    rotate_matrix[2, 0] = temp[0, 0] * axis[0] + s * axis[1]
-    rotate_matrix[2, 1] = temp[0, 0] * axis[1] - s * axis[0]
-    rotate_matrix[2, 2] = c + temp[0, 0] * axis[2]
-    
-    # Correct matrix multiplication
-    return np.matmul(matrix, rotate_matrix)
+    """
+    Rotate a matrix around an axis by angle radians
+    
+    Uses the same rotation direction as fill_trs() and batch_trs(), so the
+    result composes with their model matrices.
+    """
+    x, y, z = (float(v) for v in axis)
+    
+    # Principal axes only mix two columns
+    if y == 0.0 and z == 0.0 and x != 0.0:
+        return rotate_x(matrix, angle if x > 0.0 else -angle)
+    if x == 0.0 and z == 0.0 and y != 0.0:
+        return rotate_y(matrix, angle if y > 0.0 else -angle)
+    if x == 0.0 and y == 0.0 and z != 0.0:
+        return rotate_z(matrix, angle if z > 0.0 else -angle)
+    
+    c, s = _cos_sin(angle)
+    x, y, z = _unit(x, y, z) or (x, y, z)
+    
+    # Rodrigues: R = c*I - s*K + (1 - c) * axis axis^T, K the cross-product matrix
+    k = np.array([[0.0, -z, y],
+                  [z, 0.0, -x],
+                  [-y, x, 0.0]])
+    rotation = c * np.identity(3) - s * k + (1.0 - c) * np.outer((x, y, z), (x, y, z))
+    
+    # Only the first three columns change; translation and the last row stay
+    result = matrix.copy(order="K")
+    result[:, :3] = matrix[:, :3].dot(rotation)
+    return result
 
 def scale(matrix, vec):
     """Scale a matrix by a vector"""
@@ -79,6 +146,67 @@ def scale(matrix, vec):
     result[2, 2] *= vec[2]
     return result
 
+def trs(translation, axis, angle, scale_vec, out=None):
+    """
+    Build a Translation * Rotation * Scale matrix without intermediates
+    
+    Args:
+        translation: Translation (x, y, z)
+        axis: Rotation axis (x, y, z), normalized here
+        angle: Rotation angle in radians (counter-clockwise about the axis)
+        scale_vec: Per-axis scale (x, y, z)
+        out: Optional 4x4 float32 array to write into
+    
+    Returns:
+        4x4 transformation matrix
+    """
+    if out is None:
+        out = np.empty((4, 4), dtype=np.float32, order="F")
+    
+    px, py, pz = translation
+    x, y, z = axis
+    sx, sy, sz = scale_vec
+    fill_axis_trs(out, float(px), float(py), float(pz), float(x), float(y), float(z),
+                  float(angle), float(sx), float(sy), float(sz))
+    return out
+
+def batch_trs(positions, rotations_rad, scales, out=None):
+    """
+    Build Translation * RotX * RotY * RotZ * Scale matrices for many objects at once
+    
+    Args:
+        positions: (N, 3) translations
+        rotations_rad: (N, 3) rotation angles in radians, applied in X, Y, Z order
+        scales: (N, 3) per-axis scales
+        out: Optional (N, 4, 4) float32 array to write into
+    
+    Returns:
+        (N, 4, 4) array of model matrices
+    """
+    if out is None:
+        out = np.zeros((len(positions), 4, 4), dtype=np.float32)
+    
+    cos = np.cos(rotations_rad)
+    sin = np.sin(rotations_rad)
+    cx, cy, cz = cos[:, 0], cos[:, 1], cos[:, 2]
+    sx, sy, sz = sin[:, 0], sin[:, 1], sin[:, 2]
+    scale_x, scale_y, scale_z = scales[:, 0], scales[:, 1], scales[:, 2]
+    
+    out[:, 0, 0] = cy * cz * scale_x
+    out[:, 0, 1] = cy * sz * scale_y
+    out[:, 0, 2] = -sy * scale_z
+    out[:, 1, 0] = (sx * sy * cz - cx * sz) * scale_x
+    out[:, 1, 1] = (sx * sy * sz + cx * cz) * scale_y
+    out[:, 1, 2] = sx * cy * scale_z
+    out[:, 2, 0] = (cx * sy * cz + sx * sz) * scale_x
+    out[:, 2, 1] = (cx * sy * sz - sx * cz) * scale_y
+    out[:, 2, 2] = cx * cy * scale_z
+    out[:, :3, 3] = positions
+    out[:, 3, :3] = 0.0
+    out[:, 3, 3] = 1.0
+    
+    return out
+
 def lookAt(eye, center, up):
     """
     Create a view matrix looking from eye to center with up vector
@@ -91,29 +219,40 @@ def lookAt(eye, center, up):
     Returns:
         4x4 view matrix
     """
-    eye = np.asarray(eye, dtype=np.float32)
-    center = np.asarray(center, dtype=np.float32)
-    up = np.asarray(up, dtype=np.float32)
-    
-    f = normalize(center - eye)
-    s = normalize(np.cross(f, up))
-    u = np.cross(s, f)
-    
-    result = np.identity(4, dtype=np.float32)
-    result[0, 0] = s[0]
-    result[0, 1] = s[1]
-    result[0, 2] = s[2]
-    result[1, 0] = u[0]
-    result[1, 1] = u[1]
-    result[1, 2] = u[2]
-    result[2, 0] = -f[0]
-    result[2, 1] = -f[1]
-    result[2, 2] = -f[2]
-    result[0, 3] = -np.dot(s, eye)
-    result[1, 3] = -np.dot(u, eye)
-    result[2, 3] = np.dot(f, eye)
+    ex, ey, ez = float(eye[0]), float(eye[1]), float(eye[2])
+    ux, uy, uz = float(up[0]), float(up[1]), float(up[2])
     
-    return result
+    # Forward (left unscaled if degenerate, as normalize() does)
+    fx = float(center[0]) - ex
+    fy = float(center[1]) - ey
+    fz = float(center[2]) - ez
+    norm = math.sqrt(fx * fx + fy * fy + fz * fz)
+    if norm >= 1e-10:
+        fx /= norm
+        fy /= norm
+        fz /= norm
+    
+    # Side = forward x up
+    sx = fy * uz - fz * uy
+    sy = fz * ux - fx * uz
+    sz = fx * uy - fy * ux
+    norm = math.sqrt(sx * sx + sy * sy + sz * sz)
+    if norm >= 1e-10:
+        sx /= norm
+        sy /= norm
+        sz /= norm
+    
+    # Up = side x forward
+    ux = sy * fz - sz * fy
+    uy = sz * fx - sx * fz
+    uz = sx * fy - sy * fx
+    
+    return np.array([
+        [sx, sy, sz, -(sx * ex + sy * ey + sz * ez)],
+        [ux, uy, uz, -(ux * ex + uy * ey + uz * ez)],
+        [-fx, -fy, -fz, fx * ex + fy * ey + fz * ez],
+        [0.0, 0.0, 0.0, 1.0],
+    ], dtype=np.float32, order="F")
 
 def perspective(fov, aspect, near, far):
     """
@@ -130,7 +269,7 @@ def perspective(fov, aspect, near, far):
     """
     f = 1.0 / math.tan(fov / 2)
     
-    result = np.zeros((4, 4), dtype=np.float32)
+    result = np.zeros((4, 4), dtype=np.float32, order="F")
     result[0, 0] = f / aspect
     result[1, 1] = f
     result[2, 2] = (far + near) / (near - far)
@@ -143,11 +282,18 @@ def value_ptr(matrix):
     """
     Convert a matrix to a format suitable for OpenGL uniforms
     
+    Matrices built by this module are already stored column-major, so
+    their transpose is a C-contiguous view of the same memory and no copy
+    is made. Other matrices are copied into column-major order.
+    
     Args:
         matrix: Numpy matrix
         
     Returns:
-        Flattened matrix in column-major order (OpenGL format)
+        Matrix data in column-major order (OpenGL format)
     """
     # OpenGL expects column-major order (Fortran order in numpy)
-    return np.ascontiguousarray(matrix.T, dtype=np.float32) 
\ No newline at end of file
+    transposed = matrix.T
+    if transposed.flags.c_contiguous and transposed.dtype == np.float32:
+        return transposed
+    return np.ascontiguousarray(transposed, dtype=np.float32) 
\ No newline at end of file
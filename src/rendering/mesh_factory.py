@@ -3,6 +3,9 @@ import OpenGL
 from OpenGL import GL as gl
 import math
 import ctypes
+import logging
+
+from src.rendering._fastmath import fill_block
 
 from src.rendering.mesh_factory_utils import (
     create_floor_vertices, create_walls_vertices, create_ceiling_vertices,
@@ -10,13 +13,106 @@ from src.rendering.mesh_factory_utils import (
     create_chair_vertices, create_table_vertices, create_sofa_vertices, create_bed_vertices
 )
 
+# Faces of a block as (normal, quad corners); each quad is drawn as two
+# triangles (0, 1, 2) and (0, 2, 3) with the matching _QUAD_UV coordinates
+_BLOCK_FACES = (
+    ((0, 0, 1), ((-1, -1, 1), (1, -1, 1), (1, 1, 1), (-1, 1, 1))),          # Front (+Z)
+    ((0, 0, -1), ((1, -1, -1), (-1, -1, -1), (-1, 1, -1), (1, 1, -1))),     # Back (-Z)
+    ((1, 0, 0), ((1, -1, 1), (1, -1, -1), (1, 1, -1), (1, 1, 1))),          # Right (+X)
+    ((-1, 0, 0), ((-1, -1, -1), (-1, -1, 1), (-1, 1, 1), (-1, 1, -1))),     # Left (-X)
+    ((0, 1, 0), ((-1, 1, 1), (1, 1, 1), (1, 1, -1), (-1, 1, -1))),          # Top (+Y)
+    ((0, -1, 0), ((-1, -1, -1), (1, -1, -1), (1, -1, 1), (-1, -1, 1))),     # Bottom (-Y)
+)
+_QUAD_UV = ((0, 0), (1, 0), (1, 1), (0, 1))
+_QUAD_TRIANGLES = (0, 1, 2, 0, 2, 3)
+
+def _build_unit_block():
+    """Build the 36 vertices (position, normal, texcoord) of a centered unit cube"""
+    return np.array([
+        (*(0.5 * c for c in quad[k]), *normal, *_QUAD_UV[k])
+        for normal, quad in _BLOCK_FACES
+        for k in _QUAD_TRIANGLES
+    ], dtype=np.float64)
+
+# Unit block template, scaled/rotated/offset by fill_block() for each block
+_UNIT_BLOCK = _build_unit_block()
+
+# Angle of the side sections of a bay window, with its cosine and sine
+_BAY_ANGLE = math.radians(45)
+_BAY_COS = math.cos(_BAY_ANGLE)
+_BAY_SIN = math.sin(_BAY_ANGLE)
+
+# Mesh creation messages; formatted only when DEBUG logging is enabled
+log = logging.getLogger(__name__)
+
+# GPU vertex layout: float32 position, normalized int8 normal (padded to
+# 4 bytes) and half-float texcoord, 20 bytes instead of 8 float32s
+_PACKED_VERTEX = np.dtype([
+    ("position", np.float32, 3),
+    ("normal", np.int8, 4),
+    ("texcoord", np.float16, 2),
+])
+_PACKED_STRIDE = _PACKED_VERTEX.itemsize
+_PACKED_NORMAL_OFFSET = ctypes.c_void_p(_PACKED_VERTEX.fields["normal"][1])
+_PACKED_TEXCOORD_OFFSET = ctypes.c_void_p(_PACKED_VERTEX.fields["texcoord"][1])
+
+def _pack_vertices(vertices):
+    """
+    Convert (position, normal, texcoord) float rows to the packed GPU layout
+    
+    Args:
+        vertices: Flat or (N, 8) vertex data
+        
+    Returns:
+        numpy.ndarray: (N,) array of _PACKED_VERTEX records
+    """
+    rows = np.asarray(vertices, dtype=np.float32).reshape(-1, 8)
+    packed = np.zeros(len(rows), dtype=_PACKED_VERTEX)
+    packed["position"] = rows[:, 0:3]
+    np.rint(np.clip(rows[:, 3:6], -1.0, 1.0) * 127.0, out=packed["normal"][:, 0:3], casting="unsafe")
+    packed["texcoord"] = rows[:, 6:8]
+    return packed
+
+class _BlockBuffer:
+    """
+    Preallocated float32 vertex storage filled one 36-vertex block at a time
+    """
+    __slots__ = ("data", "count")
+    
+    def __init__(self, blocks):
+        """
+        Initialize the buffer
+        
+        Args:
+            blocks: Number of blocks to allocate up front (grows as needed)
+        """
+        self.data = np.empty((max(1, blocks) * 36, 8), dtype=np.float32)
+        self.count = 0
+    
+    def next_block(self):
+        """Reserve the rows of the next block and return them as a view"""
+        start = self.count
+        if start + 36 > len(self.data):
+            data = np.empty((2 * len(self.data), 8), dtype=np.float32)
+            data[:start] = self.data[:start]
+            self.data = data
+        self.count = start + 36
+        return self.data[start:self.count]
+    
+    def vertices(self):
+        """Get the filled rows as a contiguous (N, 8) array"""
+        return self.data[:self.count]
+
 class MeshFactory:
     """
     Factory for creating 3D object meshes
     """
     def __init__(self):
         # Texture loading will be added later
-        pass
+        
+        # Whether immutable buffer storage (GL 4.4) is available; probed on the
+        # first upload, when a GL context is guaranteed to be current
+        self._use_buffer_storage = None
     
     def create_room_mesh(self, width, length, height):
         """
@@ -43,10 +139,9 @@ class MeshFactory:
         # Create ceiling vertices
         ceiling_vertices = create_ceiling_vertices(half_width, half_length, height)
         
-        # Create VAOs and VBOs
-        floor_vao, floor_vbo = self._create_vao_vbo(floor_vertices)
-        walls_vao, walls_vbo = self._create_vao_vbo(walls_vertices)
-        ceiling_vao, ceiling_vbo = self._create_vao_vbo(ceiling_vertices)
+        # Create VAOs and VBOs (one glGen* call each for all three surfaces)
+        (floor_vao, floor_vbo), (walls_vao, walls_vbo), (ceiling_vao, ceiling_vbo) = \
+            self.create_meshes([floor_vertices, walls_vertices, ceiling_vertices])
         
         # Main surface vertices count (each surface has 6 vertices for the main area)
         floor_main_vertex_count = 6
@@ -91,134 +186,110 @@ class MeshFactory:
         Returns:
             Dictionary with VAO, VBO, and vertex count
         """
-        print(f"Creating door mesh: {door_type}, {width}x{height}")
+        log.debug("Creating door mesh: %s, %sx%s", door_type, width, height)
+        
+        # Unknown types are built as a single door
+        build, blocks = self._DOOR_BUILDERS.get(door_type, self._DEFAULT_DOOR_BUILDER)
         
-        # Create door geometry based on type
-        vertices = []
+        # Create door geometry based on type, written straight into a float32 buffer
+        vertices = _BlockBuffer(blocks)
         
         # Frame width (thickness of the door frame)
         frame_width = 0.05
         
-        # Set normal for proper lighting
-        normal = [0.0, 0.0, 1.0]
-        
-        # Set texture coordinates
-        tex_coords = [0.0, 0.0]  # Default texture coordinates
-        
         # Generate vertices for the door based on its type
-        if door_type == "Single Door":
-            # Door frame - outer rectangle
-            self._create_door_frame(vertices, width, height, thickness, frame_width)
-            
-            # Door panel - inner rectangle
-            panel_width = width - 2 * frame_width
-            panel_height = height - 2 * frame_width
-            panel_offset_x = 0.0
-            panel_offset_y = 0.0
-            panel_offset_z = thickness * 0.1  # Slightly offset to avoid z-fighting
-            
-            # Create panel vertices
-            self._create_door_panel(vertices, panel_width, panel_height, thickness * 0.8, 
-                                   panel_offset_x, panel_offset_y, panel_offset_z)
-            
-        elif door_type == "Double Door":
-            # Total width is for both doors combined
-            half_width = width / 2.0
-            gap = 0.01  # Small gap between doors
-            
-            # Left door
-            left_width = half_width - gap/2
-            # Left door frame
-            self._create_door_frame(vertices, left_width, height, thickness, frame_width, -half_width/2 + left_width/2, 0, 0)
-            # Left door panel
-            panel_width = left_width - 2 * frame_width
-            panel_height = height - 2 * frame_width
-            panel_offset_x = -half_width/2 + left_width/2
-            self._create_door_panel(vertices, panel_width, panel_height, thickness * 0.8, 
-                                   panel_offset_x, 0, thickness * 0.1)
-            
-            # Right door
-            right_width = half_width - gap/2
-            # Right door frame
-            self._create_door_frame(vertices, right_width, height, thickness, frame_width, half_width/2 - right_width/2, 0, 0)
-            # Right door panel
-            panel_width = right_width - 2 * frame_width
-            panel_height = height - 2 * frame_width
-            panel_offset_x = half_width/2 - right_width/2
-            self._create_door_panel(vertices, panel_width, panel_height, thickness * 0.8, 
-                                   panel_offset_x, 0, thickness * 0.1)
-            
-        elif door_type == "Sliding Door":
-            # Sliding door requires a track
-            track_height = height + 0.1
-            track_width = width + 0.1
-            track_thickness = thickness * 0.5
-            
-            # Create track at the top
-            self._create_block_vertices(vertices, track_width, 0.05, track_thickness, 
-                                       0, height/2 + 0.025, 0)
-            
-            # Door panels (two overlapping panels)
-            panel_width = width * 0.6
-            panel_height = height - 0.05  # Slightly shorter to fit under track
-            
-            # Left panel (in front)
-            self._create_door_frame(vertices, panel_width, panel_height, thickness * 0.6, 
-                                   frame_width, -width/4, -0.025, thickness * 0.1)
-            self._create_door_panel(vertices, panel_width - 2 * frame_width, panel_height - 2 * frame_width, 
-                                   thickness * 0.4, -width/4, -0.025, thickness * 0.2)
-            
-            # Right panel (behind)
-            self._create_door_frame(vertices, panel_width, panel_height, thickness * 0.6, 
-                                   frame_width, width/4, -0.025, -thickness * 0.1)
-            self._create_door_panel(vertices, panel_width - 2 * frame_width, panel_height - 2 * frame_width, 
-                                   thickness * 0.4, width/4, -0.025, -thickness * 0.2)
-        else:  # Default to single door
-            self._create_door_frame(vertices, width, height, thickness, frame_width)
-            panel_width = width - 2 * frame_width
-            panel_height = height - 2 * frame_width
-            self._create_door_panel(vertices, panel_width, panel_height, thickness * 0.8, 0, 0, thickness * 0.1)
-        
-        # Create VAO and VBO
-        vao = gl.glGenVertexArrays(1)
-        gl.glBindVertexArray(vao)
-        
-        vbo = gl.glGenBuffers(1)
-        gl.glBindBuffer(gl.GL_ARRAY_BUFFER, vbo)
-        
-        # Convert vertices to numpy array
-        vertices_array = np.array(vertices, dtype=np.float32)
-        
-        # Upload data to GPU
-        gl.glBufferData(
-            gl.GL_ARRAY_BUFFER, 
-            vertices_array.nbytes, 
-            vertices_array, 
-            gl.GL_STATIC_DRAW
-        )
-        
-        # Position attribute
-        gl.glVertexAttribPointer(0, 3, gl.GL_FLOAT, gl.GL_FALSE, 8 * 4, None)
-        gl.glEnableVertexAttribArray(0)
-        
-        # Normal attribute
-        gl.glVertexAttribPointer(1, 3, gl.GL_FLOAT, gl.GL_FALSE, 8 * 4, ctypes.c_void_p(3 * 4))
-        gl.glEnableVertexAttribArray(1)
+        build(self, vertices, width, height, thickness, frame_width)
         
-        # Texture attribute
-        gl.glVertexAttribPointer(2, 2, gl.GL_FLOAT, gl.GL_FALSE, 8 * 4, ctypes.c_void_p(6 * 4))
-        gl.glEnableVertexAttribArray(2)
-        
-        # Unbind
-        gl.glBindBuffer(gl.GL_ARRAY_BUFFER, 0)
-        gl.glBindVertexArray(0)
+        # The filled rows, packed for upload by _create_vao_vbo()
+        vertices_array = vertices.vertices()
+        vao, vbo = self._create_vao_vbo(vertices_array)
         
         return {
             "vao": vao,
             "vbo": vbo,
-            "vertex_count": len(vertices) // 8
+            "vertex_count": len(vertices_array)
         }
         
+    def _build_single_door(self, vertices, width, height, thickness, frame_width):
+        """Write a frame and panel for a single door"""
+        # Door frame - outer rectangle
+        self._create_door_frame(vertices, width, height, thickness, frame_width)
+        
+        # Door panel - inner rectangle
+        panel_width = width - 2 * frame_width
+        panel_height = height - 2 * frame_width
+        panel_offset_x = 0.0
+        panel_offset_y = 0.0
+        panel_offset_z = thickness * 0.1  # Slightly offset to avoid z-fighting
+        
+        # Create panel vertices
+        self._create_door_panel(vertices, panel_width, panel_height, thickness * 0.8, 
+                               panel_offset_x, panel_offset_y, panel_offset_z)
+    
+    def _build_double_door(self, vertices, width, height, thickness, frame_width):
+        """Write two side-by-side doors with a small gap between them"""
+        # Total width is for both doors combined
+        half_width = width / 2.0
+        gap = 0.01  # Small gap between doors
+        
+        # Left door
+        left_width = half_width - gap/2
+        # Left door frame
+        self._create_door_frame(vertices, left_width, height, thickness, frame_width, -half_width/2 + left_width/2, 0, 0)
+        # Left door panel
+        panel_width = left_width - 2 * frame_width
+        panel_height = height - 2 * frame_width
+        panel_offset_x = -half_width/2 + left_width/2
+        self._create_door_panel(vertices, panel_width, panel_height, thickness * 0.8, 
+                               panel_offset_x, 0, thickness * 0.1)
+        
+        # Right door
+        right_width = half_width - gap/2
+        # Right door frame
+        self._create_door_frame(vertices, right_width, height, thickness, frame_width, half_width/2 - right_width/2, 0, 0)
+        # Right door panel
+        panel_width = right_width - 2 * frame_width
+        panel_height = height - 2 * frame_width
+        panel_offset_x = half_width/2 - right_width/2
+        self._create_door_panel(vertices, panel_width, panel_height, thickness * 0.8, 
+                               panel_offset_x, 0, thickness * 0.1)
+    
+    def _build_sliding_door(self, vertices, width, height, thickness, frame_width):
+        """Write a top track and two overlapping sliding panels"""
+        # Sliding door requires a track
+        track_height = height + 0.1
+        track_width = width + 0.1
+        track_thickness = thickness * 0.5
+        
+        # Create track at the top
+        self._create_block_vertices(vertices, track_width, 0.05, track_thickness, 
+                                   0, height/2 + 0.025, 0)
+        
+        # Door panels (two overlapping panels)
+        panel_width = width * 0.6
+        panel_height = height - 0.05  # Slightly shorter to fit under track
+        
+        # Left panel (in front)
+        self._create_door_frame(vertices, panel_width, panel_height, thickness * 0.6, 
+                               frame_width, -width/4, -0.025, thickness * 0.1)
+        self._create_door_panel(vertices, panel_width - 2 * frame_width, panel_height - 2 * frame_width, 
+                               thickness * 0.4, -width/4, -0.025, thickness * 0.2)
+        
+        # Right panel (behind)
+        self._create_door_frame(vertices, panel_width, panel_height, thickness * 0.6, 
+                               frame_width, width/4, -0.025, -thickness * 0.1)
+        self._create_door_panel(vertices, panel_width - 2 * frame_width, panel_height - 2 * frame_width, 
+                               thickness * 0.4, width/4, -0.025, -thickness * 0.2)
+    
+    # Door builders with the upper bound of blocks they write, for preallocation
+    # (door panels add their raised detail block only when it fits)
+    _DOOR_BUILDERS = {
+        "Single Door": (_build_single_door, 6),
+        "Double Door": (_build_double_door, 12),
+        "Sliding Door": (_build_sliding_door, 13),
+    }
+    _DEFAULT_DOOR_BUILDER = _DOOR_BUILDERS["Single Door"]
+    
     def _create_door_frame(self, vertices, width, height, thickness, frame_width, offset_x=0, offset_y=0, offset_z=0):
         """Create vertices for a door frame"""
         # Outer rectangle
@@ -317,10 +388,12 @@ class MeshFactory:
         Returns:
             Dictionary with VAOs, VBOs, and vertex counts for frame and glass
         """
-        print(f"Creating window mesh: {window_type}, {width}x{height}")
+        log.debug("Creating window mesh: %s, %sx%s", window_type, width, height)
+        
+        build, blocks = self._WINDOW_BUILDERS.get(window_type, self._DEFAULT_WINDOW_BUILDER)
         
         # Create separate vertices for frame and glass
-        frame_vertices = []
+        frame_vertices = _BlockBuffer(blocks)
         glass_vertices = []
         
         # Frame dimensions
@@ -331,345 +404,366 @@ class MeshFactory:
         wall_offset = 0.02  # Small offset from wall surface
         
         # Create a proper window based on type
-        if window_type == "Single Window":
-            # Create main outer frame
-            outer_frame_depth = frame_thickness * 1.5
-            
-            # Create outer frame (box-like structure)
-            self._create_box_frame(
-                frame_vertices, 
-                width, height, outer_frame_depth,
-                0, 0, -outer_frame_depth/2 + wall_offset
-            )
-            
-            # Create inner frame
-            inner_width = width - frame_width * 2
-            inner_height = height - frame_width * 2
-            
-            # Create window glass
-            glass_inset = frame_thickness * 0.2
-            self._create_glass_pane(
-                glass_vertices, 
-                inner_width - 0.01, inner_height - 0.01, thickness / 4,
-                0, 0, -glass_inset + wall_offset
-            )
-            
-            # Add window sill
-            sill_depth = frame_thickness * 4
-            sill_height = frame_width * 1.2
-            sill_width = width + frame_width * 1.5
-            
-            # Main sill (bottom ledge)
-            self._create_block_vertices(
-                frame_vertices,
-                sill_width,
-                sill_height,
-                sill_depth,
-                0, -height/2 - sill_height/2, -sill_depth/2 + wall_offset
-            )
-            
-            # Top trim
-            trim_height = frame_width * 0.4
-            self._create_block_vertices(
-                frame_vertices,
-                width + frame_width * 0.5,
-                trim_height,
-                frame_thickness * 1.2,
-                0, height/2 + trim_height/2, wall_offset
-            )
-            
-        elif window_type == "Double Window":
-            # Create main outer frame with proper depth
-            outer_frame_depth = frame_thickness * 1.5
-            
-            # Create outer frame (box-like structure)
-            self._create_box_frame(
-                frame_vertices, 
-                width, height, outer_frame_depth,
-                0, 0, -outer_frame_depth/2 + wall_offset
-            )
-            
-            # Calculate dimensions for two window panes
-            inner_width = width - frame_width * 2
-            inner_height = height - frame_width * 2
-            pane_width = inner_width / 2 - frame_width/2
-            
-            # Middle divider
-            self._create_block_vertices(
-                frame_vertices,
-                frame_width,
-                inner_height,
-                frame_thickness * 1.2,
-                0, 0, wall_offset
-            )
-            
-            # Left pane
-            glass_inset = frame_thickness * 0.2
-            self._create_glass_pane(
-                glass_vertices, 
-                pane_width - 0.01, inner_height - 0.01, thickness / 4,
-                -pane_width/2 - frame_width/2, 0, -glass_inset + wall_offset
-            )
-            
-            # Right pane
-            self._create_glass_pane(
-                glass_vertices, 
-                pane_width - 0.01, inner_height - 0.01, thickness / 4,
-                pane_width/2 + frame_width/2, 0, -glass_inset + wall_offset
-            )
-            
-            # Add window handle to right pane
-            handle_size = frame_width * 0.6
-            self._create_block_vertices(
-                frame_vertices,
-                handle_size,
-                handle_size,
-                frame_thickness,
-                pane_width/2 + frame_width/2, 0, frame_thickness * 0.6 + wall_offset
-            )
-            
-            # Add window sill
-            sill_depth = frame_thickness * 4
-            sill_height = frame_width * 1.2
-            sill_width = width + frame_width * 1.5
-            
-            # Main sill (bottom ledge)
-            self._create_block_vertices(
-                frame_vertices,
-                sill_width,
-                sill_height,
-                sill_depth,
-                0, -height/2 - sill_height/2, -sill_depth/2 + wall_offset
-            )
-            
-            # Top trim
-            trim_height = frame_width * 0.4
-            self._create_block_vertices(
-                frame_vertices,
-                width + frame_width * 0.5,
-                trim_height,
-                frame_thickness * 1.2,
-                0, height/2 + trim_height/2, wall_offset
-            )
-        
-        elif window_type == "Bay Window":
-            # Bay window has a center section and angled sides
-            bay_depth = width / 3
-            center_width = width / 2
-            
-            # Create center panel
-            self._create_box_frame(
-                frame_vertices, 
-                center_width, height, frame_thickness * 1.5,
-                0, 0, -bay_depth
-            )
-            
-            # Center glass
-            inner_width = center_width - frame_width * 2
-            inner_height = height - frame_width * 2
-            glass_inset = frame_thickness * 0.2
-            
-            self._create_glass_pane(
-                glass_vertices, 
-                inner_width - 0.01, inner_height - 0.01, thickness / 4,
-                0, 0, -bay_depth - glass_inset
-            )
-            
-            # Side panels (at 45-degree angles)
-            side_width = width / 3
-            angle = math.radians(45)
-            
-            # Left panel
-            offset_x = -(center_width/2 + side_width/2 * math.cos(angle))
-            offset_z = -bay_depth + side_width/2 * math.sin(angle)
-            
-            self._create_box_frame(
-                frame_vertices, 
-                side_width, height, frame_thickness * 1.5,
-                offset_x, 0, offset_z,
-                0, angle, 0
-            )
-            
-            # Left glass
-            inner_side_width = side_width - frame_width * 2
-            self._create_glass_pane(
-                glass_vertices, 
-                inner_side_width - 0.01, inner_height - 0.01, thickness / 4,
-                offset_x, 0, offset_z - glass_inset,
-                0, angle, 0
-            )
-            
-            # Right panel
-            offset_x = (center_width/2 + side_width/2 * math.cos(angle))
-            
-            self._create_box_frame(
-                frame_vertices, 
-                side_width, height, frame_thickness * 1.5,
-                offset_x, 0, offset_z,
-                0, -angle, 0
-            )
-            
-            # Right glass
-            self._create_glass_pane(
-                glass_vertices, 
-                inner_side_width - 0.01, inner_height - 0.01, thickness / 4,
-                offset_x, 0, offset_z - glass_inset,
-                0, -angle, 0
-            )
-            
-            # Add bay window sill (continuous across all sections)
-            sill_depth = frame_thickness * 3
-            sill_height = frame_width * 1.2
-            
-            # Center sill
-            self._create_block_vertices(
-                frame_vertices,
-                center_width + frame_width,
-                sill_height,
-                sill_depth,
-                0, -height/2 - sill_height/2, -bay_depth - sill_depth/2
-            )
-            
-            # Side sills
-            side_sill_width = side_width + frame_width
-            side_sill_depth = sill_depth * 1.2
-            
-            # Left sill
-            self._create_block_vertices(
-                frame_vertices,
-                side_sill_width,
-                sill_height,
-                side_sill_depth,
-                offset_x, -height/2 - sill_height/2, offset_z - side_sill_depth/2,
-                0, angle, 0
-            )
-            
-            # Right sill
-            self._create_block_vertices(
-                frame_vertices,
-                side_sill_width,
-                sill_height,
-                side_sill_depth,
-                offset_x, -height/2 - sill_height/2, offset_z - side_sill_depth/2,
-                0, -angle, 0
-            )
+        build(self, frame_vertices, glass_vertices, width, height, thickness,
+              frame_thickness, frame_width, wall_offset)
         
-        elif window_type == "Sliding Window":
-            # Create main outer frame with proper depth
-            outer_frame_depth = frame_thickness * 1.5
-            
-            # Create outer frame (box-like structure)
-            self._create_box_frame(
-                frame_vertices, 
-                width, height, outer_frame_depth,
-                0, 0, -outer_frame_depth/2 + wall_offset
-            )
-            
-            # Create inner frame dimensions
-            inner_width = width - frame_width * 2
-            inner_height = height - frame_width * 2
-            pane_width = inner_width / 2
-            
-            # Create sliding tracks at top and bottom
-            track_height = frame_width * 0.4
-            track_depth = frame_thickness * 1.2
-            
-            # Top track
-            self._create_block_vertices(
-                frame_vertices,
-                inner_width,
-                track_height,
-                track_depth,
-                0, inner_height/2 - track_height/2, wall_offset
-            )
-            
-            # Bottom track
-            self._create_block_vertices(
-                frame_vertices,
-                inner_width,
-                track_height,
-                track_depth,
-                0, -inner_height/2 + track_height/2, wall_offset
-            )
-            
-            # Left pane (front)
-            glass_inset = frame_thickness * 0.2
-            self._create_glass_pane(
-                glass_vertices, 
-                pane_width - 0.02, inner_height - track_height*2 - 0.02, thickness / 4,
-                -pane_width/4, 0, glass_inset + wall_offset
-            )
-            
-            # Right pane (back)
-            self._create_glass_pane(
-                glass_vertices, 
-                pane_width - 0.02, inner_height - track_height*2 - 0.02, thickness / 4,
-                pane_width/4, 0, -glass_inset + wall_offset
-            )
-            
-            # Add window sill
-            sill_depth = frame_thickness * 4
-            sill_height = frame_width * 1.2
-            sill_width = width + frame_width * 1.5
-            
-            # Main sill (bottom ledge)
-            self._create_block_vertices(
-                frame_vertices,
-                sill_width,
-                sill_height,
-                sill_depth,
-                0, -height/2 - sill_height/2, -sill_depth/2 + wall_offset
-            )
-        
-        else:  # Default to single window if type not recognized
-            # Create outer frame (box-like structure)
-            outer_frame_depth = frame_thickness * 1.5
-            self._create_box_frame(
-                frame_vertices, 
-                width, height, outer_frame_depth,
-                0, 0, -outer_frame_depth/2 + wall_offset
-            )
-            
-            # Create window glass
-            inner_width = width - frame_width * 2
-            inner_height = height - frame_width * 2
-            glass_inset = frame_thickness * 0.2
-            
-            self._create_glass_pane(
-                glass_vertices, 
-                inner_width - 0.01, inner_height - 0.01, thickness / 4,
-                0, 0, -glass_inset + wall_offset
-            )
-            
-            # Add window sill
-            sill_depth = frame_thickness * 4
-            sill_height = frame_width * 1.2
-            sill_width = width + frame_width * 1.5
-            
-            # Main sill (bottom ledge)
-            self._create_block_vertices(
-                frame_vertices,
-                sill_width,
-                sill_height,
-                sill_depth,
-                0, -height/2 - sill_height/2, -sill_depth/2 + wall_offset
-            )
-        
-        # Create VAO and VBO for the frame
-        frame_vao, frame_vbo = self._create_vao_vbo(frame_vertices)
-        
-        # Create VAO and VBO for the glass
-        glass_vao, glass_vbo = self._create_vao_vbo(glass_vertices)
+        # Create VAOs and VBOs for the frame and the glass
+        frame_vertices = frame_vertices.vertices()
+        (frame_vao, frame_vbo), (glass_vao, glass_vbo) = \
+            self.create_meshes([frame_vertices, glass_vertices])
         
         return {
             "frame_vao": frame_vao,
             "frame_vbo": frame_vbo,
-            "frame_vertex_count": len(frame_vertices) // 8,  # 8 floats per vertex
+            "frame_vertex_count": len(frame_vertices),  # One row per vertex
             "glass_vao": glass_vao,
             "glass_vbo": glass_vbo,
             "glass_vertex_count": len(glass_vertices) // 8
         }
     
+    def _build_single_window(self, frame_vertices, glass_vertices, width, height, thickness,
+                             frame_thickness, frame_width, wall_offset):
+        """Write a framed single pane with sill and top trim"""
+        # Create main outer frame
+        outer_frame_depth = frame_thickness * 1.5
+        
+        # Create outer frame (box-like structure)
+        self._create_box_frame(
+            frame_vertices, 
+            width, height, outer_frame_depth,
+            0, 0, -outer_frame_depth/2 + wall_offset
+        )
+        
+        # Create inner frame
+        inner_width = width - frame_width * 2
+        inner_height = height - frame_width * 2
+        
+        # Create window glass
+        glass_inset = frame_thickness * 0.2
+        self._create_glass_pane(
+            glass_vertices, 
+            inner_width - 0.01, inner_height - 0.01, thickness / 4,
+            0, 0, -glass_inset + wall_offset
+        )
+        
+        # Add window sill
+        sill_depth = frame_thickness * 4
+        sill_height = frame_width * 1.2
+        sill_width = width + frame_width * 1.5
+        
+        # Main sill (bottom ledge)
+        self._create_block_vertices(
+            frame_vertices,
+            sill_width,
+            sill_height,
+            sill_depth,
+            0, -height/2 - sill_height/2, -sill_depth/2 + wall_offset
+        )
+        
+        # Top trim
+        trim_height = frame_width * 0.4
+        self._create_block_vertices(
+            frame_vertices,
+            width + frame_width * 0.5,
+            trim_height,
+            frame_thickness * 1.2,
+            0, height/2 + trim_height/2, wall_offset
+        )
+    
+    def _build_double_window(self, frame_vertices, glass_vertices, width, height, thickness,
+                             frame_thickness, frame_width, wall_offset):
+        """Write two panes split by a divider, with handle, sill and top trim"""
+        # Create main outer frame with proper depth
+        outer_frame_depth = frame_thickness * 1.5
+        
+        # Create outer frame (box-like structure)
+        self._create_box_frame(
+            frame_vertices, 
+            width, height, outer_frame_depth,
+            0, 0, -outer_frame_depth/2 + wall_offset
+        )
+        
+        # Calculate dimensions for two window panes
+        inner_width = width - frame_width * 2
+        inner_height = height - frame_width * 2
+        pane_width = inner_width / 2 - frame_width/2
+        
+        # Middle divider
+        self._create_block_vertices(
+            frame_vertices,
+            frame_width,
+            inner_height,
+            frame_thickness * 1.2,
+            0, 0, wall_offset
+        )
+        
+        # Left pane
+        glass_inset = frame_thickness * 0.2
+        self._create_glass_pane(
+            glass_vertices, 
+            pane_width - 0.01, inner_height - 0.01, thickness / 4,
+            -pane_width/2 - frame_width/2, 0, -glass_inset + wall_offset
+        )
+        
+        # Right pane
+        self._create_glass_pane(
+            glass_vertices, 
+            pane_width - 0.01, inner_height - 0.01, thickness / 4,
+            pane_width/2 + frame_width/2, 0, -glass_inset + wall_offset
+        )
+        
+        # Add window handle to right pane
+        handle_size = frame_width * 0.6
+        self._create_block_vertices(
+            frame_vertices,
+            handle_size,
+            handle_size,
+            frame_thickness,
+            pane_width/2 + frame_width/2, 0, frame_thickness * 0.6 + wall_offset
+        )
+        
+        # Add window sill
+        sill_depth = frame_thickness * 4
+        sill_height = frame_width * 1.2
+        sill_width = width + frame_width * 1.5
+        
+        # Main sill (bottom ledge)
+        self._create_block_vertices(
+            frame_vertices,
+            sill_width,
+            sill_height,
+            sill_depth,
+            0, -height/2 - sill_height/2, -sill_depth/2 + wall_offset
+        )
+        
+        # Top trim
+        trim_height = frame_width * 0.4
+        self._create_block_vertices(
+            frame_vertices,
+            width + frame_width * 0.5,
+            trim_height,
+            frame_thickness * 1.2,
+            0, height/2 + trim_height/2, wall_offset
+        )
+    
+    def _build_bay_window(self, frame_vertices, glass_vertices, width, height, thickness,
+                          frame_thickness, frame_width, wall_offset):
+        """Write a recessed center section and two sides angled at 45 degrees"""
+        # Bay window has a center section and angled sides
+        bay_depth = width / 3
+        center_width = width / 2
+        
+        # Create center panel
+        self._create_box_frame(
+            frame_vertices, 
+            center_width, height, frame_thickness * 1.5,
+            0, 0, -bay_depth
+        )
+        
+        # Center glass
+        inner_width = center_width - frame_width * 2
+        inner_height = height - frame_width * 2
+        glass_inset = frame_thickness * 0.2
+        
+        self._create_glass_pane(
+            glass_vertices, 
+            inner_width - 0.01, inner_height - 0.01, thickness / 4,
+            0, 0, -bay_depth - glass_inset
+        )
+        
+        # Side panels (at 45-degree angles)
+        side_width = width / 3
+        angle = _BAY_ANGLE
+        
+        # Left panel
+        offset_x = -(center_width/2 + side_width/2 * _BAY_COS)
+        offset_z = -bay_depth + side_width/2 * _BAY_SIN
+        
+        self._create_box_frame(
+            frame_vertices, 
+            side_width, height, frame_thickness * 1.5,
+            offset_x, 0, offset_z,
+            0, angle, 0
+        )
+        
+        # Left glass
+        inner_side_width = side_width - frame_width * 2
+        self._create_glass_pane(
+            glass_vertices, 
+            inner_side_width - 0.01, inner_height - 0.01, thickness / 4,
+            offset_x, 0, offset_z - glass_inset,
+            0, angle, 0
+        )
+        
+        # Right panel
+        offset_x = (center_width/2 + side_width/2 * _BAY_COS)
+        
+        self._create_box_frame(
+            frame_vertices, 
+            side_width, height, frame_thickness * 1.5,
+            offset_x, 0, offset_z,
+            0, -angle, 0
+        )
+        
+        # Right glass
+        self._create_glass_pane(
+            glass_vertices, 
+            inner_side_width - 0.01, inner_height - 0.01, thickness / 4,
+            offset_x, 0, offset_z - glass_inset,
+            0, -angle, 0
+        )
+        
+        # Add bay window sill (continuous across all sections)
+        sill_depth = frame_thickness * 3
+        sill_height = frame_width * 1.2
+        
+        # Center sill
+        self._create_block_vertices(
+            frame_vertices,
+            center_width + frame_width,
+            sill_height,
+            sill_depth,
+            0, -height/2 - sill_height/2, -bay_depth - sill_depth/2
+        )
+        
+        # Side sills
+        side_sill_width = side_width + frame_width
+        side_sill_depth = sill_depth * 1.2
+        
+        # Left sill
+        self._create_block_vertices(
+            frame_vertices,
+            side_sill_width,
+            sill_height,
+            side_sill_depth,
+            offset_x, -height/2 - sill_height/2, offset_z - side_sill_depth/2,
+            0, angle, 0
+        )
+        
+        # Right sill
+        self._create_block_vertices(
+            frame_vertices,
+            side_sill_width,
+            sill_height,
+            side_sill_depth,
+            offset_x, -height/2 - sill_height/2, offset_z - side_sill_depth/2,
+            0, -angle, 0
+        )
+    
+    def _build_sliding_window(self, frame_vertices, glass_vertices, width, height, thickness,
+                              frame_thickness, frame_width, wall_offset):
+        """Write two offset sliding panes between top and bottom tracks"""
+        # Create main outer frame with proper depth
+        outer_frame_depth = frame_thickness * 1.5
+        
+        # Create outer frame (box-like structure)
+        self._create_box_frame(
+            frame_vertices, 
+            width, height, outer_frame_depth,
+            0, 0, -outer_frame_depth/2 + wall_offset
+        )
+        
+        # Create inner frame dimensions
+        inner_width = width - frame_width * 2
+        inner_height = height - frame_width * 2
+        pane_width = inner_width / 2
+        
+        # Create sliding tracks at top and bottom
+        track_height = frame_width * 0.4
+        track_depth = frame_thickness * 1.2
+        
+        # Top track
+        self._create_block_vertices(
+            frame_vertices,
+            inner_width,
+            track_height,
+            track_depth,
+            0, inner_height/2 - track_height/2, wall_offset
+        )
+        
+        # Bottom track
+        self._create_block_vertices(
+            frame_vertices,
+            inner_width,
+            track_height,
+            track_depth,
+            0, -inner_height/2 + track_height/2, wall_offset
+        )
+        
+        # Left pane (front)
+        glass_inset = frame_thickness * 0.2
+        self._create_glass_pane(
+            glass_vertices, 
+            pane_width - 0.02, inner_height - track_height*2 - 0.02, thickness / 4,
+            -pane_width/4, 0, glass_inset + wall_offset
+        )
+        
+        # Right pane (back)
+        self._create_glass_pane(
+            glass_vertices, 
+            pane_width - 0.02, inner_height - track_height*2 - 0.02, thickness / 4,
+            pane_width/4, 0, -glass_inset + wall_offset
+        )
+        
+        # Add window sill
+        sill_depth = frame_thickness * 4
+        sill_height = frame_width * 1.2
+        sill_width = width + frame_width * 1.5
+        
+        # Main sill (bottom ledge)
+        self._create_block_vertices(
+            frame_vertices,
+            sill_width,
+            sill_height,
+            sill_depth,
+            0, -height/2 - sill_height/2, -sill_depth/2 + wall_offset
+        )
+    
+    def _build_default_window(self, frame_vertices, glass_vertices, width, height, thickness,
+                              frame_thickness, frame_width, wall_offset):
+        """Write a framed single pane with sill, for unrecognized types"""
+        # Create outer frame (box-like structure)
+        outer_frame_depth = frame_thickness * 1.5
+        self._create_box_frame(
+            frame_vertices, 
+            width, height, outer_frame_depth,
+            0, 0, -outer_frame_depth/2 + wall_offset
+        )
+        
+        # Create window glass
+        inner_width = width - frame_width * 2
+        inner_height = height - frame_width * 2
+        glass_inset = frame_thickness * 0.2
+        
+        self._create_glass_pane(
+            glass_vertices, 
+            inner_width - 0.01, inner_height - 0.01, thickness / 4,
+            0, 0, -glass_inset + wall_offset
+        )
+        
+        # Add window sill
+        sill_depth = frame_thickness * 4
+        sill_height = frame_width * 1.2
+        sill_width = width + frame_width * 1.5
+        
+        # Main sill (bottom ledge)
+        self._create_block_vertices(
+            frame_vertices,
+            sill_width,
+            sill_height,
+            sill_depth,
+            0, -height/2 - sill_height/2, -sill_depth/2 + wall_offset
+        )
+    
+    # Window builders with the number of frame blocks they write, for preallocation
+    _WINDOW_BUILDERS = {
+        "Single Window": (_build_single_window, 6),
+        "Double Window": (_build_double_window, 8),
+        "Bay Window": (_build_bay_window, 15),
+        "Sliding Window": (_build_sliding_window, 7),
+    }
+    _DEFAULT_WINDOW_BUILDER = (_build_default_window, 5)
+    
     def create_furniture_mesh(self, furniture_type, width, depth, height):
         """
         Create furniture mesh
@@ -683,8 +777,6 @@ class MeshFactory:
         Returns:
             dict: Dictionary with VAO, VBO and vertex count
         """
-        vertices = []
-        
         # Basic furniture shapes based on type
         if furniture_type in ["Dining Chair", "Office Chair", "Armchair"]:
             # Chair: seat and back
@@ -715,57 +807,87 @@ class MeshFactory:
         return {
             "vao": vao,
             "vbo": vbo,
-            "vertex_count": len(vertices) // 8  # 8 floats per vertex
+            "vertex_count": len(vertices)  # One row per vertex
         }
     
-    def _create_vao_vbo(self, vertices):
+    def create_meshes(self, vertex_arrays):
         """
-        Create VAO and VBO for vertex data
+        Create a VAO and VBO for each of several vertex arrays
+        
+        The object names for all meshes are generated with one
+        glGenVertexArrays and one glGenBuffers call.
         
         Args:
-            vertices: List of vertex data (position, normal, texcoord)
+            vertex_arrays: List of vertex data (position, normal, texcoord)
             
         Returns:
-            tuple: (VAO ID, VBO ID)
+            list: (VAO ID, VBO ID) per vertex array, in the same order
         """
-        # Convert to numpy array
-        vertices = np.array(vertices, dtype=np.float32)
-        
-        # Create VAO and VBO
-        vao = gl.glGenVertexArrays(1)
-        vbo = gl.glGenBuffers(1)
-        
-        # Bind VAO
-        gl.glBindVertexArray(vao)
-        
-        # Bind VBO and upload data
-        gl.glBindBuffer(gl.GL_ARRAY_BUFFER, vbo)
-        gl.glBufferData(gl.GL_ARRAY_BUFFER, vertices.nbytes, vertices, gl.GL_STATIC_DRAW)
-        
-        # Position attribute (3 floats)
-        gl.glVertexAttribPointer(0, 3, gl.GL_FLOAT, gl.GL_FALSE, 8 * 4, None)
-        gl.glEnableVertexAttribArray(0)
-        
-        # Normal attribute (3 floats)
-        gl.glVertexAttribPointer(1, 3, gl.GL_FLOAT, gl.GL_FALSE, 8 * 4, ctypes.c_void_p(3 * 4))
-        gl.glEnableVertexAttribArray(1)
-        
-        # Texture coordinate attribute (2 floats)
-        gl.glVertexAttribPointer(2, 2, gl.GL_FLOAT, gl.GL_FALSE, 8 * 4, ctypes.c_void_p(6 * 4))
-        gl.glEnableVertexAttribArray(2)
+        count = len(vertex_arrays)
+        vaos = (ctypes.c_uint * count)()
+        vbos = (ctypes.c_uint * count)()
+        gl.glGenVertexArrays(count, vaos)
+        gl.glGenBuffers(count, vbos)
+        
+        if self._use_buffer_storage is None:
+            self._use_buffer_storage = bool(getattr(gl, "glBufferStorage", None))
+        
+        meshes = []
+        for i, vertices in enumerate(vertex_arrays):
+            # Uploaded as raw bytes; the attribute pointers describe the records
+            vertices = _pack_vertices(vertices).view(np.uint8)
+            vao = vaos[i]
+            vbo = vbos[i]
+            
+            # Bind VAO
+            gl.glBindVertexArray(vao)
+            
+            # Bind VBO and upload data; meshes are never re-uploaded, so the
+            # buffer can be immutable (zero-sized storage is not allowed)
+            gl.glBindBuffer(gl.GL_ARRAY_BUFFER, vbo)
+            if self._use_buffer_storage and vertices.nbytes:
+                gl.glBufferStorage(gl.GL_ARRAY_BUFFER, vertices.nbytes, vertices, 0)
+            else:
+                gl.glBufferData(gl.GL_ARRAY_BUFFER, vertices.nbytes, vertices, gl.GL_STATIC_DRAW)
+            
+            # Position attribute (3 floats)
+            gl.glVertexAttribPointer(0, 3, gl.GL_FLOAT, gl.GL_FALSE, _PACKED_STRIDE, None)
+            gl.glEnableVertexAttribArray(0)
+            
+            # Normal attribute (3 normalized bytes, read as floats in [-1, 1])
+            gl.glVertexAttribPointer(1, 3, gl.GL_BYTE, gl.GL_TRUE, _PACKED_STRIDE, _PACKED_NORMAL_OFFSET)
+            gl.glEnableVertexAttribArray(1)
+            
+            # Texture coordinate attribute (2 half floats)
+            gl.glVertexAttribPointer(2, 2, gl.GL_HALF_FLOAT, gl.GL_FALSE, _PACKED_STRIDE, _PACKED_TEXCOORD_OFFSET)
+            gl.glEnableVertexAttribArray(2)
+            
+            meshes.append((vao, vbo))
         
         # Unbind
         gl.glBindBuffer(gl.GL_ARRAY_BUFFER, 0)
         gl.glBindVertexArray(0)
         
-        return vao, vbo
+        return meshes
+    
+    def _create_vao_vbo(self, vertices):
+        """
+        Create VAO and VBO for vertex data
+        
+        Args:
+            vertices: List of vertex data (position, normal, texcoord)
+            
+        Returns:
+            tuple: (VAO ID, VBO ID)
+        """
+        return self.create_meshes([vertices])[0]
 
     def _create_block_vertices(self, vertices, width, height, depth, offset_x=0, offset_y=0, offset_z=0, x_rot=0, y_rot=0, z_rot=0):
         """
         Create vertices for a block/box
         
         Args:
-            vertices: List to append vertices to
+            vertices: _BlockBuffer to write the block's 36 vertices into
             width: Block width (X)
             height: Block height (Y)
             depth: Block depth (Z)
@@ -775,177 +897,12 @@ class MeshFactory:
             x_rot: Rotation around x-axis in radians
             y_rot: Rotation around y-axis in radians
             z_rot: Rotation around z-axis in radians
-        """
-        # Half dimensions
-        half_width = width / 2.0
-        half_height = height / 2.0
-        half_depth = depth / 2.0
-        
-        # Define the 8 corners of the block
-        x_min = -half_width
-        x_max = half_width
-        y_min = -half_height
-        y_max = half_height
-        z_min = -half_depth
-        z_max = half_depth
-        
-        # Apply rotation matrix to each position
-        # Using numpy for rotation to simplify the implementation
-        import numpy as np
-        from math import cos, sin
-        
-        # Create rotation matrices
-        def create_rotation_matrix(x_angle, y_angle, z_angle):
-            # X rotation matrix
-            rx = np.array([
-                [1, 0, 0],
-                [0, cos(x_angle), -sin(x_angle)],
-                [0, sin(x_angle), cos(x_angle)]
-            ])
-            
-            # Y rotation matrix
-            ry = np.array([
-                [cos(y_angle), 0, sin(y_angle)],
-                [0, 1, 0],
-                [-sin(y_angle), 0, cos(y_angle)]
-            ])
-            
-            # Z rotation matrix
-            rz = np.array([
-                [cos(z_angle), -sin(z_angle), 0],
-                [sin(z_angle), cos(z_angle), 0],
-                [0, 0, 1]
-            ])
             
-            # Combined rotation matrix: R = Rz * Ry * Rx
-            combined = np.matmul(rz, np.matmul(ry, rx))
-            return combined
-        
-        # Create the rotation matrix
-        rot_matrix = create_rotation_matrix(x_rot, y_rot, z_rot)
-        
-        # Function to rotate a point
-        def rotate_point(point):
-            rotated = np.matmul(rot_matrix, np.array(point))
-            return rotated
-        
-        # Rotate normal vectors as well
-        front_normal = rotate_point([0, 0, 1])
-        back_normal = rotate_point([0, 0, -1])
-        right_normal = rotate_point([1, 0, 0])
-        left_normal = rotate_point([-1, 0, 0])
-        top_normal = rotate_point([0, 1, 0])
-        bottom_normal = rotate_point([0, -1, 0])
-        
-        # Helper function to create a vertex with rotation and offset
-        def create_vertex(x, y, z, normal):
-            # Rotate the position
-            pos = rotate_point([x, y, z])
-            # Add offset
-            pos_x = pos[0] + offset_x
-            pos_y = pos[1] + offset_y
-            pos_z = pos[2] + offset_z
-            # Return vertex data
-            return [pos_x, pos_y, pos_z, normal[0], normal[1], normal[2]]
-        
-        # Define front face vertices (positive Z)
-        # Triangle 1
-        # Position, Normal, Texture
-        v1 = create_vertex(x_min, y_min, z_max, front_normal)
-        v2 = create_vertex(x_max, y_min, z_max, front_normal)
-        v3 = create_vertex(x_max, y_max, z_max, front_normal)
-        vertices.extend(v1 + [0, 0])
-        vertices.extend(v2 + [1, 0])
-        vertices.extend(v3 + [1, 1])
-        # Triangle 2
-        v4 = create_vertex(x_min, y_min, z_max, front_normal)
-        v5 = create_vertex(x_max, y_max, z_max, front_normal)
-        v6 = create_vertex(x_min, y_max, z_max, front_normal)
-        vertices.extend(v4 + [0, 0])
-        vertices.extend(v5 + [1, 1])
-        vertices.extend(v6 + [0, 1])
-        
-        # Define back face vertices (negative Z)
-        # Triangle 1
-        v1 = create_vertex(x_max, y_min, z_min, back_normal)
-        v2 = create_vertex(x_min, y_min, z_min, back_normal)
-        v3 = create_vertex(x_min, y_max, z_min, back_normal)
-        vertices.extend(v1 + [0, 0])
-        vertices.extend(v2 + [1, 0])
-        vertices.extend(v3 + [1, 1])
-        # Triangle 2
-        v4 = create_vertex(x_max, y_min, z_min, back_normal)
-        v5 = create_vertex(x_min, y_max, z_min, back_normal)
-        v6 = create_vertex(x_max, y_max, z_min, back_normal)
-        vertices.extend(v4 + [0, 0])
-        vertices.extend(v5 + [1, 1])
-        vertices.extend(v6 + [0, 1])
-        
-        # Define right face vertices (positive X)
-        # Triangle 1
-        v1 = create_vertex(x_max, y_min, z_max, right_normal)
-        v2 = create_vertex(x_max, y_min, z_min, right_normal)
-        v3 = create_vertex(x_max, y_max, z_min, right_normal)
-        vertices.extend(v1 + [0, 0])
-        vertices.extend(v2 + [1, 0])
-        vertices.extend(v3 + [1, 1])
-        # Triangle 2
-        v4 = create_vertex(x_max, y_min, z_max, right_normal)
-        v5 = create_vertex(x_max, y_max, z_min, right_normal)
-        v6 = create_vertex(x_max, y_max, z_max, right_normal)
-        vertices.extend(v4 + [0, 0])
-        vertices.extend(v5 + [1, 1])
-        vertices.extend(v6 + [0, 1])
-        
-        # Define left face vertices (negative X)
-        # Triangle 1
-        v1 = create_vertex(x_min, y_min, z_min, left_normal)
-        v2 = create_vertex(x_min, y_min, z_max, left_normal)
-        v3 = create_vertex(x_min, y_max, z_max, left_normal)
-        vertices.extend(v1 + [0, 0])
-        vertices.extend(v2 + [1, 0])
-        vertices.extend(v3 + [1, 1])
-        # Triangle 2
-        v4 = create_vertex(x_min, y_min, z_min, left_normal)
-        v5 = create_vertex(x_min, y_max, z_max, left_normal)
-        v6 = create_vertex(x_min, y_max, z_min, left_normal)
-        vertices.extend(v4 + [0, 0])
-        vertices.extend(v5 + [1, 1])
-        vertices.extend(v6 + [0, 1])
-        
-        # Define top face vertices (positive Y)
-        # Triangle 1
-        v1 = create_vertex(x_min, y_max, z_max, top_normal)
-        v2 = create_vertex(x_max, y_max, z_max, top_normal)
-        v3 = create_vertex(x_max, y_max, z_min, top_normal)
-        vertices.extend(v1 + [0, 0])
-        vertices.extend(v2 + [1, 0])
-        vertices.extend(v3 + [1, 1])
-        # Triangle 2
-        v4 = create_vertex(x_min, y_max, z_max, top_normal)
-        v5 = create_vertex(x_max, y_max, z_min, top_normal)
-        v6 = create_vertex(x_min, y_max, z_min, top_normal)
-        vertices.extend(v4 + [0, 0])
-        vertices.extend(v5 + [1, 1])
-        vertices.extend(v6 + [0, 1])
-        
-        # Define bottom face vertices (negative Y)
-        # Triangle 1
-        v1 = create_vertex(x_min, y_min, z_min, bottom_normal)
-        v2 = create_vertex(x_max, y_min, z_min, bottom_normal)
-        v3 = create_vertex(x_max, y_min, z_max, bottom_normal)
-        vertices.extend(v1 + [0, 0])
-        vertices.extend(v2 + [1, 0])
-        vertices.extend(v3 + [1, 1])
-        # Triangle 2
-        v4 = create_vertex(x_min, y_min, z_min, bottom_normal)
-        v5 = create_vertex(x_max, y_min, z_max, bottom_normal)
-        v6 = create_vertex(x_min, y_min, z_max, bottom_normal)
-        vertices.extend(v4 + [0, 0])
-        vertices.extend(v5 + [1, 1])
-        vertices.extend(v6 + [0, 1])
-        
-        # Return the number of vertices added (36 = 6 faces × 2 triangles × 3 vertices)
+        Returns:
+            int: Number of vertices added (36 = 6 faces x 2 triangles x 3 vertices)
+        """
+        fill_block(vertices.next_block(), _UNIT_BLOCK, width, height, depth,
+                   offset_x, offset_y, offset_z, x_rot, y_rot, z_rot)
         return 36
 
     def _create_box_frame(self, vertices, width, height, depth, 
@@ -955,7 +912,7 @@ class MeshFactory:
         Create a box-shaped window frame with hollow center
         
         Args:
-            vertices: List to append vertices to
+            vertices: _BlockBuffer to write the frame blocks into
             width: Frame width
             height: Frame height
             depth: Frame depth
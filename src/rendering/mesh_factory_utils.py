@@ -178,6 +178,75 @@ def create_ceiling_vertices(half_width, half_length, height):
     
     return vertices
 
+# Corners of a box with unit half extents, in the order create_box_vertices() indexes them
+_BOX_CORNERS = (
+    # Front face (Z+)
+    (-1, -1, 1),   # Bottom-left
+    (1, -1, 1),    # Bottom-right
+    (1, 1, 1),     # Top-right
+    (-1, 1, 1),    # Top-left
+    
+    # Back face (Z-)
+    (1, -1, -1),   # Bottom-right
+    (-1, -1, -1),  # Bottom-left
+    (-1, 1, -1),   # Top-left
+    (1, 1, -1),    # Top-right
+)
+
+# Triangles of the box as (corner indices, normal, texture coordinates)
+_BOX_TRIANGLES = (
+    # Front face (Z+)
+    ((0, 1, 2), (0, 0, 1), (0, 0, 1, 0, 1, 1)),
+    ((0, 2, 3), (0, 0, 1), (0, 0, 1, 1, 0, 1)),
+    
+    # Right face (X+)
+    ((1, 4, 7), (1, 0, 0), (0, 0, 1, 0, 1, 1)),
+    ((1, 7, 2), (1, 0, 0), (0, 0, 1, 1, 0, 1)),
+    
+    # Back face (Z-)
+    ((4, 5, 6), (0, 0, -1), (0, 0, 1, 0, 1, 1)),
+    ((4, 6, 7), (0, 0, -1), (0, 0, 1, 1, 0, 1)),
+    
+    # Left face (X-)
+    ((5, 0, 3), (-1, 0, 0), (0, 0, 1, 0, 1, 1)),
+    ((5, 3, 6), (-1, 0, 0), (0, 0, 1, 1, 0, 1)),
+    
+    # Top face (Y+)
+    ((3, 2, 7), (0, 1, 0), (0, 0, 1, 0, 1, 1)),
+    ((3, 7, 6), (0, 1, 0), (0, 0, 1, 1, 0, 1)),
+    
+    # Bottom face (Y-)
+    ((5, 4, 1), (0, -1, 0), (0, 0, 1, 0, 1, 1)),
+    ((5, 1, 0), (0, -1, 0), (0, 0, 1, 1, 0, 1)),
+)
+
+# The 36 vertices (unit position, normal, texcoord) of a box, stamped by create_boxes_vertices()
+_BOX_TEMPLATE = np.array([
+    (*_BOX_CORNERS[index], *normal, texcoords[i * 2], texcoords[i * 2 + 1])
+    for indices, normal, texcoords in _BOX_TRIANGLES
+    for i, index in enumerate(indices)
+], dtype=np.float64)
+
+def create_boxes_vertices(boxes):
+    """
+    Create vertices for several boxes at once
+    
+    Args:
+        boxes: Sequence of (half_width, half_height, half_depth, offset_x, offset_y, offset_z)
+        
+    Returns:
+        numpy.ndarray: (36 * len(boxes), 8) float32 vertex data (position, normal, texcoord)
+    """
+    boxes = np.array(boxes, dtype=np.float64).reshape(-1, 6)
+    vertices = np.empty((len(boxes), 36, 8), dtype=np.float32)
+    
+    # Unit corners scaled by the half extents, then moved by the offsets
+    np.add(_BOX_TEMPLATE[:, 0:3] * boxes[:, None, 0:3], boxes[:, None, 3:6], out=vertices[:, :, 0:3],
+           casting="unsafe")
+    vertices[:, :, 3:8] = _BOX_TEMPLATE[:, 3:8]
+    
+    return vertices.reshape(-1, 8)
+
 def create_box_vertices(half_width, half_height, half_depth, offset_x=0, offset_y=0, offset_z=0):
     """
     Create vertices for a box
@@ -191,69 +260,9 @@ def create_box_vertices(half_width, half_height, half_depth, offset_x=0, offset_
         offset_z: Z position offset
         
     Returns:
-        list: Vertex data (position, normal, texcoord)
+        numpy.ndarray: (36, 8) float32 vertex data (position, normal, texcoord)
     """
-    vertices = []
-    
-    # Define the 8 corners of the box
-    corners = [
-        # Front face (Z+)
-        [-half_width + offset_x, -half_height + offset_y, half_depth + offset_z],  # Bottom-left
-        [half_width + offset_x, -half_height + offset_y, half_depth + offset_z],   # Bottom-right
-        [half_width + offset_x, half_height + offset_y, half_depth + offset_z],    # Top-right
-        [-half_width + offset_x, half_height + offset_y, half_depth + offset_z],   # Top-left
-        
-        # Back face (Z-)
-        [half_width + offset_x, -half_height + offset_y, -half_depth + offset_z],  # Bottom-right
-        [-half_width + offset_x, -half_height + offset_y, -half_depth + offset_z], # Bottom-left
-        [-half_width + offset_x, half_height + offset_y, -half_depth + offset_z],  # Top-left
-        [half_width + offset_x, half_height + offset_y, -half_depth + offset_z]    # Top-right
-    ]
-    
-    # Define the 6 faces of the box (2 triangles each)
-    # Each face: normal vector and texture coordinates
-    faces = [
-        # Front face (Z+)
-        [[0, 1, 2], [0, 0, 1], [0, 0, 1, 0, 1, 1]],
-        [[0, 2, 3], [0, 0, 1], [0, 0, 1, 1, 0, 1]],
-        
-        # Right face (X+)
-        [[1, 4, 7], [1, 0, 0], [0, 0, 1, 0, 1, 1]],
-        [[1, 7, 2], [1, 0, 0], [0, 0, 1, 1, 0, 1]],
-        
-        # Back face (Z-)
-        [[4, 5, 6], [0, 0, -1], [0, 0, 1, 0, 1, 1]],
-        [[4, 6, 7], [0, 0, -1], [0, 0, 1, 1, 0, 1]],
-        
-        # Left face (X-)
-        [[5, 0, 3], [-1, 0, 0], [0, 0, 1, 0, 1, 1]],
-        [[5, 3, 6], [-1, 0, 0], [0, 0, 1, 1, 0, 1]],
-        
-        # Top face (Y+)
-        [[3, 2, 7], [0, 1, 0], [0, 0, 1, 0, 1, 1]],
-        [[3, 7, 6], [0, 1, 0], [0, 0, 1, 1, 0, 1]],
-        
-        # Bottom face (Y-)
-        [[5, 4, 1], [0, -1, 0], [0, 0, 1, 0, 1, 1]],
-        [[5, 1, 0], [0, -1, 0], [0, 0, 1, 1, 0, 1]]
-    ]
-    
-    # Create vertices for each face
-    for face in faces:
-        indices, normal, texcoords = face
-        
-        # Add vertices for this triangle
-        for i, idx in enumerate(indices):
-            # Position
-            vertices.extend(corners[idx])
-            
-            # Normal
-            vertices.extend(normal)
-            
-            # Texture coordinates
-            vertices.extend([texcoords[i*2], texcoords[i*2+1]])
-    
-    return vertices
+    return create_boxes_vertices(((half_width, half_height, half_depth, offset_x, offset_y, offset_z),))
 
 def create_box_frame_vertices(half_width, half_height, half_depth, offset_x=0, offset_y=0, offset_z=0, frame_width=0.05):
     """
@@ -269,31 +278,13 @@ def create_box_frame_vertices(half_width, half_height, half_depth, offset_x=0, o
         frame_width: Width of the frame
         
     Returns:
-        list: Vertex data (position, normal, texcoord)
+        numpy.ndarray: (36, 8) float32 vertex data (position, normal, texcoord)
     """
-    vertices = []
-    
-    # Outer box
-    outer_vertices = create_box_vertices(
+    # The inner faces are not cut out; for simplicity, just use the outer box
+    return create_box_vertices(
         half_width, half_height, half_depth,
         offset_x, offset_y, offset_z
     )
-    
-    # Inner box (smaller)
-    inner_width = half_width - frame_width
-    inner_height = half_height - frame_width
-    inner_depth = half_depth
-    
-    inner_vertices = create_box_vertices(
-        inner_width, inner_height, inner_depth,
-        offset_x, offset_y, offset_z
-    )
-    
-    # We need to keep the outer faces and remove the inner faces
-    # For simplicity, just use the outer box vertices
-    vertices.extend(outer_vertices)
-    
-    return vertices
 
 def create_glass_vertices(half_width, half_height, half_depth, offset_x=0, offset_y=0, offset_z=0):
     """
@@ -308,20 +299,14 @@ def create_glass_vertices(half_width, half_height, half_depth, offset_x=0, offse
         offset_z: Z position offset
         
     Returns:
-        list: Vertex data (position, normal, texcoord)
+        numpy.ndarray: (36, 8) float32 vertex data (position, normal, texcoord)
     """
-    vertices = []
-    
     # For simplicity, just create a very thin box for the glass
     # We make it very thin in the Z dimension
-    glass_vertices = create_box_vertices(
+    return create_box_vertices(
         half_width, half_height, 0.005,  # Very thin
         offset_x, offset_y, offset_z
     )
-    
-    vertices.extend(glass_vertices)
-    
-    return vertices
 
 def create_chair_vertices(width, depth, height):
     """
@@ -333,60 +318,38 @@ def create_chair_vertices(width, depth, height):
         height: Chair height
         
     Returns:
-        list: Vertex data (position, normal, texcoord)
+        numpy.ndarray: (N, 8) float32 vertex data (position, normal, texcoord)
     """
-    vertices = []
-    
     # Chair dimensions
     seat_height = height * 0.4
     back_height = height - seat_height
     leg_width = width * 0.1
     
-    # Chair seat
-    seat_vertices = create_box_vertices(
-        width / 2, seat_height * 0.1, depth / 2,
-        0, seat_height, 0
-    )
-    
-    # Chair back
-    back_vertices = create_box_vertices(
-        width / 2, back_height / 2, depth * 0.1,
-        0, seat_height + back_height / 2, -depth / 2 + depth * 0.1
-    )
-    
-    # Chair legs (4)
-    leg_vertices = []
-    
-    # Front-left leg
-    leg_vertices.extend(create_box_vertices(
-        leg_width / 2, seat_height / 2, leg_width / 2,
-        -width / 2 + leg_width / 2, seat_height / 2 - seat_height * 0.1, depth / 2 - leg_width / 2
-    ))
-    
-    # Front-right leg
-    leg_vertices.extend(create_box_vertices(
-        leg_width / 2, seat_height / 2, leg_width / 2,
-        width / 2 - leg_width / 2, seat_height / 2 - seat_height * 0.1, depth / 2 - leg_width / 2
-    ))
-    
-    # Back-left leg
-    leg_vertices.extend(create_box_vertices(
-        leg_width / 2, seat_height / 2, leg_width / 2,
-        -width / 2 + leg_width / 2, seat_height / 2 - seat_height * 0.1, -depth / 2 + leg_width / 2
-    ))
-    
-    # Back-right leg
-    leg_vertices.extend(create_box_vertices(
-        leg_width / 2, seat_height / 2, leg_width / 2,
-        width / 2 - leg_width / 2, seat_height / 2 - seat_height * 0.1, -depth / 2 + leg_width / 2
+    return create_boxes_vertices((
+        # Chair seat
+        (width / 2, seat_height * 0.1, depth / 2,
+         0, seat_height, 0),
+        
+        # Chair back
+        (width / 2, back_height / 2, depth * 0.1,
+         0, seat_height + back_height / 2, -depth / 2 + depth * 0.1),
+        
+        # Front-left leg
+        (leg_width / 2, seat_height / 2, leg_width / 2,
+         -width / 2 + leg_width / 2, seat_height / 2 - seat_height * 0.1, depth / 2 - leg_width / 2),
+        
+        # Front-right leg
+        (leg_width / 2, seat_height / 2, leg_width / 2,
+         width / 2 - leg_width / 2, seat_height / 2 - seat_height * 0.1, depth / 2 - leg_width / 2),
+        
+        # Back-left leg
+        (leg_width / 2, seat_height / 2, leg_width / 2,
+         -width / 2 + leg_width / 2, seat_height / 2 - seat_height * 0.1, -depth / 2 + leg_width / 2),
+        
+        # Back-right leg
+        (leg_width / 2, seat_height / 2, leg_width / 2,
+         width / 2 - leg_width / 2, seat_height / 2 - seat_height * 0.1, -depth / 2 + leg_width / 2),
     ))
-    
-    # Combine all parts
-    vertices.extend(seat_vertices)
-    vertices.extend(back_vertices)
-    vertices.extend(leg_vertices)
-    
-    return vertices
 
 def create_table_vertices(width, depth, height):
     """
@@ -398,52 +361,34 @@ def create_table_vertices(width, depth, height):
         height: Table height
         
     Returns:
-        list: Vertex data (position, normal, texcoord)
+        numpy.ndarray: (N, 8) float32 vertex data (position, normal, texcoord)
     """
-    vertices = []
-    
     # Table dimensions
     top_thickness = height * 0.05
     leg_width = width * 0.05
+    leg_half_height = (height - top_thickness) / 2
     
-    # Table top
-    top_vertices = create_box_vertices(
-        width / 2, top_thickness / 2, depth / 2,
-        0, height - top_thickness / 2, 0
-    )
-    
-    # Table legs (4)
-    leg_vertices = []
-    
-    # Front-left leg
-    leg_vertices.extend(create_box_vertices(
-        leg_width / 2, (height - top_thickness) / 2, leg_width / 2,
-        -width / 2 + leg_width, (height - top_thickness) / 2, depth / 2 - leg_width
-    ))
-    
-    # Front-right leg
-    leg_vertices.extend(create_box_vertices(
-        leg_width / 2, (height - top_thickness) / 2, leg_width / 2,
-        width / 2 - leg_width, (height - top_thickness) / 2, depth / 2 - leg_width
-    ))
-    
-    # Back-left leg
-    leg_vertices.extend(create_box_vertices(
-        leg_width / 2, (height - top_thickness) / 2, leg_width / 2,
-        -width / 2 + leg_width, (height - top_thickness) / 2, -depth / 2 + leg_width
-    ))
-    
-    # Back-right leg
-    leg_vertices.extend(create_box_vertices(
-        leg_width / 2, (height - top_thickness) / 2, leg_width / 2,
-        width / 2 - leg_width, (height - top_thickness) / 2, -depth / 2 + leg_width
+    return create_boxes_vertices((
+        # Table top
+        (width / 2, top_thickness / 2, depth / 2,
+         0, height - top_thickness / 2, 0),
+        
+        # Front-left leg
+        (leg_width / 2, leg_half_height, leg_width / 2,
+         -width / 2 + leg_width, leg_half_height, depth / 2 - leg_width),
+        
+        # Front-right leg
+        (leg_width / 2, leg_half_height, leg_width / 2,
+         width / 2 - leg_width, leg_half_height, depth / 2 - leg_width),
+        
+        # Back-left leg
+        (leg_width / 2, leg_half_height, leg_width / 2,
+         -width / 2 + leg_width, leg_half_height, -depth / 2 + leg_width),
+        
+        # Back-right leg
+        (leg_width / 2, leg_half_height, leg_width / 2,
+         width / 2 - leg_width, leg_half_height, -depth / 2 + leg_width),
     ))
-    
-    # Combine all parts
-    vertices.extend(top_vertices)
-    vertices.extend(leg_vertices)
-    
-    return vertices
 
 def create_sofa_vertices(width, depth, height, sofa_type):
     """
@@ -456,105 +401,65 @@ def create_sofa_vertices(width, depth, height, sofa_type):
         sofa_type: Type of sofa
         
     Returns:
-        list: Vertex data (position, normal, texcoord)
+        numpy.ndarray: (N, 8) float32 vertex data (position, normal, texcoord)
     """
-    vertices = []
-    
     # Sofa dimensions
     seat_height = height * 0.4
     back_height = height - seat_height
     armrest_width = width * 0.1
+    armrest_half_height = (seat_height + back_height * 0.3) / 2
+    armrest_y = seat_height / 2 + (back_height * 0.3) / 2
     
     if sofa_type == "L-Shaped Sofa":
-        # Create an L-shaped sofa
-        # Main part
+        # Create an L-shaped sofa: main part plus an L part extending to the right
         main_width = width * 0.7
-        
-        # Base
-        base_vertices = create_box_vertices(
-            main_width / 2, seat_height / 2, depth / 2,
-            -width / 2 + main_width / 2, seat_height / 2, 0
-        )
-        
-        # Back
-        back_vertices = create_box_vertices(
-            main_width / 2, back_height / 2, depth * 0.2,
-            -width / 2 + main_width / 2, seat_height + back_height / 2, -depth / 2 + depth * 0.2
-        )
-        
-        # L part (extends to the right)
         l_width = width - main_width
         l_depth = depth * 0.7
         
-        # L base
-        l_base_vertices = create_box_vertices(
-            l_width / 2, seat_height / 2, l_depth / 2,
-            main_width / 2, seat_height / 2, depth / 2 - l_depth / 2
-        )
-        
-        # L back
-        l_back_vertices = create_box_vertices(
-            l_width * 0.2, back_height / 2, l_depth / 2,
-            main_width - l_width * 0.2, seat_height + back_height / 2, depth / 2 - l_depth / 2
-        )
-        
-        # Armrests (2)
-        armrest_vertices = []
-        
-        # Left armrest
-        armrest_vertices.extend(create_box_vertices(
-            armrest_width / 2, (seat_height + back_height * 0.3) / 2, depth / 2,
-            -width / 2 + armrest_width / 2, seat_height / 2 + (back_height * 0.3) / 2, 0
-        ))
-        
-        # Right armrest (on the L part)
-        armrest_vertices.extend(create_box_vertices(
-            armrest_width / 2, (seat_height + back_height * 0.3) / 2, l_depth / 2,
-            width / 2 - armrest_width / 2, seat_height / 2 + (back_height * 0.3) / 2, depth / 2 - l_depth / 2
+        return create_boxes_vertices((
+            # Base
+            (main_width / 2, seat_height / 2, depth / 2,
+             -width / 2 + main_width / 2, seat_height / 2, 0),
+            
+            # Back
+            (main_width / 2, back_height / 2, depth * 0.2,
+             -width / 2 + main_width / 2, seat_height + back_height / 2, -depth / 2 + depth * 0.2),
+            
+            # L base
+            (l_width / 2, seat_height / 2, l_depth / 2,
+             main_width / 2, seat_height / 2, depth / 2 - l_depth / 2),
+            
+            # L back
+            (l_width * 0.2, back_height / 2, l_depth / 2,
+             main_width - l_width * 0.2, seat_height + back_height / 2, depth / 2 - l_depth / 2),
+            
+            # Left armrest
+            (armrest_width / 2, armrest_half_height, depth / 2,
+             -width / 2 + armrest_width / 2, armrest_y, 0),
+            
+            # Right armrest (on the L part)
+            (armrest_width / 2, armrest_half_height, l_depth / 2,
+             width / 2 - armrest_width / 2, armrest_y, depth / 2 - l_depth / 2),
         ))
-        
-        # Combine all parts
-        vertices.extend(base_vertices)
-        vertices.extend(back_vertices)
-        vertices.extend(l_base_vertices)
-        vertices.extend(l_back_vertices)
-        vertices.extend(armrest_vertices)
-        
-    else:
-        # Regular sofas (2-seater or 3-seater)
+    
+    # Regular sofas (2-seater or 3-seater)
+    return create_boxes_vertices((
         # Base
-        base_vertices = create_box_vertices(
-            width / 2, seat_height / 2, depth / 2,
-            0, seat_height / 2, 0
-        )
+        (width / 2, seat_height / 2, depth / 2,
+         0, seat_height / 2, 0),
         
         # Back
-        back_vertices = create_box_vertices(
-            width / 2, back_height / 2, depth * 0.2,
-            0, seat_height + back_height / 2, -depth / 2 + depth * 0.2
-        )
-        
-        # Armrests (2)
-        armrest_vertices = []
+        (width / 2, back_height / 2, depth * 0.2,
+         0, seat_height + back_height / 2, -depth / 2 + depth * 0.2),
         
         # Left armrest
-        armrest_vertices.extend(create_box_vertices(
-            armrest_width / 2, (seat_height + back_height * 0.3) / 2, depth / 2,
-            -width / 2 + armrest_width / 2, seat_height / 2 + (back_height * 0.3) / 2, 0
-        ))
+        (armrest_width / 2, armrest_half_height, depth / 2,
+         -width / 2 + armrest_width / 2, armrest_y, 0),
         
         # Right armrest
-        armrest_vertices.extend(create_box_vertices(
-            armrest_width / 2, (seat_height + back_height * 0.3) / 2, depth / 2,
-            width / 2 - armrest_width / 2, seat_height / 2 + (back_height * 0.3) / 2, 0
-        ))
-        
-        # Combine all parts
-        vertices.extend(base_vertices)
-        vertices.extend(back_vertices)
-        vertices.extend(armrest_vertices)
-    
-    return vertices
+        (armrest_width / 2, armrest_half_height, depth / 2,
+         width / 2 - armrest_width / 2, armrest_y, 0),
+    ))
 
 def create_bed_vertices(width, depth, height):
     """
@@ -566,36 +471,23 @@ def create_bed_vertices(width, depth, height):
         height: Bed height
         
     Returns:
-        list: Vertex data (position, normal, texcoord)
+        numpy.ndarray: (N, 8) float32 vertex data (position, normal, texcoord)
     """
-    vertices = []
-    
     # Bed dimensions
     base_height = height * 0.3
     mattress_height = height - base_height
-    
-    # Bed base
-    base_vertices = create_box_vertices(
-        width / 2, base_height / 2, depth / 2,
-        0, base_height / 2, 0
-    )
-    
-    # Mattress
-    mattress_vertices = create_box_vertices(
-        width / 2 * 0.95, mattress_height / 2, depth / 2 * 0.95,
-        0, base_height + mattress_height / 2, 0
-    )
-    
-    # Headboard
     headboard_height = height * 1.2
-    headboard_vertices = create_box_vertices(
-        width / 2, headboard_height / 2, depth * 0.05,
-        0, headboard_height / 2, -depth / 2 + depth * 0.05
-    )
     
-    # Combine all parts
-    vertices.extend(base_vertices)
-    vertices.extend(mattress_vertices)
-    vertices.extend(headboard_vertices)
-    
-    return vertices 
\ No newline at end of file
+    return create_boxes_vertices((
+        # Bed base
+        (width / 2, base_height / 2, depth / 2,
+         0, base_height / 2, 0),
+        
+        # Mattress
+        (width / 2 * 0.95, mattress_height / 2, depth / 2 * 0.95,
+         0, base_height + mattress_height / 2, 0),
+        
+        # Headboard
+        (width / 2, headboard_height / 2, depth * 0.05,
+         0, headboard_height / 2, -depth / 2 + depth * 0.05),
+    ))
\ No newline at end of file
@@ -1,17 +1,56 @@
+import math
 import numpy as np
 import OpenGL
 from OpenGL import GL as gl
 from OpenGL.GL import shaders
 from OpenGL.GLU import *
-import glm
 
 from src.rendering.shaders import ShaderManager
 from src.rendering.mesh_factory import MeshFactory
-from src.models.room import Room
+from src.models.room import Room, WALL_NORTH, WALL_SOUTH, WALL_EAST, WALL_WEST
 from src.models.door import Door
 from src.models.window import Window
 from src.models.furniture import Furniture
-from src.rendering.matrix import length, vec3, value_ptr
+from src.models.colors import rgba_buffer
+from src.rendering.matrix import length, vec3, value_ptr, trs, mat4
+
+# Wall color table rows in the order the room mesh stores its walls
+_WALL_DRAW_ORDER = (
+    WALL_WEST,   # -X (west/left) wall
+    WALL_EAST,   # +X (east/right) wall
+    WALL_NORTH,  # -Z (north/back) wall
+    WALL_SOUTH,  # +Z (south/front) wall
+)
+
+# Arguments of the door-opening rotation (see render_object)
+_ORIGIN = (0.0, 0.0, 0.0)
+_Y_AXIS = (0.0, 1.0, 0.0)
+_UNIT_SCALE = (1.0, 1.0, 1.0)
+
+# Mesh cache keys: sizes are rounded so that values differing only by float
+# noise (e.g. after a slider drag) share one mesh
+_KEY_DECIMALS = 4
+
+def _room_mesh_key(room):
+    """Get the mesh cache key of a room"""
+    return ("room", round(room.width, _KEY_DECIMALS), round(room.length, _KEY_DECIMALS),
+            round(room.height, _KEY_DECIMALS))
+
+def _door_mesh_key(door):
+    """Get the mesh cache key of a door"""
+    return ("door", door.door_type, round(door.width, _KEY_DECIMALS),
+            round(door.height, _KEY_DECIMALS), round(door.thickness, _KEY_DECIMALS))
+
+def _window_mesh_key(window):
+    """Get the mesh cache key of a window"""
+    return ("window", window.window_type, round(window.width, _KEY_DECIMALS),
+            round(window.height, _KEY_DECIMALS), round(window.thickness, _KEY_DECIMALS),
+            window.segments)
+
+def _furniture_mesh_key(furniture):
+    """Get the mesh cache key of a furniture piece"""
+    return ("furniture", furniture.furniture_type, round(furniture.width, _KEY_DECIMALS),
+            round(furniture.depth, _KEY_DECIMALS), round(furniture.height, _KEY_DECIMALS))
 
 class Renderer:
     """
@@ -46,6 +85,10 @@ class Renderer:
         
         # Dictionary to store mesh VAOs
         self.mesh_cache = {}
+        
+        # Scratch matrices for the door-opening transform
+        self._door_rotation = mat4()
+        self._door_model = mat4()
     
     def setup_gl(self):
         """Set up OpenGL settings"""
@@ -134,8 +177,11 @@ class Renderer:
         view_matrix = self.camera.view_matrix
         projection_matrix = self.camera.projection_matrix
         
+        # Rebuild any out-of-date model matrices in one batched pass
+        self.scene_manager.compute_model_matrices()
+        
         # Get all objects to render
-        all_objects = self.scene_manager.get_all_objects()
+        all_objects = self.scene_manager.iter_all_objects()
         
         # Sort objects: room first, then opaque objects, then transparent objects
         room = None
@@ -190,7 +236,7 @@ class Renderer:
             projection_matrix: Camera projection matrix
         """
         # Ensure the room mesh exists
-        room_key = f"room_{room.width}_{room.length}_{room.height}"
+        room_key = _room_mesh_key(room)
         if room_key not in self.mesh_cache:
             # Create room mesh and add to cache
             self.mesh_cache[room_key] = self.mesh_factory.create_room_mesh(
@@ -222,21 +268,13 @@ class Renderer:
         ceiling_main_count = room_mesh["ceiling_main_vertex_count"]
         ceiling_border_count = room_mesh["ceiling_border_vertex_count"]
         
-        # Define labels for better visual identification (could be displayed in UI)
-        wall_labels = ["West Wall", "East Wall", "North Wall", "South Wall"]
-        
         # Choose colors based on camera position (inside or outside)
         if is_inside:
             # Using interior colors when inside the room
             floor_color = room.interior_floor_color
             ceiling_color = room.interior_ceiling_color
             
-            wall_colors = [
-                (room.interior_west_wall_color, room.wall_opacity, wall_labels[0]),   # -X (west/left) wall
-                (room.interior_east_wall_color, room.wall_opacity, wall_labels[1]),   # +X (east/right) wall
-                (room.interior_north_wall_color, room.wall_opacity, wall_labels[2]),  # -Z (north/back) wall
-                (room.interior_south_wall_color, room.wall_opacity, wall_labels[3]),  # +Z (south/front) wall
-            ]
+            walls = room.interior_wall_colors
             
             # Disable backface culling to see interior faces
             gl.glDisable(gl.GL_CULL_FACE)
@@ -245,30 +283,16 @@ class Renderer:
             floor_color = room.floor_color
             ceiling_color = room.ceiling_color
             
-            wall_colors = [
-                (room.west_wall_color, room.wall_opacity, wall_labels[0]),   # -X (west/left) wall
-                (room.east_wall_color, room.wall_opacity, wall_labels[1]),   # +X (east/right) wall
-                (room.north_wall_color, room.wall_opacity, wall_labels[2]),  # -Z (north/back) wall
-                (room.south_wall_color, room.wall_opacity, wall_labels[3]),  # +Z (south/front) wall
-            ]
+            walls = room.exterior_wall_colors
             
             # Enable backface culling as normal when outside
             gl.glEnable(gl.GL_CULL_FACE)
         
-        # Add wall label positions for identification (could be used for UI tooltips)
-        wall_label_positions = [
-            [-room.width/2 - 0.1, room.height/2, 0],               # West wall (-X)
-            [room.width/2 + 0.1, room.height/2, 0],                # East wall (+X)
-            [0, room.height/2, -room.length/2 - 0.1],              # North wall (-Z)
-            [0, room.height/2, room.length/2 + 0.1],               # South wall (+Z)
-        ]
-        
         # For floor - includes main floor and border
         gl.glBindVertexArray(room_mesh["floor_vao"])
         
         # Draw main floor
-        gl.glUniform4f(self.default_uniforms["color"], 
-                    floor_color[0], floor_color[1], floor_color[2], room.floor_opacity)
+        gl.glUniform4fv(self.default_uniforms["color"], 1, rgba_buffer(floor_color, room.floor_opacity))
         gl.glUniform1i(self.default_uniforms["use_texture"], 0)  # No texture for now
         gl.glDrawArrays(gl.GL_TRIANGLES, 0, floor_main_count)
         
@@ -279,9 +303,12 @@ class Renderer:
         # For walls (draw each wall separately with its own color)
         gl.glBindVertexArray(room_mesh["walls_vao"])
         
-        # Draw each wall with its color
-        for i, (color, opacity, label) in enumerate(wall_colors):
+        # Draw each wall with its color (table rows are already resolved
+        # against the default wall color)
+        opacity = room.wall_opacity
+        for i, wall in enumerate(_WALL_DRAW_ORDER):
             # Main wall
+            color = walls[wall]
             offset = i * walls_main_count_per_wall
             gl.glUniform4f(self.default_uniforms["color"], color[0], color[1], color[2], opacity)
             gl.glDrawArrays(gl.GL_TRIANGLES, offset, walls_main_count_per_wall)
@@ -297,8 +324,7 @@ class Renderer:
         gl.glBindVertexArray(room_mesh["ceiling_vao"])
         
         # Draw main ceiling
-        gl.glUniform4f(self.default_uniforms["color"], 
-                    ceiling_color[0], ceiling_color[1], ceiling_color[2], room.ceiling_opacity)
+        gl.glUniform4fv(self.default_uniforms["color"], 1, rgba_buffer(ceiling_color, room.ceiling_opacity))
         gl.glDrawArrays(gl.GL_TRIANGLES, 0, ceiling_main_count)
         
         # Draw ceiling border
@@ -318,26 +344,25 @@ class Renderer:
             view_matrix: Camera view matrix
             projection_matrix: Camera projection matrix
         """
-        # Create a key for the mesh cache based on object type and dimensions
+        # Mesh cache key from the object type and dimensions
         mesh_key = None
-        color = [1.0, 1.0, 1.0, 1.0]  # Default color
+        color = rgba_buffer((1.0, 1.0, 1.0))  # Default color
         
         if isinstance(obj, Door):
-            # Include thickness in the mesh key for proper distinction
-            mesh_key = f"door_{obj.door_type}_{obj.width}_{obj.height}_{obj.thickness}"
+            mesh_key = _door_mesh_key(obj)
             if mesh_key not in self.mesh_cache:
                 self.mesh_cache[mesh_key] = self.mesh_factory.create_door_mesh(
                     obj.door_type, obj.width, obj.height, obj.thickness
                 )
-            color = obj.color + [1.0]  # Add alpha
+            color = rgba_buffer(obj.color)
             
         elif isinstance(obj, Furniture):
-            mesh_key = f"furniture_{obj.furniture_type}_{obj.width}_{obj.depth}_{obj.height}"
+            mesh_key = _furniture_mesh_key(obj)
             if mesh_key not in self.mesh_cache:
                 self.mesh_cache[mesh_key] = self.mesh_factory.create_furniture_mesh(
                     obj.furniture_type, obj.width, obj.depth, obj.height
                 )
-            color = obj.color + [1.0]  # Add alpha
+            color = rgba_buffer(obj.color)
         
         if mesh_key is None or mesh_key not in self.mesh_cache:
             return  # Skip rendering if no mesh
@@ -366,9 +391,9 @@ class Renderer:
                 
                 # Adjust model matrix based on door type and opening angle
                 if obj.door_type == "Single Door":
-                    # Apply rotation around Y axis
-                    rotation_matrix = glm.rotate(glm.mat4(1.0), glm.radians(open_angle), glm.vec3(0, 1, 0))
-                    model_matrix = model_matrix * rotation_matrix
+                    # Apply rotation around Y axis, composed into reused buffers
+                    trs(_ORIGIN, _Y_AXIS, math.radians(open_angle), _UNIT_SCALE, out=self._door_rotation)
+                    model_matrix = np.matmul(model_matrix, self._door_rotation, out=self._door_model)
                     gl.glUniformMatrix4fv(self.default_uniforms["model"], 1, gl.GL_FALSE, value_ptr(model_matrix))
                     
                 elif obj.door_type == "Double Door":
@@ -382,7 +407,7 @@ class Renderer:
                     pass
         
         # Set material properties
-        gl.glUniform4f(self.default_uniforms["color"], color[0], color[1], color[2], color[3])
+        gl.glUniform4fv(self.default_uniforms["color"], 1, color)
         gl.glUniform1i(self.default_uniforms["use_texture"], 0)  # No texture for now
         
         # Bind the VAO and render
@@ -401,12 +426,12 @@ class Renderer:
             view_matrix: Camera view matrix
             projection_matrix: Camera projection matrix
         """
-        # Create a key for the mesh cache based on object type and dimensions
+        # Mesh cache key from the object type and dimensions
         mesh_key = None
         color = [1.0, 1.0, 1.0, 0.5]  # Default color with transparency
         
         if isinstance(obj, Window):
-            mesh_key = f"window_{obj.window_type}_{obj.width}_{obj.height}"
+            mesh_key = _window_mesh_key(obj)
             if mesh_key not in self.mesh_cache:
                 self.mesh_cache[mesh_key] = self.mesh_factory.create_window_mesh(
                     obj.window_type, obj.width, obj.height, obj.thickness, obj.segments
@@ -419,11 +444,12 @@ class Renderer:
             # Set uniforms
             gl.glUniformMatrix4fv(self.default_uniforms["view"], 1, gl.GL_FALSE, value_ptr(view_matrix))
             gl.glUniformMatrix4fv(self.default_uniforms["projection"], 1, gl.GL_FALSE, value_ptr(projection_matrix))
-            gl.glUniformMatrix4fv(self.default_uniforms["model"], 1, gl.GL_FALSE, value_ptr(obj.get_model_matrix()))
+            # The model matrix is cached on the object; convert it once for both passes
+            model_ptr = value_ptr(obj.get_model_matrix())
+            gl.glUniformMatrix4fv(self.default_uniforms["model"], 1, gl.GL_FALSE, model_ptr)
             
             # Set frame material properties (opaque)
-            frame_color = obj.frame_color
-            gl.glUniform4f(self.default_uniforms["color"], frame_color[0], frame_color[1], frame_color[2], 1.0)
+            gl.glUniform4fv(self.default_uniforms["color"], 1, rgba_buffer(obj.frame_color))
             gl.glUniform1i(self.default_uniforms["use_texture"], 0)  # No texture for now
             
             # Bind the frame VAO and render
@@ -438,7 +464,7 @@ class Renderer:
             # Set uniforms
             gl.glUniformMatrix4fv(self.transparent_uniforms["view"], 1, gl.GL_FALSE, value_ptr(view_matrix))
             gl.glUniformMatrix4fv(self.transparent_uniforms["projection"], 1, gl.GL_FALSE, value_ptr(projection_matrix))
-            gl.glUniformMatrix4fv(self.transparent_uniforms["model"], 1, gl.GL_FALSE, value_ptr(obj.get_model_matrix()))
+            gl.glUniformMatrix4fv(self.transparent_uniforms["model"], 1, gl.GL_FALSE, model_ptr)
             
             # Enhanced glass rendering with better visual properties
             
@@ -553,15 +579,15 @@ class Renderer:
         if isinstance(obj, Room):
             return
             
-        # Create a key for the mesh cache based on object type and dimensions
+        # Mesh cache key from the object type and dimensions
         mesh_key = None
         
         if isinstance(obj, Door):
-            mesh_key = f"door_{obj.door_type}_{obj.width}_{obj.height}_{obj.thickness}"
+            mesh_key = _door_mesh_key(obj)
         elif isinstance(obj, Window):
-            mesh_key = f"window_{obj.window_type}_{obj.width}_{obj.height}"
+            mesh_key = _window_mesh_key(obj)
         elif isinstance(obj, Furniture):
-            mesh_key = f"furniture_{obj.furniture_type}_{obj.width}_{obj.depth}_{obj.height}"
+            mesh_key = _furniture_mesh_key(obj)
         
         if mesh_key is None or mesh_key not in self.mesh_cache:
             return  # Skip rendering if no mesh
@@ -624,31 +650,21 @@ class Renderer:
     
     def cleanup(self):
         """Clean up OpenGL resources"""
-        # Delete all VAOs and VBOs in the mesh cache
+        # Delete all VAOs and VBOs in the mesh cache, one GL call per kind
+        vaos = []
+        vbos = []
         for mesh_data in self.mesh_cache.values():
             if isinstance(mesh_data, dict):
-                # Delete room VAOs and VBOs
-                if "floor_vao" in mesh_data:
-                    gl.glDeleteVertexArrays(1, [mesh_data["floor_vao"]])
-                if "walls_vao" in mesh_data:
-                    gl.glDeleteVertexArrays(1, [mesh_data["walls_vao"]])
-                if "ceiling_vao" in mesh_data:
-                    gl.glDeleteVertexArrays(1, [mesh_data["ceiling_vao"]])
-                
-                # Delete object VAOs
-                if "vao" in mesh_data:
-                    gl.glDeleteVertexArrays(1, [mesh_data["vao"]])
-                
-                # Delete window component VAOs
-                if "frame_vao" in mesh_data:
-                    gl.glDeleteVertexArrays(1, [mesh_data["frame_vao"]])
-                if "glass_vao" in mesh_data:
-                    gl.glDeleteVertexArrays(1, [mesh_data["glass_vao"]])
-                
-                # Delete VBOs
-                for key in mesh_data:
-                    if key.endswith("_vbo"):
-                        gl.glDeleteBuffers(1, [mesh_data[key]])
+                for key, value in mesh_data.items():
+                    if key == "vao" or key.endswith("_vao"):
+                        vaos.append(value)
+                    elif key == "vbo" or key.endswith("_vbo"):
+                        vbos.append(value)
+        
+        if vaos:
+            gl.glDeleteVertexArrays(len(vaos), vaos)
+        if vbos:
+            gl.glDeleteBuffers(len(vbos), vbos)
         
         # Delete shader programs
         if hasattr(self, 'default_shader'):
@@ -62,6 +62,7 @@ class OpenGLFrame(ttk.Frame):
         self.camera = Camera()
         self.camera.position = np.array([0.0, 2.0, 5.0], dtype=np.float32)
         self.camera.target = np.array([0.0, 0.0, 0.0], dtype=np.float32)
+        self.scene_manager.camera = self.camera
         
         # Initialize input handler
         self.input_handler = InputHandler(self.canvas, self.camera, self.scene_manager, None)  # main_window will be set later
@@ -146,8 +147,9 @@ class OpenGLFrame(ttk.Frame):
         if hasattr(self, 'renderer') and self.renderer is not None:
             self.renderer.resize(width, height)
         
-        # Update camera aspect ratio
+        # Update camera aspect ratio and the viewport used for picking
         self.camera.aspect_ratio = width / max(1, height)
+        self.scene_manager.viewport = (width, height)
         
         # Update placeholder position if using placeholder
         if hasattr(self, 'placeholder_label'):
@@ -1,5 +1,7 @@
 import tkinter as tk
 from tkinter import ttk
+from src.models.room import WALL_NORTH, WALL_SOUTH, WALL_EAST, WALL_WEST
+from src.models.colors import hex_to_rgb
 
 class Sidebar(ttk.Frame):
     def __init__(self, parent, main_window):
@@ -878,15 +880,15 @@ class Sidebar(ttk.Frame):
         
         if furniture_type:
             # Get default dimensions for this furniture type
-            dimensions = self.scene_manager._get_furniture_dimensions(furniture_type)
+            width, depth, height = self.scene_manager._get_furniture_dimensions(furniture_type)
             
             # Add furniture to scene with proper dimensions
             category = self.furniture_category_var.get()
             self.scene_manager.add_furniture(
                 furniture_type=furniture_type,
-                width=dimensions["width"],
-                depth=dimensions["depth"],
-                height=dimensions["height"],
+                width=width,
+                depth=depth,
+                height=height,
                 position=None,
                 rotation=None
             )
@@ -1010,6 +1012,9 @@ class Sidebar(ttk.Frame):
         if not room:
             return
             
+        # Remember the room colors for undo
+        old_colors = room.get_color_state()
+        
         # Track if we've modified individual walls
         modified_walls = False
             
@@ -1036,16 +1041,16 @@ class Sidebar(ttk.Frame):
             count = 0
             
             # Average the wall colors that have been explicitly set
-            if room._north_wall_color is not None:
+            if room.has_wall_color(WALL_NORTH):
                 avg_color = [a+b for a,b in zip(avg_color, room.north_wall_color)]
                 count += 1
-            if room._south_wall_color is not None:
+            if room.has_wall_color(WALL_SOUTH):
                 avg_color = [a+b for a,b in zip(avg_color, room.south_wall_color)]
                 count += 1
-            if room._east_wall_color is not None:
+            if room.has_wall_color(WALL_EAST):
                 avg_color = [a+b for a,b in zip(avg_color, room.east_wall_color)]
                 count += 1
-            if room._west_wall_color is not None:
+            if room.has_wall_color(WALL_WEST):
                 avg_color = [a+b for a,b in zip(avg_color, room.west_wall_color)]
                 count += 1
                 
@@ -1054,8 +1059,8 @@ class Sidebar(ttk.Frame):
                 avg_color = [c/count for c in avg_color]
                 room.wall_color = avg_color
                 
-        # Save state for undo
-        self.scene_manager._save_state("Apply exterior surface settings")
+        # Save the change for undo
+        self.scene_manager._record_room_colors(old_colors, "Apply exterior surface settings")
                 
         if hasattr(self.main_window, 'update_status'):
             self.main_window.update_status("Applied exterior surface settings.")
@@ -1064,18 +1069,4 @@ class Sidebar(ttk.Frame):
         """Convert hex color string to RGB array with values 0-1"""
         if isinstance(hex_color, (list, tuple)) and len(hex_color) >= 3:
             return hex_color
-        hex_color = hex_color.lstrip('#')
-        try:
-            if len(hex_color) == 6:
-                r = int(hex_color[0:2], 16) / 255.0
-                g = int(hex_color[2:4], 16) / 255.0
-                b = int(hex_color[4:6], 16) / 255.0
-                return [r, g, b]
-            elif len(hex_color) == 3:
-                r = int(hex_color[0] + hex_color[0], 16) / 255.0
-                g = int(hex_color[1] + hex_color[1], 16) / 255.0
-                b = int(hex_color[2] + hex_color[2], 16) / 255.0
-                return [r, g, b]
-        except:
-            pass
-        return [1.0, 1.0, 1.0] 
\ No newline at end of file
+        return hex_to_rgb(hex_color) 
\ No newline at end of file
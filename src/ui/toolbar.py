@@ -91,7 +91,7 @@ class Toolbar(ttk.Frame):
         
         if filename:
             try:
-                scene_data = self.scene_manager.save_scene()
+                scene_data = self.scene_manager.save_scene(copy=False)
                 
                 with open(filename, 'w') as f:
                     json.dump(scene_data, f, indent=2)
@@ -187,7 +187,7 @@ class Toolbar(ttk.Frame):
             try:
                 if export_format == "json":
                     # Export as JSON (scene data)
-                    scene_data = self.scene_manager.save_scene()
+                    scene_data = self.scene_manager.save_scene(copy=False)
                     
                     # Add metadata
                     scene_data["metadata"] = {
@@ -218,7 +218,7 @@ class Toolbar(ttk.Frame):
                         # Add geometry for each object
                         vertex_offset = 1  # OBJ indices start at 1
                         
-                        for obj in self.scene_manager.get_all_objects():
+                        for obj in self.scene_manager.iter_all_objects():
                             f.write(f"# Object: {obj.name}\n")
                             
                             # Get position and dimensions